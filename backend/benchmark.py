@@ -0,0 +1,480 @@
+#!/usr/bin/env python3
+"""
+Local load-testing and benchmark suite for the Tegalsec API.
+
+Runs server:app in-process (no HTTP socket, no remote preview URL) against a
+local MongoDB, or against an in-memory stand-in with --in-memory (requires the
+optional `mongomock-motor` package; the attempts scenarios are skipped there).
+Seeds synthetic users, challenges, courses
+and attempts, drives concurrent scenarios and reports throughput and
+p50/p95/p99 latency per route. Results are written as JSON so runs can be
+compared across commits with --compare.
+
+    python benchmark.py --users 500 --challenges 60 --concurrency 32
+    python benchmark.py --scenarios leaderboard,attempts --compare old.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import uuid
+from datetime import datetime, timezone
+from time import perf_counter
+
+os.environ.setdefault('MONGO_URL', 'mongodb://localhost:27017')
+# seed() wipes the database, so never inherit the app's DB_NAME (docker-compose sets it)
+os.environ['DB_NAME'] = os.environ.get('BENCH_DB_NAME', 'tegalsec_bench')
+
+import server  # noqa: E402
+
+CATEGORIES = ["phishing", "pretexting", "baiting", "quid_pro_quo", "tailgating", "money_app", "indonesian_case"]
+DIFFICULTIES = ["beginner", "intermediate", "advanced"]
+PRINCIPLES = ["reciprocity", "commitment", "social_proof", "authority", "liking", "scarcity"]
+BENCH_PASSWORD = "bench12345"
+
+
+# ===== IN-PROCESS ASGI CLIENT =====
+async def asgi_request(app, method: str, path: str, json_body=None, token: str = None):
+    """Call the ASGI app directly and return (status, body bytes)"""
+    path, _, query = path.partition("?")
+    body = json.dumps(json_body).encode() if json_body is not None else b""
+    headers = [(b"host", b"benchmark"), (b"content-type", b"application/json")]
+    if token:
+        headers.append((b"authorization", f"Bearer {token}".encode()))
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": headers,
+        "client": ("127.0.0.1", 0),
+        "server": ("benchmark", 80),
+    }
+    request_sent = False
+    disconnected = asyncio.Event()
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    status = None
+    chunks = []
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    try:
+        await app(scope, receive, send)
+    except Exception as e:
+        # A crashing route is a 500 sample, not the end of the run
+        status = 500
+        chunks = [repr(e).encode()]
+    finally:
+        disconnected.set()
+    return status, b"".join(chunks)
+
+
+# ===== SEEDING =====
+def make_challenge(index: int) -> dict:
+    questions = [
+        {
+            "question": f"Pertanyaan {q + 1} untuk skenario {index}",
+            "options": [f"Opsi {o}" for o in range(4)],
+            "correct_answer": random.randrange(4),
+            "explanation": "Penjelasan singkat " * 8
+        }
+        for q in range(random.randint(3, 6))
+    ]
+    return {
+        "id": str(uuid.uuid4()),
+        "title": f"Benchmark Challenge {index}",
+        "category": random.choice(CATEGORIES),
+        "difficulty": random.choice(DIFFICULTIES),
+        "cialdini_principle": random.choice(PRINCIPLES),
+        "challenge_type": "multi_choice",
+        "description": "Skenario sintetis untuk benchmark",
+        "scenario": "Lorem ipsum " * 40,
+        "questions": questions,
+        "points": random.choice([50, 100, 150]),
+        "tips": ["Verifikasi sumber", "Jangan terburu-buru"],
+        "time_limit_seconds": 300,
+        "created_at": datetime.now(timezone.utc).isoformat()
+    }
+
+
+def make_course(index: int) -> dict:
+    return {
+        "id": str(uuid.uuid4()),
+        "title": f"Benchmark Course {index}",
+        "description": "Course sintetis untuk benchmark",
+        "category": random.choice(CATEGORIES),
+        "difficulty": random.choice(DIFFICULTIES),
+        "modules": [
+            {
+                "module_number": m + 1,
+                "title": f"Modul {m + 1}",
+                "description": "Deskripsi modul",
+                "slides": [{"title": f"Slide {s + 1}", "content": "Isi slide " * 60} for s in range(8)]
+            }
+            for m in range(5)
+        ],
+        "quiz_questions": [
+            {"question": f"Quiz {q}", "options": ["A", "B", "C", "D"], "correct_answer": q % 4, "explanation": "..."}
+            for q in range(5)
+        ],
+        "passing_score": 70,
+        "total_duration_minutes": 45,
+        "created_by": "benchmark",
+        "created_at": datetime.now(timezone.utc).isoformat()
+    }
+
+
+async def seed(db, users: int, challenges: int, courses: int, attempts: int) -> dict:
+    print(f"🌱 Seeding {users} users, {challenges} challenges, {courses} courses, {attempts} attempts...")
+    for name in ("users", "challenges", "courses", "challenge_attempts", "course_progress",
+                 "quiz_completions", "minigame_completions", "daily_challenges", "rate_limits",
+                 "stats", "badge_progress", "user_badges", "feedbacks", "certificates", "hints"):
+        await db[name].delete_many({})
+
+    # One bcrypt hash shared by every synthetic user keeps seeding fast
+    password_hash = await server.password_service.hash(BENCH_PASSWORD)
+    user_docs = [
+        {
+            "id": str(uuid.uuid4()),
+            "username": f"bench_{i}",
+            "email": f"bench_{i}@example.com",
+            "password": password_hash,
+            "full_name": f"Bench User {i}",
+            "role": "user",
+            "points": random.randint(0, 2000),
+            "level": "Beginner",
+            "completed_challenges": [],
+            "created_at": datetime.now(timezone.utc).isoformat()
+        }
+        for i in range(users)
+    ]
+    challenge_docs = [make_challenge(i) for i in range(challenges)]
+    course_docs = [make_course(i) for i in range(courses)]
+    attempt_docs = [
+        {
+            "id": str(uuid.uuid4()),
+            "user_id": random.choice(user_docs)['id'],
+            "challenge_id": random.choice(challenge_docs)['id'],
+            "answers": [0, 1, 2],
+            "correct_count": 1,
+            "total_questions": 3,
+            "is_completed": False,
+            "points_earned": 10,
+            "time_taken_seconds": 42,
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        }
+        for _ in range(attempts)
+    ]
+    # insert_many adds an ObjectId _id to the dicts it is given; insert copies so the
+    # returned documents stay JSON-serializable for the scenarios and --serialization
+    for collection, docs in (("users", user_docs), ("challenges", challenge_docs),
+                             ("courses", course_docs), ("challenge_attempts", attempt_docs)):
+        if docs:
+            await db[collection].insert_many([dict(doc) for doc in docs])
+    return {"users": user_docs, "challenges": challenge_docs, "courses": course_docs}
+
+
+# ===== SCENARIOS =====
+# Each scenario returns (route label, method, path, json body, token) for one request.
+def scenario_login(data):
+    user = random.choice(data['users'])
+    return "POST /auth/login", "POST", "/api/auth/login", {"username": user['username'], "password": BENCH_PASSWORD}, None
+
+
+def scenario_attempts(data):
+    user = random.choice(data['users'])
+    challenge = random.choice(data['challenges'])
+    answers = [random.randrange(4) for _ in challenge['questions']]
+    return ("POST /challenges/{id}/attempt", "POST", f"/api/challenges/{challenge['id']}/attempt",
+            {"answers": answers, "time_taken_seconds": random.randint(20, 300)}, user['token'])
+
+
+def scenario_batch_attempts(data):
+    user = random.choice(data['users'])
+    attempts = [
+        {"challenge_id": challenge['id'],
+         "answers": [random.randrange(4) for _ in challenge['questions']],
+         "time_taken_seconds": random.randint(20, 300)}
+        for challenge in random.sample(data['challenges'], min(10, len(data['challenges'])))
+    ]
+    return ("POST /challenges/attempts/batch", "POST", "/api/challenges/attempts/batch",
+            {"attempts": attempts}, user['token'])
+
+
+def scenario_leaderboard(data):
+    if random.random() < 0.5:
+        return "GET /leaderboard", "GET", "/api/leaderboard", None, None
+    user = random.choice(data['users'])
+    return "GET /leaderboard/me", "GET", "/api/leaderboard/me", None, user['token']
+
+
+def scenario_challenges(data):
+    if random.random() < 0.5:
+        return "GET /challenges", "GET", "/api/challenges", None, None
+    challenge = random.choice(data['challenges'])
+    return "GET /challenges/{id}", "GET", f"/api/challenges/{challenge['id']}", None, None
+
+
+def scenario_course_progress(data):
+    user = random.choice(data['users'])
+    course = random.choice(data['courses'])
+    if random.random() < 0.8:
+        return ("POST /courses/{id}/progress", "POST", f"/api/courses/{course['id']}/progress",
+                {"module_number": random.randint(1, 5), "slide_number": random.randint(0, 7)}, user['token'])
+    return "GET /courses/{id}/progress", "GET", f"/api/courses/{course['id']}/progress", None, user['token']
+
+
+def scenario_slide_advance(data):
+    # A handful of learners clicking through slides concurrently: same (user, course)
+    # pairs hit in parallel, which used to race into duplicate progress documents
+    user = random.choice(data['users'][:8])
+    course = random.choice(data['courses'][:2])
+    state = data.setdefault('slide_cursor', {})
+    position = state[(user['id'], course['id'])] = state.get((user['id'], course['id']), -1) + 1
+    module_number = position // 8 % len(course['modules']) + 1
+    return ("POST /courses/{id}/progress (slide advance)", "POST", f"/api/courses/{course['id']}/progress",
+            {"module_number": module_number, "slide_number": position % 8}, user['token'])
+
+
+def scenario_content(data):
+    roll = random.random()
+    course = random.choice(data['courses'])
+    if roll < 0.3:
+        return "GET /courses", "GET", "/api/courses", None, None
+    if roll < 0.5:
+        return "GET /courses/{id}/outline", "GET", f"/api/courses/{course['id']}/outline", None, None
+    if roll < 0.8:
+        module_number = random.randint(1, len(course['modules']))
+        return ("GET /courses/{id}/modules/{n}", "GET",
+                f"/api/courses/{course['id']}/modules/{module_number}", None, None)
+    challenge = random.choice(data['challenges'])
+    return ("GET /challenges/{id}/feedback", "GET", f"/api/challenges/{challenge['id']}/feedback", None, None)
+
+
+SCENARIOS = {
+    "login": scenario_login,
+    "attempts": scenario_attempts,
+    "batch_attempts": scenario_batch_attempts,
+    "leaderboard": scenario_leaderboard,
+    "challenges": scenario_challenges,
+    "course_progress": scenario_course_progress,
+    "content": scenario_content,
+    "slide_advance": scenario_slide_advance,
+}
+
+
+# ===== RUNNER =====
+# mongomock cannot evaluate the $size projection in LEADERBOARD_PROJECTION
+IN_MEMORY_UNSUPPORTED = {"attempts", "batch_attempts"}
+
+
+class UnlimitedRateLimitBackend:
+    """Rate limiter stand-in that allows every hit (the benchmark measures routes, not limits)"""
+
+    async def hit(self, key: str, limit: int, window: int, now: float):
+        return True, 0.0
+
+
+def percentile(sorted_values, pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(pct / 100 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[rank]
+
+
+async def run_scenario(name: str, data: dict, requests: int, concurrency: int) -> dict:
+    build = SCENARIOS[name]
+    latencies = {}
+    statuses = {}
+    remaining = requests
+
+    async def worker():
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            label, method, path, body, token = build(data)
+            start = perf_counter()
+            status, _ = await asgi_request(server.app, method, path, body, token)
+            latencies.setdefault(label, []).append((perf_counter() - start) * 1000)
+            statuses.setdefault(label, {}).setdefault(str(status), 0)
+            statuses[label][str(status)] += 1
+
+    # Login/register limits would otherwise turn most of a login storm into 429s
+    server.rate_limiter = UnlimitedRateLimitBackend()
+    await server.db.rate_limits.delete_many({})
+    started = perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = perf_counter() - started
+
+    routes = {}
+    for label, values in latencies.items():
+        values.sort()
+        routes[label] = {
+            "requests": len(values),
+            "throughput_rps": round(len(values) / elapsed, 1),
+            "p50_ms": round(percentile(values, 50), 2),
+            "p95_ms": round(percentile(values, 95), 2),
+            "p99_ms": round(percentile(values, 99), 2),
+            "max_ms": round(values[-1], 2),
+            "statuses": statuses[label]
+        }
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "elapsed_seconds": round(elapsed, 3),
+        "throughput_rps": round(requests / elapsed, 1),
+        "routes": routes
+    }
+
+
+def serialization_report(data: dict, rounds: int) -> dict:
+    """Encode representative payloads with jsonable_encoder + json vs orjson (ms per response)"""
+    from fastapi.encoders import jsonable_encoder
+    import orjson
+
+    users = [{k: v for k, v in u.items() if k not in ("password", "token")} for u in data['users']]
+    payloads = {
+        "GET /challenges": data['challenges'],
+        "GET /courses": data['courses'],
+        "GET /admin/users": users,
+        "GET /leaderboard": users[:100],
+    }
+    report = {}
+    for label, payload in payloads.items():
+        start = perf_counter()
+        for _ in range(rounds):
+            json.dumps(jsonable_encoder(payload), ensure_ascii=False).encode("utf-8")
+        stdlib_ms = (perf_counter() - start) * 1000 / rounds
+        start = perf_counter()
+        for _ in range(rounds):
+            orjson.dumps(payload)
+        orjson_ms = (perf_counter() - start) * 1000 / rounds
+        report[label] = {
+            "stdlib_ms": round(stdlib_ms, 3),
+            "orjson_ms": round(orjson_ms, 3),
+            "speedup": round(stdlib_ms / orjson_ms, 1) if orjson_ms else None
+        }
+    return report
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def print_report(results: dict, baseline: dict = None):
+    if results.get('serialization'):
+        print("\n=== SERIALIZATION (ms per response) ===")
+        print(f"{'payload':<34}{'stdlib':>10}{'orjson':>10}{'speedup':>9}")
+        for label, row in results['serialization'].items():
+            print(f"{label:<34}{row['stdlib_ms']:>10}{row['orjson_ms']:>10}{row['speedup']:>8}x")
+    for scenario, result in results['scenarios'].items():
+        print(f"\n=== {scenario.upper()} ({result['throughput_rps']} req/s, {result['elapsed_seconds']}s) ===")
+        print(f"{'route':<34}{'req':>7}{'rps':>9}{'p50':>9}{'p95':>9}{'p99':>9}  statuses")
+        for label, route in sorted(result['routes'].items()):
+            line = (f"{label:<34}{route['requests']:>7}{route['throughput_rps']:>9}"
+                    f"{route['p50_ms']:>9}{route['p95_ms']:>9}{route['p99_ms']:>9}  {route['statuses']}")
+            base = (baseline or {}).get('scenarios', {}).get(scenario, {}).get('routes', {}).get(label)
+            if base and base['p95_ms']:
+                change = (route['p95_ms'] - base['p95_ms']) / base['p95_ms'] * 100
+                line += f"  p95 {change:+.1f}% vs {baseline.get('commit', '?')}"
+            print(line)
+
+
+def use_in_memory_db():
+    try:
+        from mongomock_motor import AsyncMongoMockClient
+    except ImportError:
+        sys.exit("--in-memory requires the optional 'mongomock-motor' package")
+    server.client = AsyncMongoMockClient()
+    server.db = server.client[os.environ['DB_NAME']]
+
+
+async def main(args):
+    if args.in_memory:
+        use_in_memory_db()
+    elif not os.environ['DB_NAME'].endswith('_bench') and not args.i_know_this_wipes:
+        sys.exit(f"Refusing to wipe database '{os.environ['DB_NAME']}': BENCH_DB_NAME must end in _bench "
+                 "(or pass --i-know-this-wipes)")
+    db = server.db
+
+    data = await seed(db, args.users, args.challenges, args.courses, args.attempts)
+    for user in data['users']:
+        user['token'] = server.create_access_token({"sub": user['id']})
+
+    await server.app.router.startup()
+    try:
+        results = {
+            "commit": git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "config": {k: v for k, v in vars(args).items() if k not in ("output", "compare")},
+            "scenarios": {}
+        }
+        for name in args.scenarios.split(","):
+            if name not in SCENARIOS:
+                sys.exit(f"Unknown scenario '{name}'. Available: {', '.join(SCENARIOS)}")
+            if args.in_memory and name in IN_MEMORY_UNSUPPORTED:
+                print(f"⏭️  Skipping {name}: not supported by the in-memory database")
+                continue
+            print(f"🚀 Running {name}...")
+            results['scenarios'][name] = await run_scenario(name, data, args.requests, args.concurrency)
+        if args.serialization:
+            results['serialization'] = serialization_report(data, args.serialization)
+    finally:
+        await server.app.router.shutdown()
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    print_report(results, baseline)
+
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\n📄 Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the Tegalsec API in-process")
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--challenges", type=int, default=40)
+    parser.add_argument("--courses", type=int, default=5)
+    parser.add_argument("--attempts", type=int, default=2000)
+    parser.add_argument("--requests", type=int, default=1000, help="requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS))
+    parser.add_argument("--serialization", type=int, default=0, metavar="ROUNDS",
+                        help="also time stdlib vs orjson encoding of large payloads")
+    parser.add_argument("--in-memory", action="store_true", help="use mongomock-motor instead of MongoDB")
+    parser.add_argument("--i-know-this-wipes", action="store_true",
+                        help="allow a BENCH_DB_NAME that does not end in _bench (its collections are emptied)")
+    parser.add_argument("--seed", type=int, default=1337, help="random seed for synthetic data")
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--compare", help="previous results JSON to compare p95 against")
+    args = parser.parse_args()
+    random.seed(args.seed)
+    asyncio.run(main(args))
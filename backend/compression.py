@@ -0,0 +1,168 @@
+import gzip
+import zlib
+
+try:
+    import brotli
+except ImportError:  # optional; gzip is always available
+    brotli = None
+
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/")
+DEFAULT_MINIMUM_SIZE = 1024
+
+
+def supported_encodings() -> tuple:
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate_encoding(accept_encoding: str, supported: tuple = None):
+    """Pick br or gzip from an Accept-Encoding header (honouring q=0), or None"""
+    if not accept_encoding:
+        return None
+    accepted = {}
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip()] = quality
+    wildcard = accepted.get("*", 0.0)
+    for coding in supported or supported_encodings():
+        if accepted.get(coding, wildcard) > 0:
+            return coding
+    return None
+
+
+def compress(data: bytes, encoding: str, gzip_level: int = 6, brotli_quality: int = 5) -> bytes:
+    if encoding == "br":
+        return brotli.compress(data, quality=brotli_quality)
+    return gzip.compress(data, compresslevel=gzip_level, mtime=0)
+
+
+class CompressedBody:
+    """A response body plus its lazily built, cached gzip/brotli variants.
+
+    Cached routes keep one of these next to their snapshot so each encoding is
+    produced once instead of on every hit. The first hit compresses on the event
+    loop, so levels stay moderate (a few ms for the full challenge catalog).
+    """
+
+    __slots__ = ("raw", "minimum_size", "_encoded")
+
+    def __init__(self, raw: bytes, minimum_size: int = DEFAULT_MINIMUM_SIZE):
+        self.raw = raw
+        self.minimum_size = minimum_size
+        self._encoded = {}
+
+    def encoded(self, encoding):
+        """Return (bytes, encoding or None) for the negotiated encoding"""
+        if encoding is None or len(self.raw) < self.minimum_size:
+            return self.raw, None
+        data = self._encoded.get(encoding)
+        if data is None:
+            data = self._encoded[encoding] = compress(self.raw, encoding)
+        return data, encoding
+
+    def __len__(self):
+        return len(self.raw)
+
+
+def _is_compressible(headers: list) -> bool:
+    content_type = b""
+    for name, value in headers:
+        if name == b"content-encoding":
+            return False
+        if name == b"content-type":
+            content_type = value
+    content_type = content_type.decode("latin-1").lower()
+    return any(content_type.startswith(t) for t in COMPRESSIBLE_TYPES)
+
+
+class CompressionMiddleware:
+    """Pure ASGI gzip/brotli negotiation for responses above a size threshold.
+
+    Responses that already carry Content-Encoding (the pre-compressed cached
+    bodies) pass through untouched. Streaming responses are compressed
+    incrementally with gzip so exports still flush batch by batch.
+    """
+
+    def __init__(self, app, minimum_size: int = DEFAULT_MINIMUM_SIZE, gzip_level: int = 6, brotli_quality: int = 4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        accept = ""
+        for name, value in scope["headers"]:
+            if name == b"accept-encoding":
+                accept = value.decode("latin-1")
+                break
+        encoding = negotiate_encoding(accept)
+        stream_gzip = negotiate_encoding(accept, ("gzip",)) is not None
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        streaming = None  # gzip compressobj once we know the body is streamed
+
+        async def send_wrapper(message):
+            nonlocal start_message, streaming
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if streaming is not None and message["type"] == "http.response.body":
+                chunk = streaming.compress(body) + (streaming.flush(zlib.Z_SYNC_FLUSH) if more_body else streaming.flush())
+                await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+                return
+            if message["type"] != "http.response.body" or start_message is None:
+                await send(message)
+                return
+
+            headers = list(start_message.get("headers", []))
+            start, start_message = start_message, None
+            if not _is_compressible(headers) or start["status"] < 200 or start["status"] in (204, 304):
+                await send(start)
+                await send(message)
+                return
+
+            if more_body:
+                if not stream_gzip:
+                    await send(start)
+                    await send(message)
+                    return
+                # Unknown length: stream gzip (brotli's streaming API is not stdlib)
+                streaming = zlib.compressobj(self.gzip_level, zlib.DEFLATED, 31)
+                headers = [(k, v) for k, v in headers if k != b"content-length"]
+                headers += [(b"content-encoding", b"gzip"), (b"vary", b"Accept-Encoding")]
+                await send({**start, "headers": headers})
+                chunk = streaming.compress(body) + streaming.flush(zlib.Z_SYNC_FLUSH)
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+                return
+
+            if len(body) < self.minimum_size:
+                await send(start)
+                await send(message)
+                return
+
+            compressed = compress(body, encoding, self.gzip_level, self.brotli_quality)
+            headers = [(k, v) for k, v in headers if k != b"content-length"]
+            headers += [
+                (b"content-encoding", encoding.encode()),
+                (b"content-length", str(len(compressed)).encode()),
+                (b"vary", b"Accept-Encoding"),
+            ]
+            await send({**start, "headers": headers})
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_wrapper)
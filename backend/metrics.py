@@ -0,0 +1,207 @@
+import threading
+from bisect import bisect_left
+from time import perf_counter
+
+from pymongo import monitoring
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """Cumulative-bucket latency histogram in Prometheus layout"""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def samples(self):
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            yield str(bound), cumulative
+        yield "+Inf", self.count
+
+
+def _labels(**labels) -> str:
+    parts = []
+    for key, value in labels.items():
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        parts.append(f'{key}="{value}"')
+    return "{" + ",".join(parts) + "}"
+
+
+def _render_histograms(lines: list, name: str, help_text: str, histograms: dict, label_names: tuple):
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} histogram")
+    for key, hist in histograms.items():
+        labels = dict(zip(label_names, key))
+        for le, count in hist.samples():
+            lines.append(f"{name}_bucket{_labels(**labels, le=le)} {count}")
+        lines.append(f"{name}_sum{_labels(**labels)} {hist.sum}")
+        lines.append(f"{name}_count{_labels(**labels)} {hist.count}")
+
+
+def _render_counter(lines: list, name: str, help_text: str, values: dict, label_names: tuple, kind: str = "counter"):
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} {kind}")
+    for key, value in values.items():
+        lines.append(f"{name}{_labels(**dict(zip(label_names, key)))} {value}")
+
+
+class HTTPMetrics:
+    """Per-route latency histograms, status counts and in-flight requests.
+
+    Routes are labelled by their path template (e.g. /api/challenges/{challenge_id}),
+    resolved from the endpoint Starlette stores in the scope, so label cardinality
+    stays bounded. Everything runs on the event loop thread, so no locking is needed.
+    """
+
+    def __init__(self):
+        self.in_flight = 0
+        self.latency = {}
+        self.requests = {}
+        self._route_paths = None
+
+    def route_label(self, scope) -> str:
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return "<unmatched>"
+        if self._route_paths is None:
+            self._route_paths = {
+                getattr(route, "endpoint", None): getattr(route, "path", "")
+                for route in scope["app"].router.routes
+            }
+        return self._route_paths.get(endpoint, getattr(endpoint, "__name__", "<unknown>"))
+
+    def observe(self, method: str, route: str, status_code: int, elapsed: float):
+        key = (method, route)
+        hist = self.latency.get(key)
+        if hist is None:
+            hist = self.latency[key] = Histogram()
+        hist.observe(elapsed)
+        status_key = key + (str(status_code),)
+        self.requests[status_key] = self.requests.get(status_key, 0) + 1
+
+    def render(self, lines: list):
+        _render_histograms(lines, "http_request_duration_seconds", "HTTP request latency by route",
+                           self.latency, ("method", "route"))
+        _render_counter(lines, "http_requests_total", "HTTP requests by route and status",
+                        self.requests, ("method", "route", "status"))
+        _render_counter(lines, "http_requests_in_flight", "HTTP requests currently being served",
+                        {(): self.in_flight}, (), kind="gauge")
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware feeding HTTPMetrics (cheaper than BaseHTTPMiddleware)"""
+
+    def __init__(self, app, metrics: HTTPMetrics, excluded_paths=("/metrics",)):
+        self.app = app
+        self.metrics = metrics
+        self.excluded_paths = set(excluded_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        metrics = self.metrics
+        metrics.in_flight += 1
+        start = perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            metrics.in_flight -= 1
+            metrics.observe(scope["method"], metrics.route_label(scope), status_code, perf_counter() - start)
+
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    """pymongo listener recording per-collection/per-command duration and documents returned.
+
+    Motor runs pymongo on worker threads, so updates are guarded by a lock.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = {}
+        self.latency = {}
+        self.documents = {}
+        self.failures = {}
+
+    def started(self, event):
+        # getMore's own field is the cursor id; the collection is named separately
+        field = "collection" if event.command_name == "getMore" else event.command_name
+        collection = event.command.get(field)
+        if not isinstance(collection, str):
+            collection = "<db>"
+        with self._lock:
+            self._pending[(event.connection_id, event.request_id)] = collection
+
+    def _finish(self, event):
+        with self._lock:
+            collection = self._pending.pop((event.connection_id, event.request_id), "<unknown>")
+        return (collection, event.command_name)
+
+    def succeeded(self, event):
+        key = self._finish(event)
+        reply = event.reply or {}
+        cursor = reply.get("cursor") or {}
+        batch = cursor.get("firstBatch", cursor.get("nextBatch"))
+        if batch is not None:
+            returned = len(batch)
+        elif "value" in reply:
+            returned = 1 if reply["value"] else 0
+        else:
+            returned = 0
+        with self._lock:
+            hist = self.latency.get(key)
+            if hist is None:
+                hist = self.latency[key] = Histogram()
+            hist.observe(event.duration_micros / 1e6)
+            self.documents[key] = self.documents.get(key, 0) + returned
+
+    def failed(self, event):
+        key = self._finish(event)
+        with self._lock:
+            hist = self.latency.get(key)
+            if hist is None:
+                hist = self.latency[key] = Histogram()
+            hist.observe(event.duration_micros / 1e6)
+            self.failures[key] = self.failures.get(key, 0) + 1
+
+    def render(self, lines: list):
+        with self._lock:
+            latency = dict(self.latency)
+            documents = dict(self.documents)
+            failures = dict(self.failures)
+        labels = ("collection", "command")
+        _render_histograms(lines, "mongo_command_duration_seconds", "MongoDB command duration",
+                           latency, labels)
+        _render_counter(lines, "mongo_command_documents_returned_total", "Documents returned by MongoDB commands",
+                        documents, labels)
+        _render_counter(lines, "mongo_command_failures_total", "Failed MongoDB commands",
+                        failures, labels)
+
+
+def render_gauges(lines: list, name: str, help_text: str, values: dict, label_names: tuple = ()):
+    _render_counter(lines, name, help_text, values, label_names, kind="gauge")
+
+
+def render_counters(lines: list, name: str, help_text: str, values: dict, label_names: tuple = ()):
+    _render_counter(lines, name, help_text, values, label_names)
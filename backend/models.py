@@ -0,0 +1,251 @@
+from datetime import datetime, timezone
+from typing import List, Optional
+import uuid
+
+from pydantic import BaseModel, Field, ConfigDict, EmailStr
+
+
+class UserRegister(BaseModel):
+    username: str
+    email: EmailStr
+    password: str
+    full_name: str
+
+class UserLogin(BaseModel):
+    username: str
+    password: str
+
+class User(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    username: str
+    email: str
+    full_name: str
+    role: str = "user"  # user or admin
+    points: int = 0
+    level: str = "Beginner"
+    completed_challenges: List[str] = []
+    streak_days: int = 0
+    last_active_date: Optional[str] = None
+    daily_challenge_completed: bool = False
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+class ForgotPasswordRequest(BaseModel):
+    email: EmailStr
+
+class ResetPasswordRequest(BaseModel):
+    email: EmailStr
+    reset_code: str
+    new_password: str
+
+class QuestionItem(BaseModel):
+    question: str
+    options: List[str]
+    correct_answer: int
+    explanation: str
+
+class Challenge(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    title: str
+    category: str  # phishing, pretexting, baiting, quid_pro_quo, tailgating, money_app, indonesian_case
+    difficulty: str  # beginner, intermediate, advanced
+    cialdini_principle: str  # reciprocity, commitment, social_proof, authority, liking, scarcity
+    challenge_type: str = "multi_choice"  # multi_choice, chat_simulation, email_analysis, spot_difference, timeline_ordering
+    description: str
+    scenario: str
+    questions: List[QuestionItem]  # Multi-question support
+    points: int
+    tips: List[str]
+    real_case_reference: Optional[str] = None
+    time_limit_seconds: Optional[int] = None
+    interactive_data: Optional[dict] = None  # For chat, email, etc simulations
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+class ChallengeSummary(BaseModel):
+    """List card for GET /challenges?view=summary (no questions)"""
+    id: str
+    title: str
+    description: str
+    category: str
+    difficulty: str
+    cialdini_principle: str
+    challenge_type: str
+    points: int
+    question_count: int
+    time_limit_seconds: Optional[int] = None
+    created_at: datetime
+
+class ChallengeSummaryPage(BaseModel):
+    items: List[ChallengeSummary]
+    next_cursor: Optional[str] = None
+
+class ChallengeAttempt(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    user_id: str
+    challenge_id: str
+    answers: List[int]  # Multiple answers for multi-question
+    correct_count: int
+    total_questions: int
+    is_completed: bool
+    points_earned: int
+    time_taken_seconds: Optional[int] = None
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+class BatchAttemptItem(BaseModel):
+    """One entry of POST /challenges/attempts/batch"""
+    model_config = ConfigDict(extra="ignore")
+    challenge_id: str
+    answers: List[int] = []
+    time_taken_seconds: Optional[int] = 0
+
+class ChallengeFeedback(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    user_id: str
+    challenge_id: str
+    rating: int  # 1-5
+    comment: str
+    username: str
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+class EducationContent(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    title: str
+    content_type: str  # cialdini_principle, prevention_tips, case_study
+    content: str
+    principle: Optional[str] = None
+
+class Badge(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    id: str
+    name: str
+    description: str
+    icon: str
+    requirement: str
+
+class UserBadge(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    user_id: str
+    badge_id: str
+    earned_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+class HintRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    user_id: str
+    challenge_id: str
+    question_index: int
+    hint_cost: int = 10
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+class CourseSlide(BaseModel):
+    title: str
+    content: str
+    code_example: Optional[str] = None
+    image_url: Optional[str] = None
+
+class CourseModule(BaseModel):
+    module_number: int
+    title: str
+    description: str
+    slides: List[CourseSlide]
+
+class CourseQuizQuestion(BaseModel):
+    question: str
+    options: List[str]
+    correct_answer: int
+    explanation: str
+
+class Course(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    title: str
+    description: str
+    category: str
+    difficulty: str
+    modules: List[CourseModule]
+    quiz_questions: List[CourseQuizQuestion] = []
+    passing_score: int = 70  # Percentage to pass
+    total_duration_minutes: int
+    prerequisites: List[str] = []
+    learning_outcomes: List[str] = []
+    created_by: str
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+class CourseProgress(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    user_id: str
+    course_id: str
+    completed_modules: List[int] = []
+    current_slide: int = 0
+    quiz_completed: bool = False
+    quiz_score: Optional[int] = None
+    quiz_passed: bool = False
+    completed: bool = False
+    started_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    completed_at: Optional[datetime] = None
+
+class Certificate(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    user_id: str
+    username: str
+    full_name: str
+    achievement_type: str  # course_completion, all_challenges, expert_level
+    achievement_title: str
+    issued_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    certificate_code: str = Field(default_factory=lambda: str(uuid.uuid4())[:8].upper())
+
+class QuizCompletion(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    user_id: str
+    quiz_data: dict  # Store the quiz questions and answers
+    correct_count: int
+    total_questions: int
+    points_earned: int
+    time_taken_seconds: int
+    accuracy: float
+    completed_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+class MiniGameCompletion(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    user_id: str
+    game_type: str  # one of MINIGAME_TYPES
+    score: int
+    time_taken_seconds: int
+    details: dict  # Store game-specific data
+    completed_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+class QuizQuestion(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    question: str
+    options: List[str]
+    correct_answer: int
+    explanation: str
+    category: str
+    difficulty: str
+    created_by: str
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+MINIGAME_TYPES = ("spot_the_phishing",)
+
+class MiniGameScenario(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    game_type: str  # spot_the_phishing
+    title: str
+    description: str
+    image_url: str
+    is_phishing: bool
+    indicators: List[str]
+    difficulty: str
+    created_by: str
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
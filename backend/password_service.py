@@ -0,0 +1,85 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+
+from passlib.context import CryptContext
+
+
+class PasswordServiceBusy(Exception):
+    """Raised when the hashing queue is full"""
+
+
+class PasswordService:
+    """Runs bcrypt hash/verify on a bounded thread pool so the event loop never blocks.
+
+    bcrypt releases the GIL while hashing, so a small pool gives real parallelism.
+    Requests beyond pool_size + queue_limit are rejected instead of piling up.
+    """
+
+    def __init__(self, context: CryptContext, pool_size: int = 4, queue_limit: int = 64):
+        self.context = context
+        self.pool_size = pool_size
+        self.queue_limit = queue_limit
+        self._executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="bcrypt")
+        self._pending = 0
+        self._rejected = 0
+        self._stats = {
+            op: {"count": 0, "total_ms": 0.0, "max_ms": 0.0}
+            for op in ("hash", "verify")
+        }
+
+    async def _run(self, op: str, fn, *args):
+        if self._pending >= self.pool_size + self.queue_limit:
+            self._rejected += 1
+            raise PasswordServiceBusy("Password service queue is full")
+
+        self._pending += 1
+        start = perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, fn, *args)
+        finally:
+            self._pending -= 1
+            elapsed_ms = (perf_counter() - start) * 1000
+            stats = self._stats[op]
+            stats["count"] += 1
+            stats["total_ms"] += elapsed_ms
+            stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+
+    async def hash(self, password: str) -> str:
+        return await self._run("hash", self.context.hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run("verify", self.context.verify, plain_password, hashed_password)
+
+    def metrics(self) -> dict:
+        return {
+            "pool_size": self.pool_size,
+            "queue_limit": self.queue_limit,
+            "in_flight": min(self._pending, self.pool_size),
+            "queue_depth": max(0, self._pending - self.pool_size),
+            "rejected": self._rejected,
+            "operations": {
+                op: {
+                    "count": stats["count"],
+                    "avg_ms": round(stats["total_ms"] / stats["count"], 2) if stats["count"] else 0.0,
+                    "max_ms": round(stats["max_ms"], 2)
+                }
+                for op, stats in self._stats.items()
+            }
+        }
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False)
+
+
+def create_password_service(context: CryptContext = None) -> PasswordService:
+    """Build a service configured from PASSWORD_POOL_SIZE / PASSWORD_QUEUE_LIMIT"""
+    if context is None:
+        context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    return PasswordService(
+        context,
+        pool_size=int(os.environ.get('PASSWORD_POOL_SIZE', 4)),
+        queue_limit=int(os.environ.get('PASSWORD_QUEUE_LIMIT', 64))
+    )
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Unified, idempotent seeding CLI for the Tegalsec database.
+
+Loads the compiled content snapshot (see seed_content.py, rebuilt automatically
+when a content file changes) and upserts only documents whose content hash
+differs from the stored one, with unordered bulk writes. Collections
+are seeded concurrently and the whole run is skipped when the combined content
+hash matches the one recorded by the previous run, so container restarts are
+effectively free.
+
+    python seed.py                 # default packs
+    python seed.py --extra         # also include the alternate challenge packs
+    python seed.py --force --prune # rewrite everything and drop seed docs no longer defined
+"""
+
+import argparse
+import asyncio
+import os
+import uuid
+from datetime import datetime, timezone
+from time import perf_counter
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne, DeleteMany
+
+from password_service import create_password_service
+from seed_content import DEFAULT_PACKS, all_packs, content_hash, ensure_snapshot, snapshot_documents
+
+SEED_NAMESPACE = uuid.UUID("3f0c7a52-6a8e-4f0e-9d53-6f1b2c7e9a41")
+SEED_META_ID = "content"
+BATCH_SIZE = 500
+
+SEED_USERS = [
+    {
+        "username": "admin",
+        "email": "admin@tegalsec.org",
+        "password": "admin123",
+        "full_name": "Admin Tegalsec",
+        "role": "admin",
+    },
+    {
+        "username": "demouser",
+        "email": "demo@example.com",
+        "password": "demo123",
+        "full_name": "Demo User",
+        "role": "user",
+    },
+]
+
+
+def seed_id(collection: str, title: str) -> str:
+    return str(uuid.uuid5(SEED_NAMESPACE, f"{collection}:{title}"))
+
+
+# ===== WRITERS =====
+async def seed_collection(db, collection: str, docs: dict, prune: bool, force: bool) -> dict:
+    """Upsert changed documents in unordered batches; returns per-collection counts"""
+    coll = db[collection]
+    existing = {}
+    detached = set()
+    async for doc in coll.find({"seed_managed": {"$exists": True}}, {"_id": 0, "title": 1, "content_hash": 1, "seed_managed": 1}):
+        if doc["seed_managed"]:
+            existing[doc["title"]] = doc.get("content_hash")
+        else:
+            detached.add(doc["title"])
+
+    now = datetime.now(timezone.utc).isoformat()
+    ops = []
+    for title, content in docs.items():
+        # Documents edited through the admin API are left alone
+        if title in detached or (not force and existing.get(title) == content["content_hash"]):
+            continue
+        ops.append(UpdateOne(
+            {"title": title},
+            {
+                "$set": {**content, "seed_managed": True},
+                "$setOnInsert": {"id": seed_id(collection, title), "created_at": now},
+            },
+            upsert=True
+        ))
+
+    stale = [title for title in existing if title not in docs]
+    if prune and stale:
+        ops.append(DeleteMany({"seed_managed": True, "title": {"$in": stale}}))
+
+    counts = {"defined": len(docs), "inserted": 0, "updated": 0, "deleted": 0, "detached": len(detached),
+              "unchanged": len(docs) - len(detached & docs.keys()) - sum(1 for op in ops if isinstance(op, UpdateOne))}
+    for start in range(0, len(ops), BATCH_SIZE):
+        result = await coll.bulk_write(ops[start:start + BATCH_SIZE], ordered=False)
+        counts["inserted"] += result.upserted_count
+        counts["updated"] += result.modified_count
+        counts["deleted"] += result.deleted_count
+    return counts
+
+
+async def seed_users(db, password_service) -> int:
+    """Create the admin/demo accounts if missing; existing accounts are never touched"""
+    usernames = [u["username"] for u in SEED_USERS]
+    present = {u["username"] async for u in db.users.find({"username": {"$in": usernames}}, {"_id": 0, "username": 1})}
+    missing = [u for u in SEED_USERS if u["username"] not in present]
+    if not missing:
+        return 0
+
+    hashes = await asyncio.gather(*(password_service.hash(u["password"]) for u in missing))
+    now = datetime.now(timezone.utc).isoformat()
+    ops = [
+        UpdateOne(
+            {"username": u["username"]},
+            {"$setOnInsert": {
+                "id": str(uuid.uuid4()),
+                "username": u["username"],
+                "email": u["email"],
+                "password": hashed,
+                "full_name": u["full_name"],
+                "role": u["role"],
+                "points": 0,
+                "level": "Beginner",
+                "completed_challenges": [],
+                "created_at": now,
+            }},
+            upsert=True
+        )
+        for u, hashed in zip(missing, hashes)
+    ]
+    result = await db.users.bulk_write(ops, ordered=False)
+    return result.upserted_count
+
+
+async def run(args) -> int:
+    mongo_url = os.environ.get('MONGO_URL', 'mongodb://localhost:27017')
+    client = AsyncIOMotorClient(mongo_url)
+    db = client[os.environ.get('DB_NAME', 'tegalsec_lab')]
+    password_service = create_password_service()
+    start = perf_counter()
+
+    try:
+        packs = all_packs() if args.extra else {name: list(names) for name, names in DEFAULT_PACKS.items()}
+
+        snapshot = ensure_snapshot()
+        try:
+            collected = snapshot_documents(snapshot, packs)
+        except ValueError as e:
+            print(f"❌ {e}")
+            return 1
+        digest = content_hash({"snapshot": snapshot["version"], "packs": packs, "prune": args.prune})
+
+        created_users = await seed_users(db, password_service)
+        if created_users:
+            print(f"✅ {created_users} seed user(s) created (admin/admin123, demouser/demo123)")
+
+        meta = await db.seed_meta.find_one({"_id": SEED_META_ID})
+        if not args.force and meta and meta.get("hash") == digest:
+            print(f"⏭️  Seed content unchanged ({digest[:12]}), nothing to do")
+            return 0
+
+        names = list(collected)
+        results = await asyncio.gather(*(
+            seed_collection(db, name, collected[name], args.prune, args.force) for name in names
+        ))
+        changed = False
+        for name, counts in zip(names, results):
+            print(f"✅ {name}: {counts['defined']} defined, {counts['inserted']} inserted, "
+                  f"{counts['updated']} updated, {counts['unchanged']} unchanged, {counts['deleted']} deleted, {counts['detached']} admin-edited")
+            changed = changed or counts["inserted"] or counts["deleted"]
+
+        if changed or created_users:
+            # A running server rebuilds the dashboard counters from the collections on the
+            # next /admin/stats read or counter update (record_stat recounts a missing document)
+            await db.stats.delete_one({"_id": "totals"})
+
+        await db.seed_meta.update_one(
+            {"_id": SEED_META_ID},
+            {"$set": {"hash": digest, "seeded_at": datetime.now(timezone.utc).isoformat()}},
+            upsert=True
+        )
+        print(f"🎉 Seeding finished in {perf_counter() - start:.2f}s")
+        return 0
+    finally:
+        client.close()
+        password_service.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Seed Tegalsec content idempotently")
+    parser.add_argument("--extra", action="store_true", help="include the alternate challenge packs")
+    parser.add_argument("--prune", action="store_true", help="delete seed-managed documents no longer defined")
+    parser.add_argument("--force", action="store_true", help="ignore stored hashes and rewrite every document")
+    args = parser.parse_args()
+    raise SystemExit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Declarative seed content and its compiled snapshot.
+
+Challenge, course and education content lives in content/<collection>/<pack>.json
+(or .yaml when PyYAML is installed). `python seed_content.py build` validates
+every document against the API models and compiles all packs into a single
+gzipped JSON snapshot, which seed.py and the server's catalog warm-up read
+instead of re-parsing and re-validating the sources.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import sys
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+CONTENT_DIR = Path(__file__).parent / 'content'
+SNAPSHOT_PATH = Path(os.environ.get('SEED_SNAPSHOT_PATH', CONTENT_DIR / 'snapshot.json.gz'))
+SNAPSHOT_FORMAT = 1
+
+# Packs seeded by default. seed.py keys documents by title, so a title may
+# appear in only one selected pack
+DEFAULT_PACKS = {
+    "challenges": ["core", "indonesia", "massive", "final_10"],
+    "education": ["core"],
+    "courses": ["core"],
+}
+
+# Alternate challenge packs, opt-in via seed.py --extra
+EXTRA_PACKS = {
+    "challenges": ["cialdini_categories", "enhanced", "complete_batch", "ultimate"],
+}
+
+SOURCE_SUFFIXES = (".json", ".yaml", ".yml")
+
+
+def content_hash(value) -> str:
+    encoded = json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+# ===== SOURCE FILES =====
+def pack_path(collection: str, pack: str) -> Path:
+    for suffix in SOURCE_SUFFIXES:
+        path = CONTENT_DIR / collection / f"{pack}{suffix}"
+        if path.exists():
+            return path
+    raise FileNotFoundError(f"No content file for {collection}/{pack} in {CONTENT_DIR}")
+
+
+def read_pack(collection: str, pack: str) -> list:
+    path = pack_path(collection, pack)
+    with open(path, encoding="utf-8") as f:
+        if path.suffix == ".json":
+            docs = json.load(f)
+        else:
+            try:
+                import yaml
+            except ImportError:
+                raise RuntimeError(f"PyYAML is required to read {path}")
+            docs = yaml.safe_load(f)
+    if not isinstance(docs, list):
+        raise ValueError(f"{path} must contain a list of documents")
+    return docs
+
+
+def source_files() -> list:
+    return sorted(p for p in CONTENT_DIR.glob("*/*") if p.suffix in SOURCE_SUFFIXES)
+
+
+def legacy_documents(collection: str, pack: str) -> list:
+    """Pack documents with fresh ids/timestamps, for the standalone seed_*.py scripts"""
+    now = datetime.now(timezone.utc).isoformat()
+    return [{"id": str(uuid.uuid4()), **doc, "created_at": now} for doc in read_pack(collection, pack)]
+
+
+# ===== SNAPSHOT =====
+def content_models() -> dict:
+    """Collection -> pydantic model used to validate seed content"""
+    from models import Challenge, Course, EducationContent
+    return {"challenges": Challenge, "courses": Course, "education": EducationContent}
+
+
+def compile_snapshot(models: dict = None) -> dict:
+    """Validate every pack and return the snapshot dict.
+
+    Documents are stored in their validated JSON form without id/created_at
+    (those are assigned when a document is first inserted), each tagged with
+    a content_hash so the seeder and catalog can match them to database rows.
+    """
+    models = models or content_models()
+    packs = {}
+    errors = []
+    for collection, model in models.items():
+        collection_dir = CONTENT_DIR / collection
+        names = sorted({p.stem for p in collection_dir.glob("*") if p.suffix in SOURCE_SUFFIXES})
+        packs[collection] = {}
+        for pack in names:
+            docs = []
+            for index, raw in enumerate(read_pack(collection, pack)):
+                try:
+                    doc = model.model_validate(raw).model_dump(mode="json", exclude={"id", "created_at"})
+                except ValueError as e:
+                    errors.append(f"{collection}/{pack}[{index}] {raw.get('title', '?')}: {e}")
+                    continue
+                doc["content_hash"] = content_hash(doc)
+                docs.append(doc)
+            packs[collection][pack] = docs
+    if errors:
+        raise ValueError("Invalid seed content:\n" + "\n".join(errors))
+    return {
+        "format": SNAPSHOT_FORMAT,
+        "version": content_hash(packs)[:16],
+        "built_at": datetime.now(timezone.utc).isoformat(),
+        "packs": packs,
+    }
+
+
+def write_snapshot(snapshot: dict, path: Path = SNAPSHOT_PATH):
+    data = json.dumps(snapshot, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    tmp = Path(f"{path}.tmp")
+    with gzip.open(tmp, "wb", compresslevel=9) as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def load_snapshot(path: Path = SNAPSHOT_PATH):
+    """Return the compiled snapshot, or None if it has not been built"""
+    try:
+        with gzip.open(path, "rb") as f:
+            snapshot = json.loads(f.read())
+    except FileNotFoundError:
+        return None
+    if snapshot.get("format") != SNAPSHOT_FORMAT:
+        return None
+    return snapshot
+
+
+def snapshot_is_stale(path: Path = SNAPSHOT_PATH) -> bool:
+    if not path.exists():
+        return True
+    built = path.stat().st_mtime
+    return any(p.stat().st_mtime > built for p in source_files())
+
+
+def ensure_snapshot(path: Path = SNAPSHOT_PATH) -> dict:
+    """Load the snapshot, rebuilding it first when a source file is newer"""
+    if not snapshot_is_stale(path):
+        snapshot = load_snapshot(path)
+        if snapshot is not None:
+            return snapshot
+    snapshot = compile_snapshot()
+    write_snapshot(snapshot, path)
+    return snapshot
+
+
+def all_packs() -> dict:
+    """DEFAULT_PACKS plus EXTRA_PACKS (what seed.py --extra selects)"""
+    packs = {name: list(names) for name, names in DEFAULT_PACKS.items()}
+    for name, names in EXTRA_PACKS.items():
+        packs.setdefault(name, []).extend(names)
+    return packs
+
+
+def snapshot_documents(snapshot: dict, packs: dict) -> dict:
+    """Merge the selected packs into {collection: {title: doc}}.
+
+    Raises ValueError when a title is defined more than once, since the seeder
+    would otherwise silently let one pack's document overwrite another's.
+    """
+    merged = {}
+    duplicates = []
+    for collection, names in packs.items():
+        docs = merged.setdefault(collection, {})
+        sources = {}
+        for name in names:
+            for doc in snapshot["packs"][collection][name]:
+                title = doc["title"]
+                if title in sources:
+                    duplicates.append(f"{collection}: '{title}' in {sources[title]} and {name}")
+                    continue
+                sources[title] = name
+                docs[title] = doc
+    if duplicates:
+        raise ValueError("Duplicate seed titles:\n" + "\n".join(duplicates))
+    return merged
+
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1] not in ("build", "check"):
+        print("usage: python seed_content.py build|check")
+        raise SystemExit(2)
+    try:
+        snapshot = compile_snapshot()
+        snapshot_documents(snapshot, all_packs())
+    except ValueError as e:
+        print(f"❌ {e}")
+        raise SystemExit(1)
+    counts = {c: sum(len(d) for d in packs.values()) for c, packs in snapshot["packs"].items()}
+    if sys.argv[1] == "build":
+        write_snapshot(snapshot)
+        size = SNAPSHOT_PATH.stat().st_size
+        print(f"✅ Snapshot {snapshot['version']} written to {SNAPSHOT_PATH} ({size // 1024} KB): {counts}")
+    else:
+        print(f"✅ Seed content valid: {counts}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,260 +1,139 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, status
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, Request, Response, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReturnDocument
 import os
+import asyncio
+import hashlib
+import hmac
+import json
 import logging
+import orjson
 from pathlib import Path
-from pydantic import BaseModel, Field, ConfigDict, EmailStr
-from typing import List, Optional
+from typing import List, Optional, Union
 import uuid
 from datetime import datetime, timezone, timedelta
 from passlib.context import CryptContext
 import jwt
+from password_service import create_password_service, PasswordServiceBusy
+from compression import DEFAULT_MINIMUM_SIZE, CompressedBody, CompressionMiddleware, negotiate_encoding
+from metrics import HTTPMetrics, MetricsMiddleware, MongoCommandMetrics, render_counters, render_gauges
+from models import (
+    UserRegister, UserLogin, User, ForgotPasswordRequest, ResetPasswordRequest, QuestionItem, Challenge,
+    ChallengeSummary, ChallengeSummaryPage, ChallengeAttempt, BatchAttemptItem, ChallengeFeedback, EducationContent, Badge, UserBadge, HintRequest, CourseSlide,
+    CourseModule, CourseQuizQuestion, Course, CourseProgress, Certificate, QuizCompletion,
+    MiniGameCompletion, QuizQuestion, MiniGameScenario, MINIGAME_TYPES,
+)
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+mongo_metrics = MongoCommandMetrics()
+client = AsyncIOMotorClient(mongo_url, event_listeners=[mongo_metrics])
 db = client[os.environ['DB_NAME']]
 
 # Security
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+password_service = create_password_service(pwd_context)
 security = HTTPBearer()
 SECRET_KEY = os.environ.get('JWT_SECRET', 'tegalsec-secret-key-2025')
 ALGORITHM = "HS256"
 
-app = FastAPI()
+# orjson serializes datetimes natively and is much faster than the stdlib encoder;
+# hot routes return ORJSONResponse directly to skip jsonable_encoder as well
+app = FastAPI(default_response_class=ORJSONResponse)
 api_router = APIRouter(prefix="/api")
 
-# ===== MODELS =====
-class UserRegister(BaseModel):
-    username: str
-    email: EmailStr
-    password: str
-    full_name: str
-
-class UserLogin(BaseModel):
-    username: str
-    password: str
-
-class User(BaseModel):
-    model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
-    username: str
-    email: str
-    full_name: str
-    role: str = "user"  # user or admin
-    points: int = 0
-    level: str = "Beginner"
-    completed_challenges: List[str] = []
-    streak_days: int = 0
-    last_active_date: Optional[str] = None
-    daily_challenge_completed: bool = False
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-
-class ForgotPasswordRequest(BaseModel):
-    email: EmailStr
-
-class ResetPasswordRequest(BaseModel):
-    email: EmailStr
-    reset_code: str
-    new_password: str
-
-class QuestionItem(BaseModel):
-    question: str
-    options: List[str]
-    correct_answer: int
-    explanation: str
-
-class Challenge(BaseModel):
-    model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
-    title: str
-    category: str  # phishing, pretexting, baiting, quid_pro_quo, tailgating, money_app, indonesian_case
-    difficulty: str  # beginner, intermediate, advanced
-    cialdini_principle: str  # reciprocity, commitment, social_proof, authority, liking, scarcity
-    challenge_type: str = "multi_choice"  # multi_choice, chat_simulation, email_analysis, spot_difference, timeline_ordering
-    description: str
-    scenario: str
-    questions: List[QuestionItem]  # Multi-question support
-    points: int
-    tips: List[str]
-    real_case_reference: Optional[str] = None
-    time_limit_seconds: Optional[int] = None
-    interactive_data: Optional[dict] = None  # For chat, email, etc simulations
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-
-class ChallengeAttempt(BaseModel):
-    model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
-    user_id: str
-    challenge_id: str
-    answers: List[int]  # Multiple answers for multi-question
-    correct_count: int
-    total_questions: int
-    is_completed: bool
-    points_earned: int
-    time_taken_seconds: Optional[int] = None
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-
-class ChallengeFeedback(BaseModel):
-    model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
-    user_id: str
-    challenge_id: str
-    rating: int  # 1-5
-    comment: str
-    username: str
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-
-class EducationContent(BaseModel):
-    model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
-    title: str
-    content_type: str  # cialdini_principle, prevention_tips, case_study
-    content: str
-    principle: Optional[str] = None
-
-class Badge(BaseModel):
-    model_config = ConfigDict(extra="ignore")
-    id: str
-    name: str
-    description: str
-    icon: str
-    requirement: str
-
-class UserBadge(BaseModel):
-    model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
-    user_id: str
-    badge_id: str
-    earned_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-
-class HintRequest(BaseModel):
-    model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
-    user_id: str
-    challenge_id: str
-    question_index: int
-    hint_cost: int = 10
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-
-class CourseSlide(BaseModel):
-    title: str
-    content: str
-    code_example: Optional[str] = None
-    image_url: Optional[str] = None
+# Bodies below this size are sent uncompressed (middleware and cached bodies alike)
+COMPRESSION_MIN_SIZE = int(os.environ.get('COMPRESSION_MIN_SIZE', DEFAULT_MINIMUM_SIZE))
+
+# ===== USER CACHE =====
+from collections import OrderedDict
+from time import monotonic
+
+class UserCache:
+    """TTL + LRU cache of user documents keyed by user id.
+
+    Every write to `users` must call invalidate(); the TTL only bounds staleness
+    across uvicorn workers, which each hold their own cache.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl_seconds: float = 60):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._epoch = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def epoch(self) -> int:
+        return self._epoch
+
+    def get(self, user_id: str) -> Optional[dict]:
+        entry = self._entries.get(user_id)
+        if entry is None or entry[0] < monotonic():
+            if entry is not None:
+                del self._entries[user_id]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(user_id)
+        self.hits += 1
+        return self._copy(entry[1])
+
+    def set(self, user_id: str, user: dict, epoch: int):
+        # Skip if an invalidation happened while the document was being read
+        if epoch != self._epoch:
+            return
+        self._entries[user_id] = (monotonic() + self.ttl_seconds, self._copy(user))
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: str):
+        self._epoch += 1
+        self._entries.pop(user_id, None)
+
+    def clear(self):
+        self._epoch += 1
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses
+        }
 
-class CourseModule(BaseModel):
-    module_number: int
-    title: str
-    description: str
-    slides: List[CourseSlide]
-
-class CourseQuizQuestion(BaseModel):
-    question: str
-    options: List[str]
-    correct_answer: int
-    explanation: str
-
-class Course(BaseModel):
-    model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
-    title: str
-    description: str
-    category: str
-    difficulty: str
-    modules: List[CourseModule]
-    quiz_questions: List[CourseQuizQuestion] = []
-    passing_score: int = 70  # Percentage to pass
-    total_duration_minutes: int
-    prerequisites: List[str] = []
-    learning_outcomes: List[str] = []
-    created_by: str
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-
-class CourseProgress(BaseModel):
-    model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
-    user_id: str
-    course_id: str
-    completed_modules: List[int] = []
-    current_slide: int = 0
-    quiz_completed: bool = False
-    quiz_score: Optional[int] = None
-    quiz_passed: bool = False
-    completed: bool = False
-    started_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    completed_at: Optional[datetime] = None
-
-class Certificate(BaseModel):
-    model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
-    user_id: str
-    username: str
-    full_name: str
-    achievement_type: str  # course_completion, all_challenges, expert_level
-    achievement_title: str
-    issued_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    certificate_code: str = Field(default_factory=lambda: str(uuid.uuid4())[:8].upper())
-
-class QuizCompletion(BaseModel):
-    model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
-    user_id: str
-    quiz_data: dict  # Store the quiz questions and answers
-    correct_count: int
-    total_questions: int
-    points_earned: int
-    time_taken_seconds: int
-    accuracy: float
-    completed_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-
-class MiniGameCompletion(BaseModel):
-    model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
-    user_id: str
-    game_type: str  # spot_the_phishing, etc
-    score: int
-    time_taken_seconds: int
-    details: dict  # Store game-specific data
-    completed_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-
-class QuizQuestion(BaseModel):
-    model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
-    question: str
-    options: List[str]
-    correct_answer: int
-    explanation: str
-    category: str
-    difficulty: str
-    created_by: str
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-
-class MiniGameScenario(BaseModel):
-    model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
-    game_type: str  # spot_the_phishing
-    title: str
-    description: str
-    image_url: str
-    is_phishing: bool
-    indicators: List[str]
-    difficulty: str
-    created_by: str
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    @staticmethod
+    def _copy(user: dict) -> dict:
+        # Handlers mutate current_user (e.g. completed_challenges), never hand out the cached dict
+        return {k: list(v) if isinstance(v, list) else v for k, v in user.items()}
+
+user_cache = UserCache(
+    max_size=int(os.environ.get('USER_CACHE_SIZE', 10000)),
+    ttl_seconds=float(os.environ.get('USER_CACHE_TTL', 60))
+)
 
 # ===== AUTH HELPERS =====
-def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+async def hash_password(password: str) -> str:
+    try:
+        return await password_service.hash(password)
+    except PasswordServiceBusy:
+        raise HTTPException(status_code=503, detail="Server sedang sibuk, coba lagi nanti")
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    try:
+        return await password_service.verify(plain_password, hashed_password)
+    except PasswordServiceBusy:
+        raise HTTPException(status_code=503, detail="Server sedang sibuk, coba lagi nanti")
 
 def create_access_token(data: dict) -> str:
     to_encode = data.copy()
@@ -270,9 +149,13 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
         if user_id is None:
             raise HTTPException(status_code=401, detail="Invalid token")
         
-        user = await db.users.find_one({"id": user_id}, {"_id": 0})
-        if not user:
-            raise HTTPException(status_code=401, detail="User not found")
+        user = user_cache.get(user_id)
+        if user is None:
+            epoch = user_cache.epoch
+            user = await db.users.find_one({"id": user_id}, {"_id": 0})
+            if not user:
+                raise HTTPException(status_code=401, detail="User not found")
+            user_cache.set(user_id, user, epoch)
         return user
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token expired")
@@ -291,39 +174,318 @@ async def require_admin(current_user: dict = Depends(get_current_user)):
     return current_user
 
 # ===== RATE LIMITING =====
-from collections import defaultdict
+import math
 from time import time
 
-# Simple in-memory rate limiter
-rate_limit_store = defaultdict(list)
 RATE_LIMIT_LOGIN = 5  # 5 attempts
 RATE_LIMIT_WINDOW = 300  # 5 minutes
 
-def check_rate_limit(identifier: str, limit: int = RATE_LIMIT_LOGIN, window: int = RATE_LIMIT_WINDOW):
+def sliding_window_estimate(previous: int, current: int, elapsed: float, window: int) -> float:
+    """Sliding-window counter: weight the previous window by how much of it still overlaps"""
+    return previous * (1 - elapsed / window) + current
+
+def sliding_window_retry_after(previous: int, current: int, elapsed: float, window: int, limit: int) -> float:
+    if current < limit and previous > 0:
+        return max(0.0, window * (1 - (limit - current) / previous) - elapsed)
+    # Wait for this window to end, then for it to decay as the previous window
+    return (window - elapsed) + window * max(0.0, 1 - limit / max(current, 1))
+
+class InMemoryRateLimitBackend:
+    """Per-process sliding-window counters, fixed size per key, LRU-evicted beyond max_keys"""
+
+    def __init__(self, max_keys: int = 100000):
+        self.max_keys = max_keys
+        self._buckets = OrderedDict()  # key -> [window_start, current, previous]
+
+    async def hit(self, key: str, limit: int, window: int, now: float):
+        window_start = now - now % window
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = [window_start, 0, 0]
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+            if bucket[0] != window_start:
+                previous = bucket[1] if bucket[0] == window_start - window else 0
+                bucket[:] = [window_start, 0, previous]
+        
+        elapsed = now - window_start
+        if sliding_window_estimate(bucket[2], bucket[1], elapsed, window) >= limit:
+            return False, sliding_window_retry_after(bucket[2], bucket[1], elapsed, window, limit)
+        bucket[1] += 1
+        return True, 0.0
+
+class MongoRateLimitBackend:
+    """Sliding-window counters in `rate_limits`, shared by every worker.
+
+    Each hit is one pipeline upsert that rolls the window, decides and increments
+    atomically; a TTL index on expires_at drops idle keys.
+    """
+
+    async def hit(self, key: str, limit: int, window: int, now: float):
+        window_start = now - now % window
+        elapsed = now - window_start
+        doc = await db.rate_limits.find_one_and_update(
+            {"_id": key},
+            [
+                {"$set": {
+                    "previous": {"$switch": {
+                        "branches": [
+                            {"case": {"$eq": ["$window_start", window_start]}, "then": {"$ifNull": ["$previous", 0]}},
+                            {"case": {"$eq": ["$window_start", window_start - window]}, "then": "$current"},
+                        ],
+                        "default": 0
+                    }},
+                    "current": {"$cond": [{"$eq": ["$window_start", window_start]}, "$current", 0]},
+                    "window_start": window_start,
+                    "expires_at": datetime.fromtimestamp(window_start + 2 * window, timezone.utc)
+                }},
+                {"$set": {"allowed": {"$lt": [
+                    {"$add": [{"$multiply": ["$previous", 1 - elapsed / window]}, "$current"]},
+                    limit
+                ]}}},
+                {"$set": {"current": {"$add": ["$current", {"$cond": ["$allowed", 1, 0]}]}}}
+            ],
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        if doc['allowed']:
+            return True, 0.0
+        return False, sliding_window_retry_after(doc['previous'], doc['current'], elapsed, window, limit)
+
+def create_rate_limit_backend():
+    backend = os.environ.get('RATE_LIMIT_BACKEND', 'memory')
+    if backend == 'mongo':
+        return MongoRateLimitBackend()
+    return InMemoryRateLimitBackend(max_keys=int(os.environ.get('RATE_LIMIT_MAX_KEYS', 100000)))
+
+rate_limiter = create_rate_limit_backend()
+
+async def check_rate_limit(identifier: str, limit: int = RATE_LIMIT_LOGIN, window: int = RATE_LIMIT_WINDOW):
     """Check if request is within rate limit"""
-    now = time()
-    # Clean old entries
-    rate_limit_store[identifier] = [
-        timestamp for timestamp in rate_limit_store[identifier]
-        if now - timestamp < window
-    ]
-    
-    if len(rate_limit_store[identifier]) >= limit:
-        oldest = rate_limit_store[identifier][0]
-        wait_time = int(window - (now - oldest))
+    allowed, retry_after = await rate_limiter.hit(identifier, limit, window, time())
+    if not allowed:
+        wait_time = math.ceil(retry_after)
         raise HTTPException(
             status_code=429,
-            detail=f"Too many requests. Try again in {wait_time} seconds"
+            detail=f"Too many requests. Try again in {wait_time} seconds",
+            headers={"Retry-After": str(wait_time)}
         )
-    
-    rate_limit_store[identifier].append(now)
 
 
+# ===== DATABASE INDEXES =====
+from pymongo import ASCENDING, DESCENDING
+from pymongo.errors import OperationFailure
+
+# Declared indexes per collection: (keys, options). Names follow MongoDB's
+# default "<field>_<direction>" scheme so pre-existing indexes are recognised.
+INDEX_SPECS = {
+    "users": [
+        ([("id", ASCENDING)], {"unique": True}),
+        ([("username", ASCENDING)], {"unique": True}),
+        ([("email", ASCENDING)], {"unique": True}),
+        ([("points", DESCENDING)], {}),
+    ],
+    "challenges": [
+        ([("id", ASCENDING)], {"unique": True}),
+        ([("category", ASCENDING), ("difficulty", ASCENDING)], {}),
+    ],
+    "challenge_attempts": [
+        ([("user_id", ASCENDING), ("challenge_id", ASCENDING), ("is_completed", ASCENDING), ("timestamp", DESCENDING)], {}),
+        ([("timestamp", DESCENDING)], {}),
+        ([("user_id", ASCENDING), ("timestamp", DESCENDING)], {}),
+        ([("user_id", ASCENDING), ("challenge_id", ASCENDING)], {"unique": True, "partialFilterExpression": {"is_completed": True}}),
+    ],
+    "course_progress": [
+        ([("user_id", ASCENDING), ("course_id", ASCENDING)], {"unique": True}),
+    ],
+    "courses": [
+        ([("id", ASCENDING)], {"unique": True}),
+        ([("category", ASCENDING)], {}),
+    ],
+    "feedbacks": [
+        ([("challenge_id", ASCENDING), ("created_at", DESCENDING)], {}),
+        ([("created_at", DESCENDING)], {}),
+    ],
+    "education": [
+        ([("id", ASCENDING)], {"unique": True}),
+        ([("content_type", ASCENDING)], {}),
+    ],
+    "password_resets": [
+        ([("email", ASCENDING), ("code", ASCENDING)], {}),
+    ],
+    "certificates": [
+        ([("id", ASCENDING)], {"unique": True}),
+        ([("user_id", ASCENDING), ("achievement_type", ASCENDING)], {}),
+    ],
+    "quiz_completions": [
+        ([("user_id", ASCENDING)], {"unique": True}),
+    ],
+    "minigame_completions": [
+        ([("user_id", ASCENDING), ("game_type", ASCENDING)], {"unique": True}),
+    ],
+    "minigame_scenarios": [
+        ([("id", ASCENDING)], {"unique": True}),
+        ([("game_type", ASCENDING)], {}),
+    ],
+    "quiz_questions": [
+        ([("id", ASCENDING)], {"unique": True}),
+        ([("category", ASCENDING), ("difficulty", ASCENDING)], {}),
+    ],
+    "daily_challenges": [
+        ([("date", ASCENDING)], {"unique": True}),
+    ],
+    "rate_limits": [
+        ([("expires_at", ASCENDING)], {"expireAfterSeconds": 0}),
+    ],
+    "badge_progress": [
+        ([("user_id", ASCENDING)], {"unique": True}),
+    ],
+    "user_badges": [
+        ([("user_id", ASCENDING), ("badge_id", ASCENDING)], {"unique": True}),
+    ],
+    "hints": [
+        ([("user_id", ASCENDING), ("challenge_id", ASCENDING)], {}),
+    ],
+}
+
+def index_name(keys) -> str:
+    return "_".join(f"{field}_{direction}" for field, direction in keys)
+
+# Options that change what an index enforces; compared against the live index
+COMPARED_INDEX_OPTIONS = ("unique", "partialFilterExpression", "expireAfterSeconds")
+
+def index_differences(keys, options: dict, info: dict) -> dict:
+    """Declared vs live values for every semantic difference of one index"""
+    differences = {}
+    live_keys = [(field, int(direction)) for field, direction in info.get("key", [])]
+    if live_keys != [(field, int(direction)) for field, direction in keys]:
+        differences["key"] = {"expected": keys, "actual": live_keys}
+    for option in COMPARED_INDEX_OPTIONS:
+        expected = options.get(option, False if option == "unique" else None)
+        actual = info.get(option, False if option == "unique" else None)
+        if isinstance(actual, dict):
+            actual = dict(actual)
+        if expected != actual:
+            differences[option] = {"expected": expected, "actual": actual}
+    return differences
+
+async def rebuild_index(collection, name: str, keys, options: dict, info: dict):
+    """Replace a same-named index whose options differ (create_index would raise
+    IndexOptionsConflict). The old definition is restored if the new one fails."""
+    previous = {k: v for k, v in info.items() if k not in ("v", "key", "ns")}
+    await collection.drop_index(name)
+    try:
+        await collection.create_index(keys, name=name, **options)
+    except OperationFailure:
+        await collection.create_index(info["key"], **previous)
+        raise
+
+async def ensure_indexes():
+    """Create every declared index and rebuild same-named ones with other options"""
+    failed = []
+    for collection, specs in INDEX_SPECS.items():
+        existing = await db[collection].index_information()
+        for keys, options in specs:
+            name = index_name(keys)
+            current = existing.get(name)
+            try:
+                if current is None:
+                    await db[collection].create_index(keys, name=name, **options)
+                elif index_differences(keys, options, current):
+                    logger.warning(f"Index {collection}.{name} differs from its declaration, rebuilding")
+                    await rebuild_index(db[collection], name, keys, options, current)
+            except OperationFailure as e:
+                # Duplicate data must not prevent boot; /admin/indexes reports what is left
+                logger.warning(f"Index {collection}.{name} not created: {e}")
+                failed.append(f"{collection}.{name}")
+    return failed
+
+async def get_index_report():
+    report = {}
+    for collection, specs in INDEX_SPECS.items():
+        existing = await db[collection].index_information()
+        declared = {index_name(keys) for keys, _ in specs}
+        present = set(existing) - {"_id_"}
+        mismatched = {}
+        for keys, options in specs:
+            name = index_name(keys)
+            if name in existing:
+                differences = index_differences(keys, options, existing[name])
+                if differences:
+                    mismatched[name] = differences
+        report[collection] = {
+            "missing": sorted(declared - present),
+            "mismatched": mismatched,
+            "extra": sorted(present - declared)
+        }
+    return report
+
+@api_router.get("/admin/indexes")
+async def get_indexes_status(admin_user: dict = Depends(require_admin)):
+    """Report declared indexes that are missing or differ from their declaration,
+    and undeclared indexes that exist"""
+    report = await get_index_report()
+    healthy = all(not r['missing'] and not r['mismatched'] for r in report.values())
+    return {"healthy": healthy, "collections": report}
+
+@api_router.post("/admin/indexes/sync")
+async def sync_indexes(admin_user: dict = Depends(require_admin)):
+    """Re-apply declared indexes, dropping and recreating mismatched ones"""
+    failed = await ensure_indexes()
+    return {"success": not failed, "failed": failed}
+
+
+# ===== ADMIN STATS COUNTERS =====
+STATS_ID = "totals"
+RECENT_ACTIVITY_SIZE = 10
+
+async def record_stat(counter: str, amount: int = 1, recent_field: Optional[str] = None, recent_doc: Optional[dict] = None,
+                      recent_docs: Optional[list] = None):
+    """$inc a dashboard counter and optionally push to its capped recent-activity ring buffer"""
+    update = {"$inc": {counter: amount}}
+    if recent_doc is not None:
+        recent_docs = [recent_doc]
+    if recent_field and recent_docs:
+        recent_docs = [{k: v for k, v in doc.items() if k != '_id'} for doc in recent_docs[-RECENT_ACTIVITY_SIZE:]]
+        update["$push"] = {recent_field: {"$each": recent_docs, "$slice": -RECENT_ACTIVITY_SIZE}}
+    result = await db.stats.update_one({"_id": STATS_ID}, update, upsert=True)
+    if result.upserted_id is not None:
+        # The document was missing (first boot, or removed by seed.py), so it now
+        # holds only this counter; rebuild the rest, which already includes this event
+        await recount_stats(overwrite=True)
+
+async def recount_stats(overwrite: bool = False):
+    """Rebuild the counters document from the collections (full scans, run rarely).
+
+    Without overwrite this only fills in a missing document, so concurrent workers
+    booting at the same time cannot clobber live counters.
+    """
+    if not overwrite and await db.stats.find_one({"_id": STATS_ID}, {"_id": 1}):
+        return
+    totals = {
+        "users": await db.users.count_documents({}),
+        "challenges": await db.challenges.count_documents({}),
+        "attempts": await db.challenge_attempts.count_documents({}),
+        "feedbacks": await db.feedbacks.count_documents({}),
+        "recent_attempts": list(reversed(await db.challenge_attempts.find(
+            {}, {"_id": 0}
+        ).sort("timestamp", -1).limit(RECENT_ACTIVITY_SIZE).to_list(RECENT_ACTIVITY_SIZE))),
+        "recent_feedbacks": list(reversed(await db.feedbacks.find(
+            {}, {"_id": 0}
+        ).sort("created_at", -1).limit(RECENT_ACTIVITY_SIZE).to_list(RECENT_ACTIVITY_SIZE)))
+    }
+    if overwrite:
+        await db.stats.update_one({"_id": STATS_ID}, {"$set": totals}, upsert=True)
+    else:
+        await db.stats.update_one({"_id": STATS_ID}, {"$setOnInsert": totals}, upsert=True)
+
 # ===== AUTH ROUTES =====
 @api_router.post("/auth/register")
 async def register(user_data: UserRegister):
     # Rate limiting by username
-    check_rate_limit(f"register_{user_data.username}", limit=3, window=3600)  # 3 attempts per hour
+    await check_rate_limit(f"register_{user_data.username}", limit=3, window=3600)  # 3 attempts per hour
     
     # Check if username exists
     existing = await db.users.find_one({"username": user_data.username})
@@ -343,10 +505,19 @@ async def register(user_data: UserRegister):
     )
     
     user_dict = user.model_dump()
-    user_dict['password'] = hash_password(user_data.password)
+    user_dict['password'] = await hash_password(user_data.password)
     user_dict['created_at'] = user_dict['created_at'].isoformat()
     
     await db.users.insert_one(user_dict)
+    await record_stat("users")
+    leaderboard.upsert({
+        "id": user.id,
+        "username": user.username,
+        "full_name": user.full_name,
+        "level": user.level,
+        "points": user.points,
+        "completed_count": 0
+    })
     
     token = create_access_token({"sub": user.id})
     return {"token": token, "user": user.model_dump()}
@@ -354,10 +525,10 @@ async def register(user_data: UserRegister):
 @api_router.post("/auth/login")
 async def login(login_data: UserLogin):
     # Rate limiting by username
-    check_rate_limit(f"login_{login_data.username}", limit=5, window=300)  # 5 attempts per 5 minutes
+    await check_rate_limit(f"login_{login_data.username}", limit=5, window=300)  # 5 attempts per 5 minutes
     
     user = await db.users.find_one({"username": login_data.username}, {"_id": 0})
-    if not user or not verify_password(login_data.password, user['password']):
+    if not user or not await verify_password(login_data.password, user['password']):
         raise HTTPException(status_code=401, detail="Username atau password salah")
     
     token = create_access_token({"sub": user['id']})
@@ -387,6 +558,7 @@ async def get_me(current_user: dict = Depends(get_current_user)):
                 "daily_challenge_completed": False
             }}
         )
+        user_cache.invalidate(current_user['id'])
         current_user['streak_days'] = new_streak
         current_user['last_active_date'] = today
         current_user['daily_challenge_completed'] = False
@@ -432,100 +604,390 @@ async def reset_password(request: ResetPasswordRequest):
         raise HTTPException(status_code=400, detail="Kode reset sudah expired")
     
     # Update password
-    hashed = hash_password(request.new_password)
-    await db.users.update_one(
+    hashed = await hash_password(request.new_password)
+    updated_user = await db.users.find_one_and_update(
         {"email": request.email},
-        {"$set": {"password": hashed}}
+        {"$set": {"password": hashed}},
+        projection={"id": 1}
     )
+    if updated_user:
+        user_cache.invalidate(updated_user['id'])
     
     # Delete used reset code
     await db.password_resets.delete_one({"_id": reset_record['_id']})
     
     return {"message": "Password berhasil direset"}
 
-# ===== CHALLENGE ROUTES =====
-@api_router.get("/challenges", response_model=List[Challenge])
-async def get_challenges(category: Optional[str] = None, difficulty: Optional[str] = None):
-    query = {}
-    if category:
-        query['category'] = category
-    if difficulty:
-        query['difficulty'] = difficulty
-    
-    challenges = await db.challenges.find(query, {"_id": 0}).to_list(1000)
-    for ch in challenges:
-        if isinstance(ch['created_at'], str):
-            ch['created_at'] = datetime.fromisoformat(ch['created_at'])
-    return challenges
+# ===== CHALLENGE CATALOG =====
+import base64
+from bisect import bisect_left, bisect_right, insort
+from pydantic import TypeAdapter, ValidationError
+from seed_content import load_snapshot
 
-@api_router.get("/challenges/{challenge_id}")
-async def get_challenge(challenge_id: str):
-    challenge = await db.challenges.find_one({"id": challenge_id}, {"_id": 0})
-    if not challenge:
-        raise HTTPException(status_code=404, detail="Challenge tidak ditemukan")
-    if isinstance(challenge['created_at'], str):
-        challenge['created_at'] = datetime.fromisoformat(challenge['created_at'])
-    return challenge
+CREATED_AT_ADAPTER = TypeAdapter(datetime)
 
-@api_router.post("/challenges/{challenge_id}/attempt")
-async def attempt_challenge(challenge_id: str, answer: dict, current_user: dict = Depends(get_current_user)):
-    challenge = await db.challenges.find_one({"id": challenge_id}, {"_id": 0})
-    if not challenge:
-        raise HTTPException(status_code=404, detail="Challenge tidak ditemukan")
-    
-    # Check if challenge already completed (SINGLE-PLAY RESTRICTION)
-    if challenge_id in current_user.get('completed_challenges', []):
-        # Get previous attempt
-        previous_attempt = await db.challenge_attempts.find_one(
-            {"user_id": current_user['id'], "challenge_id": challenge_id, "is_completed": True},
-            {"_id": 0},
-            sort=[("timestamp", -1)]
-        )
-        if previous_attempt:
-            raise HTTPException(
-                status_code=400,
-                detail={
-                    "message": "Challenge ini sudah pernah diselesaikan. Kamu hanya bisa menyelesaikan challenge sekali.",
-                    "previous_result": {
-                        "correct_count": previous_attempt['correct_count'],
-                        "total_questions": previous_attempt['total_questions'],
-                        "points_earned": previous_attempt['points_earned'],
-                        "time_taken_seconds": previous_attempt.get('time_taken_seconds'),
-                        "completed_at": previous_attempt['timestamp']
-                    }
+# Admin edits take a seeded document out of seed.py's control so re-seeding never reverts them
+SEED_DETACH = {"seed_managed": False}
+# Bookkeeping fields seed.py stores on documents; never part of API responses
+SEED_INTERNAL_FIELDS = ("content_hash", "seed_managed")
+
+CHALLENGE_FILTER_FIELDS = ("category", "difficulty", "cialdini_principle", "challenge_type")
+CHALLENGE_PAGE_LIMIT = 200
+
+def challenge_summary(challenge: dict) -> dict:
+    """Fields the challenge list cards need; questions and answers stay on /challenges/{id}"""
+    return {
+        "id": challenge['id'],
+        "title": challenge['title'],
+        "description": challenge['description'],
+        "category": challenge['category'],
+        "difficulty": challenge['difficulty'],
+        "cialdini_principle": challenge['cialdini_principle'],
+        "challenge_type": challenge['challenge_type'],
+        "points": challenge['points'],
+        "question_count": len(challenge['questions']),
+        "time_limit_seconds": challenge.get('time_limit_seconds'),
+        "created_at": challenge['created_at']
+    }
+
+def encode_cursor(created_at: str, challenge_id: str) -> str:
+    return base64.urlsafe_b64encode(f"{created_at}|{challenge_id}".encode()).decode()
+
+def decode_cursor(cursor: str) -> tuple:
+    try:
+        created_at, challenge_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Cursor tidak valid")
+    return created_at, challenge_id
+
+class ChallengeCatalog:
+    """In-memory snapshot of the challenges collection.
+
+    Rendered JSON bodies and their ETags are cached per filter so repeated list
+    requests cost neither a DB trip nor re-serialization. Admin challenge writes
+    call invalidate(); the TTL bounds staleness for writes made by other workers
+    or by the seed scripts.
+    """
+
+    def __init__(self, ttl_seconds: float = 60):
+        self.ttl_seconds = ttl_seconds
+        self.version = None
+        self._challenges = None
+        self._summaries = []
+        self._summary_keys = []
+        self._by_id = {}
+        self._bodies = {}
+        self._loaded_at = 0.0
+        self._generation = 0
+        self._lock = asyncio.Lock()
+        self._prevalidated = {}
+
+    def _fresh(self) -> bool:
+        return self._challenges is not None and monotonic() - self._loaded_at < self.ttl_seconds
+
+    def use_snapshot(self, snapshot: dict):
+        """Register the seed snapshot's pre-validated challenges by content_hash.
+
+        Seeded rows carrying a known content_hash skip model validation on load;
+        only their id and created_at come from the database.
+        """
+        self._prevalidated = {
+            doc['content_hash']: {k: v for k, v in doc.items() if k != 'content_hash'}
+            for docs in snapshot['packs'].get('challenges', {}).values()
+            for doc in docs
+        }
+
+    def _validated(self, doc: dict) -> dict:
+        known = self._prevalidated.get(doc.get('content_hash'))
+        if known is not None and 'id' in doc and 'created_at' in doc:
+            created_at = CREATED_AT_ADAPTER.validate_python(doc['created_at'])
+            return {"id": doc['id'], **known, "created_at": CREATED_AT_ADAPTER.dump_python(created_at, mode="json")}
+        return Challenge.model_validate(doc).model_dump(mode="json")
+
+    async def _ensure_loaded(self):
+        if self._fresh():
+            return
+        async with self._lock:
+            if self._fresh():
+                return
+            # Reload until no invalidate() lands mid-load, so callers never fall back
+            # to an empty catalog (and never cache an empty body under the new version)
+            while True:
+                generation = self._generation
+                docs = await db.challenges.find({}, {"_id": 0}).to_list(None)
+                challenges = []
+                for doc in docs:
+                    try:
+                        challenges.append(self._validated(doc))
+                    except ValueError as e:
+                        logger.warning(f"Skipping invalid challenge {doc.get('id')}: {e}")
+                if generation != self._generation:
+                    continue
+                self._challenges = challenges
+                # Summaries ordered by (created_at, id) so cursors stay stable across reloads
+                self._summaries = sorted(
+                    (challenge_summary(ch) for ch in challenges),
+                    key=lambda ch: (ch['created_at'], ch['id'])
+                )
+                self._summary_keys = [(ch['created_at'], ch['id']) for ch in self._summaries]
+                self._by_id = {
+                    doc['id']: {k: v for k, v in doc.items() if k not in SEED_INTERNAL_FIELDS}
+                    for doc in docs if 'id' in doc
                 }
-            )
-    
-    answers = answer.get('answers', [])
-    time_taken = answer.get('time_taken_seconds', 0)
-    is_daily = answer.get('is_daily_challenge', False)
-    
-    # Calculate correct answers
-    correct_count = 0
-    total_questions = len(challenge['questions'])
-    results = []
-    
-    for idx, (user_ans, question) in enumerate(zip(answers, challenge['questions'])):
-        is_correct = user_ans == question['correct_answer']
-        if is_correct:
-            correct_count += 1
-        results.append({
-            "question_index": idx,
-            "is_correct": is_correct,
-            "explanation": question['explanation']
-        })
+                version = hashlib.sha1(self.render_json(challenges)).hexdigest()[:16]
+                if version != self.version:
+                    # Unchanged content (a plain TTL reload) keeps the rendered/compressed bodies
+                    self._bodies = {}
+                    self.version = version
+                self._loaded_at = monotonic()
+                return
+
+    def invalidate(self):
+        self._generation += 1
+        self._challenges = None
+        self._by_id = {}
+
+    @staticmethod
+    def render_json(content) -> bytes:
+        return orjson.dumps(content)
+
+    async def list(self) -> List[dict]:
+        await self._ensure_loaded()
+        return self._challenges or []
+
+    async def get(self, challenge_id: str) -> Optional[dict]:
+        await self._ensure_loaded()
+        return self._by_id.get(challenge_id)
+
+    def _cached_body(self, key: tuple, build):
+        cached = self._bodies.get(key)
+        if cached is None:
+            if len(self._bodies) >= 512:
+                self._bodies.clear()
+            body = self.render_json(build())
+            etag = f'"{self.version}-{hashlib.sha1(body).hexdigest()[:12]}"'
+            cached = self._bodies[key] = (etag, CompressedBody(body, COMPRESSION_MIN_SIZE))
+        return cached
+
+    @staticmethod
+    def _matches(challenge: dict, filters: dict) -> bool:
+        return all(challenge[field] == value for field, value in filters.items() if value)
+
+    async def body(self, filters: dict):
+        """Return (etag, json bytes) for a filtered list of full challenges"""
+        await self._ensure_loaded()
+        return self._cached_body(
+            ("full",) + tuple(filters.get(f) for f in CHALLENGE_FILTER_FIELDS),
+            lambda: [ch for ch in (self._challenges or []) if self._matches(ch, filters)]
+        )
+
+    async def summary_page(self, filters: dict, cursor: Optional[str], limit: int):
+        """Return (etag, json bytes) for one page of challenge summaries after `cursor`"""
+        await self._ensure_loaded()
+
+        def build():
+            summaries = self._summaries
+            start = 0
+            if cursor:
+                start = bisect_right(self._summary_keys, decode_cursor(cursor))
+            items = []
+            next_cursor = None
+            for ch in summaries[start:]:
+                if not self._matches(ch, filters):
+                    continue
+                if len(items) == limit:
+                    last = items[-1]
+                    next_cursor = encode_cursor(last['created_at'], last['id'])
+                    break
+                items.append(ch)
+            return {"items": items, "next_cursor": next_cursor}
+
+        if cursor:
+            decode_cursor(cursor)  # reject malformed cursors before caching
+        return self._cached_body(
+            ("summary", cursor, limit) + tuple(filters.get(f) for f in CHALLENGE_FILTER_FIELDS),
+            build
+        )
+
+challenge_catalog = ChallengeCatalog(
+    ttl_seconds=float(os.environ.get('CHALLENGE_CATALOG_TTL', 60))
+)
+
+def etag_response(request: Request, etag: str, body: CompressedBody) -> Response:
+    """Serve a cached JSON body in the negotiated encoding, or 304 when the client already has it"""
+    content, encoding = body.encoded(negotiate_encoding(request.headers.get("accept-encoding", "")))
+    headers = {"Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+    if encoding:
+        headers["Content-Encoding"] = encoding
+        headers["ETag"] = f'{etag[:-1]}-{encoding}"'
+    else:
+        headers["ETag"] = etag
+    if_none_match = request.headers.get("if-none-match", "")
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    if etag in tags or headers["ETag"] in tags or if_none_match.strip() == "*":
+        return Response(status_code=304, headers=headers)
+    return Response(content=content, media_type="application/json", headers=headers)
+
+class BodyCache:
+    """Rendered JSON bodies for mostly-static routes, keyed by (namespace, *params).
+
+    Each entry keeps its ETag and a CompressedBody, so gzip/brotli variants are
+    built once per snapshot. Admin writes call invalidate(namespace); the TTL
+    bounds staleness for writes made by other workers.
+    """
+
+    def __init__(self, ttl_seconds: float = 60, max_entries: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries = {}
+        self._generations = {}
+
+    async def get(self, key: tuple, load):
+        """Return (etag, CompressedBody), calling `await load()` on a miss"""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > monotonic():
+            return entry[1], entry[2]
+        generation = self._generations.get(key[0], 0)
+        raw = orjson.dumps(await load())
+        etag = f'"{hashlib.sha1(raw).hexdigest()[:16]}"'
+        body = CompressedBody(raw, COMPRESSION_MIN_SIZE)
+        if generation == self._generations.get(key[0], 0):
+            if len(self._entries) >= self.max_entries:
+                self._entries.clear()
+            self._entries[key] = (monotonic() + self.ttl_seconds, etag, body)
+        return etag, body
+
+    def invalidate(self, namespace: str):
+        self._generations[namespace] = self._generations.get(namespace, 0) + 1
+        for key in [k for k in self._entries if k[0] == namespace]:
+            del self._entries[key]
+
+body_cache = BodyCache(ttl_seconds=float(os.environ.get('CONTENT_CACHE_TTL', 60)))
+
+# ===== GRADING ENGINE =====
+import operator
+from typing import NamedTuple, Tuple
+
+class ChallengeKey(NamedTuple):
+    correct: Tuple[int, ...]
+    explanations: Tuple[str, ...]
+    points: int
+    time_limit: int
+    category: str
+    tips: Tuple[str, ...]
+
+class QuizKey(NamedTuple):
+    correct: Tuple[int, ...]
+    passing_score: int
+    title: str
+
+def count_correct(answers: list, correct: tuple) -> Tuple[int, list]:
+    """Element-wise comparison of submitted answers against an answer key"""
+    matches = list(map(operator.eq, answers, correct))
+    return matches.count(True), matches
+
+class GradingEngine:
+    """Compact answer keys compiled from content, so grading never fetches full documents.
+
+    Challenge keys are compiled in one pass per challenge catalog version (any
+    catalog reload with changed content recompiles them). Course quiz keys are
+    compiled per course on first use and expire after `ttl_seconds`. Admin edits
+    call invalidate()/invalidate_course(). Challenges missing from the catalog
+    (failed validation, or created on another worker) are keyed from the database.
+    """
+
+    def __init__(self, ttl_seconds: float = 60):
+        self.ttl_seconds = ttl_seconds
+        self._challenge_keys = {}
+        self._challenge_version = None
+        self._quiz_keys = {}
+
+    @staticmethod
+    def compile_challenge_key(ch: dict) -> ChallengeKey:
+        return ChallengeKey(
+            correct=tuple(q['correct_answer'] for q in ch['questions']),
+            explanations=tuple(q.get('explanation', '') for q in ch['questions']),
+            points=ch.get('points', 0),
+            time_limit=ch.get('time_limit_seconds') or 300,
+            category=ch.get('category', ''),
+            tips=tuple(ch.get('tips') or [])
+        )
+
+    async def challenge_key(self, challenge_id: str) -> Optional[ChallengeKey]:
+        challenges = await challenge_catalog.list()
+        # An empty catalog never replaces a compiled table; compile again next time
+        if challenges and self._challenge_version != challenge_catalog.version:
+            self._challenge_keys = {
+                ch['id']: self.compile_challenge_key(ch) for ch in challenges if ch['questions']
+            }
+            self._challenge_version = challenge_catalog.version
+        key = self._challenge_keys.get(challenge_id)
+        if key is None:
+            key = await self._uncatalogued_key(challenge_id)
+        return key
+
+    async def _uncatalogued_key(self, challenge_id: str) -> Optional[ChallengeKey]:
+        """Key for a challenge the catalog skipped (it failed model validation)"""
+        ch = await db.challenges.find_one(
+            {"id": challenge_id},
+            {"_id": 0, "questions.correct_answer": 1, "questions.explanation": 1, "points": 1,
+             "time_limit_seconds": 1, "category": 1, "tips": 1}
+        )
+        if not ch or not ch.get('questions'):
+            return None
+        logger.warning(f"Grading challenge {challenge_id} from the database: it is missing from the catalog")
+        try:
+            return self.compile_challenge_key(ch)
+        except (KeyError, TypeError):
+            return None
+
+    async def quiz_key(self, course_id: str) -> Optional[QuizKey]:
+        cached = self._quiz_keys.get(course_id)
+        if cached is not None and cached[0] > monotonic():
+            return cached[1]
+        course = await db.courses.find_one(
+            {"id": course_id},
+            {"_id": 0, "title": 1, "passing_score": 1, "quiz_questions.correct_answer": 1}
+        )
+        if not course:
+            return None
+        key = QuizKey(
+            correct=tuple(q['correct_answer'] for q in course.get('quiz_questions', [])),
+            passing_score=course.get('passing_score', 70),
+            title=course['title']
+        )
+        self._quiz_keys[course_id] = (monotonic() + self.ttl_seconds, key)
+        return key
+
+    def invalidate(self):
+        self._challenge_version = None
+
+    def invalidate_course(self, course_id: Optional[str] = None):
+        if course_id is None:
+            self._quiz_keys.clear()
+        else:
+            self._quiz_keys.pop(course_id, None)
+
+grading_engine = GradingEngine(ttl_seconds=float(os.environ.get('CONTENT_CACHE_TTL', 60)))
+
+def grade_challenge(key: ChallengeKey, answers: list, time_taken) -> dict:
+    """Score one attempt: per-question results plus points with the speed bonus"""
+    total_questions = len(key.correct)
+    correct_count, matches = count_correct(answers, key.correct)
+    results = [
+        {"question_index": idx, "is_correct": is_correct, "explanation": key.explanations[idx]}
+        for idx, is_correct in enumerate(matches)
+    ]
     
     # Calculate points with TIME BONUS
-    base_points = challenge['points']
-    points_per_question = base_points / total_questions
-    earned_points = correct_count * points_per_question
+    earned_points = correct_count * (key.points / total_questions)
     
     # Time bonus calculation
-    time_limit = challenge.get('time_limit_seconds', 300)
+    time_limit = key.time_limit
     time_bonus = 0
     speed_multiplier = 1.0
     
-    if time_taken > 0 and time_taken < time_limit:
+    if time_taken and 0 < time_taken < time_limit:
         # Speed bonus: finish under 50% time = 1.5x, under 30% = 2x
         time_ratio = time_taken / time_limit
         if time_ratio < 0.3:
@@ -538,15 +1000,83 @@ async def attempt_challenge(challenge_id: str, answer: dict, current_user: dict
             speed_multiplier = 1.2
             time_bonus = int(earned_points * 0.2)  # 20% bonus
     
-    final_points = int(earned_points + time_bonus)
+    return {
+        "correct_count": correct_count,
+        "total_questions": total_questions,
+        "is_completed": correct_count == total_questions,
+        "points_earned": int(earned_points + time_bonus),
+        "time_bonus": time_bonus,
+        "speed_multiplier": speed_multiplier,
+        "results": results
+    }
+
+# ===== CHALLENGE ROUTES =====
+@api_router.get("/challenges", response_model=Union[List[Challenge], ChallengeSummaryPage])
+async def get_challenges(
+    request: Request,
+    category: Optional[str] = None,
+    difficulty: Optional[str] = None,
+    cialdini_principle: Optional[str] = None,
+    challenge_type: Optional[str] = None,
+    view: str = "full",
+    cursor: Optional[str] = None,
+    limit: int = 50
+):
+    """List challenges. view=summary returns {items, next_cursor} pages without questions."""
+    filters = {
+        "category": category,
+        "difficulty": difficulty,
+        "cialdini_principle": cialdini_principle,
+        "challenge_type": challenge_type
+    }
+    if view == "summary":
+        limit = max(1, min(limit, CHALLENGE_PAGE_LIMIT))
+        etag, body = await challenge_catalog.summary_page(filters, cursor, limit)
+    elif view == "full":
+        etag, body = await challenge_catalog.body(filters)
+    else:
+        raise HTTPException(status_code=400, detail="view harus 'full' atau 'summary'")
+    return etag_response(request, etag, body)
+
+@api_router.get("/challenges/{challenge_id}")
+async def get_challenge(challenge_id: str):
+    challenge = await challenge_catalog.get(challenge_id)
+    if not challenge:
+        raise HTTPException(status_code=404, detail="Challenge tidak ditemukan")
+    return ORJSONResponse(challenge)
+
+@api_router.post("/challenges/{challenge_id}/attempt")
+async def attempt_challenge(challenge_id: str, answer: dict, current_user: dict = Depends(get_current_user)):
+    key = await grading_engine.challenge_key(challenge_id)
+    if not key:
+        raise HTTPException(status_code=404, detail="Challenge tidak ditemukan")
+    
+    # Check if challenge already completed (SINGLE-PLAY RESTRICTION).
+    # This is only the fast path; the unique completion index is what enforces it.
+    if challenge_id in current_user.get('completed_challenges', []):
+        await raise_if_challenge_completed(current_user['id'], challenge_id)
+    
+    answers = answer.get('answers', [])
+    time_taken = answer.get('time_taken_seconds', 0)
+    is_daily = answer.get('is_daily_challenge', False)
+    
+    graded = grade_challenge(key, answers, time_taken)
+    correct_count = graded['correct_count']
+    total_questions = graded['total_questions']
+    results = graded['results']
+    time_bonus = graded['time_bonus']
+    speed_multiplier = graded['speed_multiplier']
+    final_points = graded['points_earned']
     
-    # Daily challenge bonus (2x points)
+    # Daily challenge bonus (2x points), claimed at most once per day
     if is_daily and not current_user.get('daily_challenge_completed', False):
-        final_points = final_points * 2
-        await db.users.update_one(
-            {"id": current_user['id']},
+        claimed = await db.users.update_one(
+            {"id": current_user['id'], "daily_challenge_completed": {"$ne": True}},
             {"$set": {"daily_challenge_completed": True}}
         )
+        user_cache.invalidate(current_user['id'])
+        if claimed.modified_count:
+            final_points = final_points * 2
     
     is_completed = correct_count == total_questions
     
@@ -563,31 +1093,23 @@ async def attempt_challenge(challenge_id: str, answer: dict, current_user: dict
     )
     attempt_dict = attempt.model_dump()
     attempt_dict['timestamp'] = attempt_dict['timestamp'].isoformat()
-    await db.challenge_attempts.insert_one(attempt_dict)
-    
-    # Update user progress if completed and not already completed
-    if is_completed and challenge_id not in current_user.get('completed_challenges', []):
-        new_points = current_user.get('points', 0) + final_points
-        completed = current_user.get('completed_challenges', [])
-        completed.append(challenge_id)
-        
-        # Update level based on points
-        level = "Beginner"
-        if new_points >= 1000:
-            level = "Expert"
-        elif new_points >= 500:
-            level = "Advanced"
-        elif new_points >= 200:
-            level = "Intermediate"
-        
-        await db.users.update_one(
-            {"id": current_user['id']},
-            {"$set": {
-                "points": new_points,
-                "completed_challenges": completed,
-                "level": level
-            }}
+    try:
+        await db.challenge_attempts.insert_one(attempt_dict)
+    except DuplicateKeyError:
+        # A parallel request completed this challenge first
+        await raise_if_challenge_completed(current_user['id'], challenge_id)
+        raise
+    await record_stat("attempts", recent_field="recent_attempts", recent_doc=attempt_dict)
+    
+    # Award points once: the filter skips users who already have this challenge
+    new_badges = []
+    if is_completed:
+        awarded = await apply_user_score(
+            {"id": current_user['id'], "completed_challenges": {"$ne": challenge_id}},
+            challenge_completion_update(challenge_id, final_points)
         )
+        if awarded:
+            new_badges = await badge_engine.challenge_completed(current_user['id'], key.category, time_taken)
     
     return {
         "correct_count": correct_count,
@@ -597,15 +1119,328 @@ async def attempt_challenge(challenge_id: str, answer: dict, current_user: dict
         "time_bonus": time_bonus,
         "speed_multiplier": speed_multiplier,
         "results": results,
-        "tips": challenge['tips']
+        "tips": list(key.tips),
+        "new_badges": new_badges
+    }
+
+BATCH_ATTEMPT_LIMIT = 50
+
+@api_router.post("/challenges/attempts/batch")
+async def attempt_challenges_batch(payload: dict, current_user: dict = Depends(get_current_user)):
+    """Submit many attempts at once (offline/slow clients).
+
+    Items are graded against the challenge catalog, stored with one insert_many and
+    scored with one atomic user update. The daily-challenge bonus is only available
+    through the single-attempt endpoint.
+    """
+    items = payload.get('attempts')
+    if not isinstance(items, list) or not items:
+        raise HTTPException(status_code=400, detail="attempts harus berupa list yang tidak kosong")
+    if len(items) > BATCH_ATTEMPT_LIMIT:
+        raise HTTPException(status_code=400, detail=f"Maksimal {BATCH_ATTEMPT_LIMIT} attempt per batch")
+    
+    user_id = current_user['id']
+    completed = set(current_user.get('completed_challenges', []))
+    results = []
+    attempts = []  # (result index, attempt doc, answer key)
+    for index, raw_item in enumerate(items):
+        try:
+            item = BatchAttemptItem.model_validate(raw_item)
+        except ValidationError as e:
+            results.append({
+                "index": index,
+                "challenge_id": raw_item.get('challenge_id') if isinstance(raw_item, dict) else None,
+                "status": "invalid",
+                "errors": [
+                    {"field": ".".join(str(part) for part in error['loc']), "message": error['msg']}
+                    for error in e.errors()
+                ]
+            })
+            continue
+        challenge_id = item.challenge_id
+        key = await grading_engine.challenge_key(challenge_id)
+        if not key:
+            results.append({"index": index, "challenge_id": challenge_id, "status": "not_found"})
+            continue
+        if challenge_id in completed:
+            results.append({"index": index, "challenge_id": challenge_id, "status": "already_completed"})
+            continue
+        
+        answers = item.answers
+        time_taken = item.time_taken_seconds
+        graded = grade_challenge(key, answers, time_taken)
+        if graded['is_completed']:
+            completed.add(challenge_id)  # later duplicates in this batch are rejected
+        attempt = ChallengeAttempt(
+            user_id=user_id,
+            challenge_id=challenge_id,
+            answers=answers,
+            correct_count=graded['correct_count'],
+            total_questions=graded['total_questions'],
+            is_completed=graded['is_completed'],
+            points_earned=graded['points_earned'],
+            time_taken_seconds=time_taken
+        ).model_dump()
+        attempt['timestamp'] = attempt['timestamp'].isoformat()
+        attempts.append((len(results), attempt, key))
+        results.append({
+            "index": index,
+            "challenge_id": challenge_id,
+            "status": "graded",
+            **graded,
+            "points_awarded": False,
+            "tips": list(key.tips)
+        })
+    
+    # One write for every attempt; completions that raced another request hit the unique index
+    rejected = set()
+    if attempts:
+        try:
+            await db.challenge_attempts.insert_many([doc for _, doc, _ in attempts], ordered=False)
+        except BulkWriteError as e:
+            for error in e.details.get('writeErrors', []):
+                if error.get('code') != 11000:
+                    raise
+                rejected.add(error['index'])
+        for position in rejected:
+            result = results[attempts[position][0]]
+            for field in list(result):
+                if field not in ("index", "challenge_id"):
+                    del result[field]
+            result["status"] = "already_completed"
+        stored = [doc for position, (_, doc, _) in enumerate(attempts) if position not in rejected]
+        if stored:
+            await record_stat("attempts", amount=len(stored), recent_field="recent_attempts", recent_docs=stored)
+    
+    # One atomic user update for all completions; retried without any that completed elsewhere
+    to_award = [
+        (result_index, doc, key) for position, (result_index, doc, key) in enumerate(attempts)
+        if position not in rejected and doc['is_completed']
+    ]
+    new_badges = []
+    for _ in range(3):
+        if not to_award:
+            break
+        ids = [doc['challenge_id'] for _, doc, _ in to_award]
+        awarded = await apply_user_score(
+            {"id": user_id, "completed_challenges": {"$nin": ids}},
+            challenges_completion_update(ids, sum(doc['points_earned'] for _, doc, _ in to_award))
+        )
+        if awarded:
+            for result_index, _, _ in to_award:
+                results[result_index]["points_awarded"] = True
+            new_badges = await badge_engine.challenges_completed(
+                user_id, [(key.category, doc['time_taken_seconds']) for _, doc, key in to_award]
+            )
+            break
+        fresh = await db.users.find_one({"id": user_id}, {"_id": 0, "completed_challenges": 1}) or {}
+        already = set(fresh.get('completed_challenges', []))
+        to_award = [entry for entry in to_award if entry[1]['challenge_id'] not in already]
+    
+    return {
+        "results": results,
+        "points_earned": sum(r['points_earned'] for r in results if r.get('points_awarded')),
+        "new_badges": new_badges
     }
 
+# ===== LEADERBOARD ENGINE =====
+
+LEADERBOARD_PROJECTION = {
+    "_id": 0,
+    "id": 1,
+    "username": 1,
+    "full_name": 1,
+    "level": 1,
+    "points": 1,
+    "completed_count": {"$size": {"$ifNull": ["$completed_challenges", []]}}
+}
+
+class LeaderboardService:
+    """Points-ordered index of users kept in memory.
+
+    `_keys` is a sorted list of (-points, user_id) so rank and window lookups are an
+    O(log n) bisect; `_entries` holds the small public profile shown on the board.
+    upsert/remove are O(n): the bisect is logarithmic but inserting into or deleting
+    from a Python list shifts the tail. That memmove costs tens of microseconds at
+    100k users, so a plain list is kept instead of a sorted-container dependency.
+    Each worker rebuilds from the users.points index periodically to pick up other
+    workers' writes.
+    """
+
+    def __init__(self, refresh_seconds: float = 300):
+        self.refresh_seconds = refresh_seconds
+        self._keys = []
+        self._entries = {}
+        self._refresh_task = None
+
+    async def load(self):
+        keys, entries = [], {}
+        cursor = db.users.aggregate([
+            {"$sort": {"points": -1}},
+            {"$project": LEADERBOARD_PROJECTION}
+        ])
+        async for doc in cursor:
+            doc['points'] = doc.get('points', 0)
+            entries[doc['id']] = doc
+            keys.append((-doc['points'], doc['id']))
+        keys.sort()
+        self._keys, self._entries = keys, entries
+
+    async def _refresh_loop(self):
+        while True:
+            await asyncio.sleep(self.refresh_seconds)
+            try:
+                await self.load()
+            except Exception as e:
+                logger.warning(f"Leaderboard refresh failed: {e}")
+
+    def start(self):
+        if self._refresh_task is None and self.refresh_seconds > 0:
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    def stop(self):
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+
+    def upsert(self, entry: dict):
+        user_id = entry['id']
+        self.remove(user_id)
+        entry['points'] = entry.get('points', 0)
+        self._entries[user_id] = entry
+        insort(self._keys, (-entry['points'], user_id))
+
+    def remove(self, user_id: str):
+        old = self._entries.pop(user_id, None)
+        if old is not None:
+            idx = bisect_left(self._keys, (-old['points'], user_id))
+            if idx < len(self._keys) and self._keys[idx][1] == user_id:
+                del self._keys[idx]
+
+    async def refresh_user(self, user_id: str):
+        """Re-read one user's board entry after a write to points/profile/completions"""
+        docs = await db.users.aggregate([
+            {"$match": {"id": user_id}},
+            {"$project": LEADERBOARD_PROJECTION}
+        ]).to_list(1)
+        if docs:
+            self.upsert(docs[0])
+        else:
+            self.remove(user_id)
+
+    def _ranked(self, start: int, end: int) -> List[dict]:
+        return [
+            {**self._entries[user_id], "rank": self.rank_of_points(-neg_points)}
+            for neg_points, user_id in self._keys[max(0, start):end]
+        ]
+
+    @property
+    def size(self) -> int:
+        return len(self._keys)
+
+    def rank_of_points(self, points: int) -> int:
+        # Competition ranking: users with equal points share a rank
+        return bisect_left(self._keys, (-points,)) + 1
+
+    def top(self, n: int) -> List[dict]:
+        return self._ranked(0, n)
+
+    def around(self, user_id: str, window: int) -> Optional[dict]:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        position = bisect_left(self._keys, (-entry['points'], user_id))
+        return {
+            "rank": self.rank_of_points(entry['points']),
+            "points": entry['points'],
+            "total_users": len(self._keys),
+            "around": self._ranked(position - window, position + window + 1)
+        }
+
+leaderboard = LeaderboardService(
+    refresh_seconds=float(os.environ.get('LEADERBOARD_REFRESH_SECONDS', 300))
+)
+
 # ===== LEADERBOARD =====
 @api_router.get("/leaderboard")
-async def get_leaderboard():
-    users = await db.users.find({}, {"_id": 0, "password": 0}).to_list(1000)
-    sorted_users = sorted(users, key=lambda x: x.get('points', 0), reverse=True)[:10]
-    return sorted_users
+async def get_leaderboard(limit: int = 10):
+    limit = max(1, min(limit, 100))
+    return ORJSONResponse(leaderboard.top(limit))
+
+@api_router.get("/leaderboard/me")
+async def get_my_rank(window: int = 5, current_user: dict = Depends(get_current_user)):
+    window = max(0, min(window, 50))
+    result = leaderboard.around(current_user['id'], window)
+    if result is None:
+        await leaderboard.refresh_user(current_user['id'])
+        result = leaderboard.around(current_user['id'], window)
+    if result is None:
+        raise HTTPException(status_code=404, detail="User tidak ditemukan di leaderboard")
+    return ORJSONResponse(result)
+
+# ===== SCORING =====
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+LEVEL_EXPRESSION = {
+    "$switch": {
+        "branches": [
+            {"case": {"$gte": ["$points", 1000]}, "then": "Expert"},
+            {"case": {"$gte": ["$points", 500]}, "then": "Advanced"},
+            {"case": {"$gte": ["$points", 200]}, "then": "Intermediate"},
+        ],
+        "default": "Beginner"
+    }
+}
+
+def challenge_completion_update(challenge_id: str, points: int) -> list:
+    """Pipeline update adding points, recording the challenge and recomputing level in one write"""
+    return challenges_completion_update([challenge_id], points)
+
+def challenges_completion_update(challenge_ids: List[str], points: int) -> list:
+    return [
+        {"$set": {
+            "points": {"$add": [{"$ifNull": ["$points", 0]}, points]},
+            "completed_challenges": {"$concatArrays": [{"$ifNull": ["$completed_challenges", []]}, list(challenge_ids)]}
+        }},
+        {"$set": {"level": LEVEL_EXPRESSION}}
+    ]
+
+async def apply_user_score(user_filter: dict, update) -> Optional[dict]:
+    """Apply an atomic scoring update and push the result to the user cache and leaderboard.
+
+    Returns the updated leaderboard entry, or None when the filter did not match.
+    """
+    doc = await db.users.find_one_and_update(
+        user_filter,
+        update,
+        projection=LEADERBOARD_PROJECTION,
+        return_document=ReturnDocument.AFTER
+    )
+    if doc:
+        user_cache.invalidate(doc['id'])
+        leaderboard.upsert(doc)
+    return doc
+
+async def raise_if_challenge_completed(user_id: str, challenge_id: str):
+    previous_attempt = await db.challenge_attempts.find_one(
+        {"user_id": user_id, "challenge_id": challenge_id, "is_completed": True},
+        {"_id": 0},
+        sort=[("timestamp", -1)]
+    )
+    if previous_attempt:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "message": "Challenge ini sudah pernah diselesaikan. Kamu hanya bisa menyelesaikan challenge sekali.",
+                "previous_result": {
+                    "correct_count": previous_attempt['correct_count'],
+                    "total_questions": previous_attempt['total_questions'],
+                    "points_earned": previous_attempt['points_earned'],
+                    "time_taken_seconds": previous_attempt.get('time_taken_seconds'),
+                    "completed_at": previous_attempt['timestamp']
+                }
+            }
+        )
 
 # ===== CHALLENGE FEEDBACK =====
 @api_router.post("/challenges/{challenge_id}/feedback")
@@ -625,30 +1460,42 @@ async def add_feedback(challenge_id: str, feedback_data: dict, current_user: dic
     feedback_dict = feedback.model_dump()
     feedback_dict['created_at'] = feedback_dict['created_at'].isoformat()
     await db.feedbacks.insert_one(feedback_dict)
+    await record_stat("feedbacks", recent_field="recent_feedbacks", recent_doc=feedback_dict)
     
     return {"message": "Feedback berhasil dikirim"}
 
 @api_router.get("/challenges/{challenge_id}/feedback")
 async def get_feedback(challenge_id: str):
     feedbacks = await db.feedbacks.find({"challenge_id": challenge_id}, {"_id": 0}).sort("created_at", -1).to_list(100)
-    for fb in feedbacks:
-        if isinstance(fb['created_at'], str):
-            fb['created_at'] = datetime.fromisoformat(fb['created_at'])
-    return feedbacks
+    return ORJSONResponse(feedbacks)
 
 # ===== USER PROGRESS =====
 @api_router.get("/progress")
 async def get_progress(current_user: dict = Depends(get_current_user)):
-    total_challenges = await db.challenges.count_documents({})
-    completed = len(current_user.get('completed_challenges', []))
-    attempts = await db.attempts.find({"user_id": current_user['id']}, {"_id": 0}).to_list(1000)
+    # Totals and per-category completion come from the in-memory catalog and the
+    # cached user; the only round trip is the indexed (user_id, timestamp) query.
+    challenges = await challenge_catalog.list()
+    completed_ids = set(current_user.get('completed_challenges', []))
+    
+    per_category = {}
+    for ch in challenges:
+        entry = per_category.setdefault(ch['category'], {"completed": 0, "total": 0})
+        entry['total'] += 1
+        if ch['id'] in completed_ids:
+            entry['completed'] += 1
+    
+    recent_attempts = await db.challenge_attempts.find(
+        {"user_id": current_user['id']},
+        {"_id": 0}
+    ).sort("timestamp", -1).limit(5).to_list(5)
     
     return {
-        "total_challenges": total_challenges,
-        "completed_challenges": completed,
+        "total_challenges": len(challenges),
+        "completed_challenges": len(completed_ids),
         "points": current_user.get('points', 0),
         "level": current_user.get('level', 'Beginner'),
-        "recent_attempts": attempts[-5:] if len(attempts) > 5 else attempts
+        "per_category": per_category,
+        "recent_attempts": recent_attempts
     }
 
 
@@ -663,6 +1510,8 @@ async def update_user_profile(
         {"id": current_user['id']},
         {"$set": {"full_name": full_name, "email": email}}
     )
+    user_cache.invalidate(current_user['id'])
+    await leaderboard.refresh_user(current_user['id'])
     return {"message": "Profile updated successfully"}
 
 @api_router.put("/user/change-password")
@@ -672,31 +1521,38 @@ async def change_password(
     current_user: dict = Depends(get_current_user)
 ):
     # Verify current password
-    if not pwd_context.verify(current_password, current_user['password']):
+    if not await verify_password(current_password, current_user['password']):
         raise HTTPException(status_code=400, detail="Password saat ini salah")
     
     # Hash and update new password
-    hashed_password = pwd_context.hash(new_password)
+    hashed_password = await hash_password(new_password)
     await db.users.update_one(
         {"id": current_user['id']},
         {"$set": {"password": hashed_password}}
     )
+    user_cache.invalidate(current_user['id'])
     return {"message": "Password changed successfully"}
 
 
 # ===== EDUCATION CONTENT =====
 @api_router.get("/education", response_model=List[EducationContent])
-async def get_education_content(content_type: Optional[str] = None):
+async def get_education_content(request: Request, content_type: Optional[str] = None):
     query = {}
     if content_type:
         query['content_type'] = content_type
-    contents = await db.education.find(query, {"_id": 0}).to_list(1000)
-    return contents
+
+    async def load():
+        contents = await db.education.find(query, {"_id": 0}).to_list(1000)
+        return [EducationContent.model_validate(c).model_dump(mode="json") for c in contents]
+
+    etag, body = await body_cache.get(("education", content_type), load)
+    return etag_response(request, etag, body)
 
 @api_router.post("/admin/education")
 async def create_education(content: EducationContent, admin_user: dict = Depends(require_admin)):
     content_dict = content.model_dump()
     await db.education.insert_one(content_dict)
+    body_cache.invalidate("education")
     return content
 
 @api_router.put("/admin/education/{content_id}")
@@ -704,8 +1560,9 @@ async def update_education(content_id: str, content: EducationContent, admin_use
     content_dict = content.model_dump()
     result = await db.education.update_one(
         {"id": content_id},
-        {"$set": content_dict}
+        {"$set": {**content_dict, **SEED_DETACH}, "$unset": {"content_hash": ""}}
     )
+    body_cache.invalidate("education")
     
     if result.modified_count == 0:
         raise HTTPException(status_code=404, detail="Content tidak ditemukan")
@@ -715,37 +1572,130 @@ async def update_education(content_id: str, content: EducationContent, admin_use
 @api_router.delete("/admin/education/{content_id}")
 async def delete_education(content_id: str, admin_user: dict = Depends(require_admin)):
     result = await db.education.delete_one({"id": content_id})
+    body_cache.invalidate("education")
     
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Content tidak ditemukan")
     
     return {"message": "Content berhasil dihapus"}
 
+# ===== DAILY CHALLENGE SCHEDULER =====
+class DailyChallengeScheduler:
+    """Persisted date -> challenge assignments in `daily_challenges`.
+
+    Today's assignment is cached in-process until UTC midnight (or until its
+    challenge disappears), so serving the daily challenge is a dict lookup plus
+    a catalog lookup. New dates are assigned with an
+    upsert so every worker agrees on the first writer's choice.
+    """
+
+    def __init__(self):
+        self._date = None
+        self._challenge_id = None
+
+    @staticmethod
+    def pick(date: str, challenge_ids: List[str], exclude: set = frozenset()) -> Optional[str]:
+        # Sorted ids make the pick independent of the collection's natural order
+        ids = sorted(challenge_ids)
+        if not ids:
+            return None
+        start = int(hashlib.md5(date.encode()).hexdigest(), 16) % len(ids)
+        for offset in range(len(ids)):
+            candidate = ids[(start + offset) % len(ids)]
+            if candidate not in exclude:
+                return candidate
+        return ids[start]
+
+    async def _assign(self, date: str, challenge_id: str, replace: bool = False) -> str:
+        update = {"$set" if replace else "$setOnInsert": {"challenge_id": challenge_id}}
+        update.setdefault("$setOnInsert", {})["created_at"] = datetime.now(timezone.utc).isoformat()
+        doc = await db.daily_challenges.find_one_and_update(
+            {"date": date},
+            update,
+            upsert=True,
+            projection={"_id": 0, "challenge_id": 1},
+            return_document=ReturnDocument.AFTER
+        )
+        return doc['challenge_id']
+
+    async def challenge_id_for(self, date: str) -> Optional[str]:
+        # The cached pick is re-resolved once its challenge leaves the catalog
+        # (deleted here or, after the catalog TTL, by another worker)
+        if self._date == date and await challenge_catalog.get(self._challenge_id):
+            return self._challenge_id
+        assignment = await db.daily_challenges.find_one({"date": date}, {"_id": 0, "challenge_id": 1})
+        if assignment and await challenge_catalog.get(assignment['challenge_id']):
+            challenge_id = assignment['challenge_id']
+        else:
+            # Unassigned, or the assigned challenge was deleted
+            ids = [ch['id'] for ch in await challenge_catalog.list()]
+            picked = self.pick(date, ids)
+            if picked is None:
+                return None
+            challenge_id = await self._assign(date, picked, replace=assignment is not None)
+        self._date, self._challenge_id = date, challenge_id
+        return challenge_id
+
+    def invalidate(self):
+        self._date = None
+        self._challenge_id = None
+
+    async def pregenerate(self, start_date, days: int) -> List[dict]:
+        """Assign challenges for `days` days from start_date, avoiding repeats where possible"""
+        ids = [ch['id'] for ch in await challenge_catalog.list()]
+        dates = [(start_date + timedelta(days=i)).isoformat() for i in range(days)]
+        existing = {
+            doc['date']: doc['challenge_id']
+            async for doc in db.daily_challenges.find({"date": {"$in": dates}}, {"_id": 0})
+        }
+        used = set(existing.values())
+        schedule = []
+        for date in dates:
+            challenge_id = existing.get(date)
+            if challenge_id is None:
+                picked = self.pick(date, ids, exclude=used)
+                if picked is None:
+                    break
+                challenge_id = await self._assign(date, picked)
+                used.add(challenge_id)
+            schedule.append({"date": date, "challenge_id": challenge_id})
+        return schedule
+
+daily_scheduler = DailyChallengeScheduler()
+
 # ===== DAILY CHALLENGE =====
 @api_router.get("/daily-challenge")
 async def get_daily_challenge():
-    # Get a random challenge for today (same challenge for everyone today)
-    import hashlib
+    # Same challenge for everyone today, fixed by the persisted schedule
     today = datetime.now(timezone.utc).date().isoformat()
-    seed = int(hashlib.md5(today.encode()).hexdigest(), 16)
-    
-    all_challenges = await db.challenges.find({}, {"_id": 0}).to_list(1000)
-    if not all_challenges:
+    challenge_id = await daily_scheduler.challenge_id_for(today)
+    daily_challenge = await challenge_catalog.get(challenge_id) if challenge_id else None
+    if not daily_challenge:
         raise HTTPException(status_code=404, detail="Tidak ada challenge tersedia")
     
-    # Deterministic random based on date
-    daily_index = seed % len(all_challenges)
-    daily_challenge = all_challenges[daily_index]
-    
-    if isinstance(daily_challenge['created_at'], str):
-        daily_challenge['created_at'] = datetime.fromisoformat(daily_challenge['created_at'])
-    
     return {
         "challenge": daily_challenge,
         "bonus_multiplier": 2,
         "expires_in_hours": 24
     }
 
+@api_router.get("/admin/daily-challenges")
+async def get_daily_schedule(days: int = 28, admin_user: dict = Depends(require_admin)):
+    """Upcoming daily challenge assignments"""
+    today = datetime.now(timezone.utc).date().isoformat()
+    schedule = await db.daily_challenges.find(
+        {"date": {"$gte": today}},
+        {"_id": 0}
+    ).sort("date", 1).limit(max(1, min(days, 366))).to_list(None)
+    return schedule
+
+@api_router.post("/admin/daily-challenges/schedule")
+async def generate_daily_schedule(days: int = 28, admin_user: dict = Depends(require_admin)):
+    """Pre-generate a stable daily challenge schedule starting today"""
+    days = max(1, min(days, 366))
+    schedule = await daily_scheduler.pregenerate(datetime.now(timezone.utc).date(), days)
+    return {"success": True, "schedule": schedule}
+
 # ===== ADMIN ROUTES =====
 @api_router.post("/admin/challenges")
 async def create_challenge(challenge: Challenge, current_user: dict = Depends(get_current_user)):
@@ -755,6 +1705,9 @@ async def create_challenge(challenge: Challenge, current_user: dict = Depends(ge
     challenge_dict = challenge.model_dump()
     challenge_dict['created_at'] = challenge_dict['created_at'].isoformat()
     await db.challenges.insert_one(challenge_dict)
+    await record_stat("challenges")
+    challenge_catalog.invalidate()
+    grading_engine.invalidate()
     return challenge
 
 @api_router.put("/admin/challenges/{challenge_id}")
@@ -767,8 +1720,10 @@ async def update_challenge(challenge_id: str, challenge: Challenge, current_user
     
     result = await db.challenges.update_one(
         {"id": challenge_id},
-        {"$set": challenge_dict}
+        {"$set": {**challenge_dict, **SEED_DETACH}, "$unset": {"content_hash": ""}}
     )
+    challenge_catalog.invalidate()
+    grading_engine.invalidate()
     
     if result.modified_count == 0:
         raise HTTPException(status_code=404, detail="Challenge tidak ditemukan")
@@ -781,44 +1736,137 @@ async def delete_challenge(challenge_id: str, current_user: dict = Depends(get_c
         raise HTTPException(status_code=403, detail="Akses ditolak")
     
     result = await db.challenges.delete_one({"id": challenge_id})
+    challenge_catalog.invalidate()
+    grading_engine.invalidate()
+    daily_scheduler.invalidate()
+    if result.deleted_count:
+        await record_stat("challenges", -1)
     
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Challenge tidak ditemukan")
     
     return {"message": "Challenge berhasil dihapus"}
 
+@api_router.get("/admin/password-service")
+async def get_password_service_metrics(admin_user: dict = Depends(require_admin)):
+    """Queue depth and bcrypt latency of the password worker pool"""
+    return password_service.metrics()
+
+@api_router.get("/admin/user-cache")
+async def get_user_cache_stats(admin_user: dict = Depends(require_admin)):
+    """Hit/miss counters of the authenticated-user cache"""
+    return user_cache.stats()
+
 @api_router.get("/admin/users")
 async def get_all_users(admin_user: dict = Depends(require_admin)):
     users = await db.users.find({}, {"_id": 0, "password": 0}).to_list(1000)
-    return users
+    return ORJSONResponse(users)
 
 @api_router.get("/admin/stats")
 async def get_admin_stats(admin_user: dict = Depends(require_admin)):
-    total_users = await db.users.count_documents({})
-    total_challenges = await db.challenges.count_documents({})
-    total_attempts = await db.challenge_attempts.count_documents({})
-    total_feedbacks = await db.feedbacks.count_documents({})
-    
-    # Recent activity
-    recent_attempts = await db.challenge_attempts.find(
-        {}, 
-        {"_id": 0}
-    ).sort("timestamp", -1).limit(10).to_list(10)
-    
-    recent_feedbacks = await db.feedbacks.find(
-        {}, 
-        {"_id": 0}
-    ).sort("created_at", -1).limit(10).to_list(10)
+    # Single keyed read of the counters document maintained by record_stat
+    stats = await db.stats.find_one({"_id": STATS_ID}, {"_id": 0})
+    if stats is None:
+        await recount_stats()
+        stats = await db.stats.find_one({"_id": STATS_ID}, {"_id": 0}) or {}
     
     return {
-        "total_users": total_users,
-        "total_challenges": total_challenges,
-        "total_attempts": total_attempts,
-        "total_feedbacks": total_feedbacks,
-        "recent_attempts": recent_attempts,
-        "recent_feedbacks": recent_feedbacks
+        "total_users": stats.get('users', 0),
+        "total_challenges": stats.get('challenges', 0),
+        "total_attempts": stats.get('attempts', 0),
+        "total_feedbacks": stats.get('feedbacks', 0),
+        "recent_attempts": list(reversed(stats.get('recent_attempts', []))),
+        "recent_feedbacks": list(reversed(stats.get('recent_feedbacks', [])))
     }
 
+@api_router.post("/admin/stats/recount")
+async def recount_admin_stats(admin_user: dict = Depends(require_admin)):
+    """Rebuild counters from the collections, e.g. after running seed scripts"""
+    await recount_stats(overwrite=True)
+    return {"success": True}
+
+# ===== ADMIN: STREAMING EXPORT =====
+import csv
+import io
+
+# dataset -> (collection, exportable columns); `fields` may only pick from these,
+# so passwords and operator-like names such as "$where" never reach the projection
+EXPORT_DATASETS = {
+    "users": ("users", ["id", "username", "email", "full_name", "role", "points", "level",
+                        "completed_challenges", "streak_days", "last_active_date", "created_at"]),
+    "challenge_attempts": ("challenge_attempts", ["id", "user_id", "challenge_id", "answers", "correct_count",
+                                                  "total_questions", "is_completed", "points_earned",
+                                                  "time_taken_seconds", "timestamp"]),
+    "quiz_completions": ("quiz_completions", ["user_id", "correct_count", "total_questions", "points_earned",
+                                              "time_taken_seconds", "accuracy", "completed_at"]),
+    "minigame_completions": ("minigame_completions", ["user_id", "game_type", "score", "time_taken_seconds",
+                                                      "details", "completed_at"]),
+}
+
+def export_cell(value):
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, ensure_ascii=False, default=str)
+    return "" if value is None else value
+
+async def export_rows(cursor, fields: List[str], fmt: str, batch_size: int):
+    """Yield NDJSON or CSV bytes, one chunk per cursor batch, so memory stays constant"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer) if fmt == "csv" else None
+    if writer:
+        writer.writerow(fields)
+    rows = 0
+    async for doc in cursor:
+        if writer:
+            writer.writerow([export_cell(doc.get(field)) for field in fields])
+        else:
+            buffer.write(json.dumps({field: doc.get(field) for field in fields}, ensure_ascii=False, default=str))
+            buffer.write("\n")
+        rows += 1
+        if rows % batch_size == 0:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+@api_router.get("/admin/export/{dataset}")
+async def export_dataset(
+    dataset: str,
+    format: str = "ndjson",
+    fields: Optional[str] = None,
+    batch_size: int = 1000,
+    user_id: Optional[str] = None,
+    admin_user: dict = Depends(require_admin)
+):
+    """Stream users, challenge_attempts, quiz_completions or minigame_completions as NDJSON/CSV"""
+    if dataset not in EXPORT_DATASETS:
+        raise HTTPException(status_code=404, detail=f"Dataset tidak dikenal. Pilihan: {', '.join(EXPORT_DATASETS)}")
+    if format not in ("ndjson", "csv"):
+        raise HTTPException(status_code=400, detail="format harus 'ndjson' atau 'csv'")
+    
+    collection, allowed_fields = EXPORT_DATASETS[dataset]
+    selected = [f.strip() for f in fields.split(",") if f.strip()] if fields else allowed_fields
+    if not selected:
+        raise HTTPException(status_code=400, detail="Tidak ada field yang bisa diexport")
+    # Validate before streaming starts: once the 200 is sent an error can only truncate the file
+    unknown = [f for f in selected if f not in allowed_fields]
+    if unknown:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Field tidak dikenal: {', '.join(unknown)}. Pilihan: {', '.join(allowed_fields)}"
+        )
+    selected = list(dict.fromkeys(selected))
+    batch_size = max(1, min(batch_size, 10000))
+    
+    query = {"user_id": user_id} if user_id and dataset != "users" else {}
+    cursor = db[collection].find(query, {"_id": 0, **{f: 1 for f in selected}}, batch_size=batch_size)
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        export_rows(cursor, selected, format, batch_size),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{dataset}.{format}"'}
+    )
+
 @api_router.put("/admin/users/{user_id}")
 async def update_user_by_admin(
     user_id: str,
@@ -831,12 +1879,14 @@ async def update_user_by_admin(
     
     # Only update password if provided
     if password:
-        update_data["password"] = pwd_context.hash(password)
+        update_data["password"] = await hash_password(password)
     
     result = await db.users.update_one(
         {"id": user_id},
         {"$set": update_data}
     )
+    user_cache.invalidate(user_id)
+    await leaderboard.refresh_user(user_id)
     
     if result.modified_count == 0:
         raise HTTPException(status_code=404, detail="User tidak ditemukan")
@@ -850,6 +1900,10 @@ async def delete_user_by_admin(user_id: str, admin_user: dict = Depends(require_
         raise HTTPException(status_code=400, detail="Tidak bisa menghapus akun sendiri")
     
     result = await db.users.delete_one({"id": user_id})
+    user_cache.invalidate(user_id)
+    leaderboard.remove(user_id)
+    if result.deleted_count:
+        await record_stat("users", -1)
     
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="User tidak ditemukan")
@@ -868,19 +1922,16 @@ async def get_hint(challenge_id: str, hint_data: dict, current_user: dict = Depe
     if question_index >= len(challenge['questions']):
         raise HTTPException(status_code=400, detail="Question index invalid")
     
-    # Check if user has enough points
-    user_points = current_user.get('points', 0)
     hint_cost = 10
     
-    if user_points < hint_cost:
-        raise HTTPException(status_code=400, detail="Poin tidak cukup untuk hint")
-    
-    # Deduct points
-    new_points = user_points - hint_cost
-    await db.users.update_one(
-        {"id": current_user['id']},
-        {"$set": {"points": new_points}}
+    # Deduct points only if the user still has enough of them
+    updated = await apply_user_score(
+        {"id": current_user['id'], "points": {"$gte": hint_cost}},
+        {"$inc": {"points": -hint_cost}}
     )
+    if not updated:
+        raise HTTPException(status_code=400, detail="Poin tidak cukup untuk hint")
+    new_points = updated['points']
     
     # Save hint request
     hint_req = HintRequest(
@@ -903,57 +1954,298 @@ async def get_hint(challenge_id: str, hint_data: dict, current_user: dict = Depe
         "hint_cost": hint_cost
     }
 
+# ===== BADGE ENGINE =====
+
+BADGES = [
+    {"id": "first_blood", "name": "First Blood", "description": "Selesaikan challenge pertama", "icon": "🎯", "requirement": "Complete 1 challenge"},
+    {"id": "phishing_hunter", "name": "Phishing Hunter", "description": "Selesaikan 3 challenge phishing", "icon": "🎣", "requirement": "Complete 3 phishing challenges"},
+    {"id": "social_expert", "name": "Social Expert", "description": "Selesaikan semua kategori challenge", "icon": "🏆", "requirement": "Complete all categories"},
+    {"id": "speed_demon", "name": "Speed Demon", "description": "Selesaikan challenge dalam <1 menit", "icon": "⚡", "requirement": "Complete challenge in under 60 seconds"},
+    {"id": "perfectionist", "name": "Perfectionist", "description": "Dapat 100% di 5 challenge", "icon": "💎", "requirement": "Get 100% on 5 challenges"},
+]
+
+class BadgeEngine:
+    """Event-driven badge awarding.
+
+    Completions update per-user counters in `badge_progress` (completed, per
+    category, perfect challenge scores, fastest challenge time) with one atomic
+    update, then only newly satisfied badges are written to `user_badges`. A user's
+    first event or badge read backfills the document from their history, after
+    which reading badges is a single keyed lookup.
+    """
+
+    @staticmethod
+    def qualified(progress: dict, total_categories: int) -> set:
+        categories = progress.get('categories', {})
+        badges = set()
+        if progress.get('completed', 0) >= 1:
+            badges.add("first_blood")
+        if categories.get('phishing', 0) >= 3:
+            badges.add("phishing_hunter")
+        if total_categories and sum(1 for n in categories.values() if n > 0) >= total_categories:
+            badges.add("social_expert")
+        if 0 < progress.get('fastest_seconds', float('inf')) < 60:
+            badges.add("speed_demon")
+        if progress.get('perfect', 0) >= 5:
+            badges.add("perfectionist")
+        return badges
+
+    async def _total_categories(self) -> int:
+        return len({ch['category'] for ch in await challenge_catalog.list()})
+
+    async def _award(self, user_id: str, progress: dict) -> List[str]:
+        qualified = self.qualified(progress, await self._total_categories()) - set(progress.get('earned', []))
+        if not qualified:
+            return []
+        # Rows survive a reset of badge_progress; badges held already are not new
+        held = {
+            doc['badge_id'] async for doc in db.user_badges.find(
+                {"user_id": user_id, "badge_id": {"$in": sorted(qualified)}}, {"_id": 0, "badge_id": 1}
+            )
+        }
+        docs = []
+        for badge_id in sorted(qualified - held):
+            badge = UserBadge(user_id=user_id, badge_id=badge_id).model_dump()
+            badge['earned_at'] = badge['earned_at'].isoformat()
+            docs.append(badge)
+        new_badges = {doc['badge_id'] for doc in docs}
+        if docs:
+            try:
+                await db.user_badges.insert_many(docs, ordered=False)
+            except BulkWriteError as e:
+                errors = e.details.get('writeErrors', [])
+                if any(error.get('code') != 11000 for error in errors):
+                    raise
+                # Another request awarded these first (unique user_id + badge_id)
+                new_badges -= {docs[error['index']]['badge_id'] for error in errors}
+        await db.badge_progress.update_one(
+            {"user_id": user_id},
+            {"$addToSet": {"earned": {"$each": sorted(qualified)}}}
+        )
+        return sorted(new_badges)
+
+    async def _record(self, user_id: str, inc: dict, fastest: Optional[int] = None) -> List[str]:
+        # First event since the engine shipped: the backfill reads the history this
+        # event was already written to, so it must not be counted a second time
+        if await db.badge_progress.find_one({"user_id": user_id}, {"_id": 1}) is None and await self.bootstrap(user_id):
+            progress = await db.badge_progress.find_one({"user_id": user_id}, {"_id": 0})
+            return await self._award(user_id, progress)
+        update = {"$inc": inc, "$setOnInsert": {"earned": []}}
+        if fastest:
+            update["$min"] = {"fastest_seconds": fastest}
+        progress = await db.badge_progress.find_one_and_update(
+            {"user_id": user_id},
+            update,
+            projection={"_id": 0},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        return await self._award(user_id, progress)
+
+    async def challenge_completed(self, user_id: str, category: str, time_taken: Optional[int]) -> List[str]:
+        return await self.challenges_completed(user_id, [(category, time_taken)])
+
+    async def challenges_completed(self, user_id: str, completions: list) -> List[str]:
+        """Record several (category, time_taken) completions with one counter update"""
+        # A completed challenge means every question was answered correctly
+        inc = {"completed": len(completions), "perfect": len(completions)}
+        for category, _ in completions:
+            inc[f"categories.{category}"] = inc.get(f"categories.{category}", 0) + 1
+        times = [t for _, t in completions if t and t > 0]
+        return await self._record(user_id, inc, fastest=min(times) if times else None)
+
+    async def quiz_completed(self, user_id: str, accuracy: float) -> List[str]:
+        # Quiz perfection is tracked apart from "perfect", which counts challenges only
+        inc = {"quizzes": 1}
+        if accuracy >= 100:
+            inc["perfect_quizzes"] = 1
+        return await self._record(user_id, inc)
+
+    async def minigame_completed(self, user_id: str, game_type: str) -> List[str]:
+        inc = {"minigames": 1}
+        if game_type in MINIGAME_TYPES:
+            inc[f"minigame_types.{game_type}"] = 1
+        return await self._record(user_id, inc)
+
+    async def bootstrap(self, user_id: str) -> bool:
+        """One-time backfill of counters from a user's existing history.
+
+        Returns False when another request created the progress document first.
+        """
+        user = await db.users.find_one({"id": user_id}, {"_id": 0, "completed_challenges": 1}) or {}
+        completed = user.get('completed_challenges', [])
+        categories = {}
+        by_id = {ch['id']: ch for ch in await challenge_catalog.list()}
+        for challenge_id in completed:
+            ch = by_id.get(challenge_id)
+            if ch:
+                categories[ch['category']] = categories.get(ch['category'], 0) + 1
+        fastest = await db.challenge_attempts.find(
+            {"user_id": user_id, "is_completed": True, "time_taken_seconds": {"$gt": 0}},
+            {"_id": 0, "time_taken_seconds": 1}
+        ).sort("time_taken_seconds", 1).limit(1).to_list(1)
+        quiz = await db.quiz_completions.find_one({"user_id": user_id}, {"_id": 0, "accuracy": 1})
+        minigame_types = {}
+        async for doc in db.minigame_completions.find({"user_id": user_id}, {"_id": 0, "game_type": 1}):
+            if doc.get('game_type') in MINIGAME_TYPES:
+                minigame_types[doc['game_type']] = minigame_types.get(doc['game_type'], 0) + 1
+        
+        counters = {
+            "completed": len(completed),
+            "categories": categories,
+            "perfect": len(completed),
+            "quizzes": 1 if quiz else 0,
+            "perfect_quizzes": 1 if quiz and quiz.get('accuracy', 0) >= 100 else 0,
+            "minigames": sum(minigame_types.values()),
+            "minigame_types": minigame_types,
+            "earned": []
+        }
+        if fastest:
+            counters["fastest_seconds"] = fastest[0]['time_taken_seconds']
+        result = await db.badge_progress.update_one({"user_id": user_id}, {"$setOnInsert": counters}, upsert=True)
+        return result.upserted_id is not None
+
+    async def earned(self, user: dict) -> List[str]:
+        progress = await db.badge_progress.find_one({"user_id": user['id']}, {"_id": 0, "earned": 1})
+        if progress is None:
+            await self.bootstrap(user['id'])
+            progress = await db.badge_progress.find_one({"user_id": user['id']}, {"_id": 0})
+            earned = await self._award(user['id'], progress)
+            return sorted(set(progress.get('earned', [])) | set(earned))
+        return progress.get('earned', [])
+
+badge_engine = BadgeEngine()
+
 # ===== BADGES/ACHIEVEMENTS =====
 @api_router.get("/badges")
-async def get_badges():
-    badges = [
-        {"id": "first_blood", "name": "First Blood", "description": "Selesaikan challenge pertama", "icon": "🎯", "requirement": "Complete 1 challenge"},
-        {"id": "phishing_hunter", "name": "Phishing Hunter", "description": "Selesaikan 3 challenge phishing", "icon": "🎣", "requirement": "Complete 3 phishing challenges"},
-        {"id": "social_expert", "name": "Social Expert", "description": "Selesaikan semua kategori challenge", "icon": "🏆", "requirement": "Complete all categories"},
-        {"id": "speed_demon", "name": "Speed Demon", "description": "Selesaikan challenge dalam <1 menit", "icon": "⚡", "requirement": "Complete challenge in under 60 seconds"},
-        {"id": "perfectionist", "name": "Perfectionist", "description": "Dapat 100% di 5 challenge", "icon": "💎", "requirement": "Get 100% on 5 challenges"},
-    ]
-    return badges
+async def get_badges(request: Request):
+    async def load():
+        return BADGES
+    etag, body = await body_cache.get(("badges",), load)
+    return etag_response(request, etag, body)
 
 @api_router.get("/user/badges")
 async def get_user_badges(current_user: dict = Depends(get_current_user)):
-    # Check earned badges based on user progress
-    attempts = await db.attempts.find({"user_id": current_user['id']}, {"_id": 0}).to_list(1000)
-    completed = current_user.get('completed_challenges', [])
-    
-    earned_badges = []
-    
-    # First Blood
-    if len(completed) >= 1:
-        earned_badges.append("first_blood")
-    
-    # Perfectionist - 5 perfect scores
-    perfect_count = sum(1 for att in attempts if att.get('is_completed', False))
-    if perfect_count >= 5:
-        earned_badges.append("perfectionist")
-    
+    earned_badges = await badge_engine.earned(current_user)
     return {"earned_badges": earned_badges}
 
 # ===== COURSES SYSTEM =====
+# Learners fetch an outline first and then one module or slide at a time, so
+# listings never carry slide bodies and nothing public carries quiz answers.
+COURSE_PUBLIC_PROJECTION = {
+    "_id": 0,
+    "seed_managed": 0,
+    "content_hash": 0,
+    "quiz_questions.correct_answer": 0,
+    "quiz_questions.explanation": 0,
+}
+COURSE_OUTLINE_PROJECTION = {
+    **COURSE_PUBLIC_PROJECTION,
+    "modules.slides.content": 0,
+    "modules.slides.code_example": 0,
+    "modules.slides.image_url": 0,
+}
+
+def course_outline(course: dict, include_slides: bool = True) -> dict:
+    """Course metadata plus module/slide titles and counts (no slide bodies)"""
+    modules = course.get('modules', [])
+    outline = {k: v for k, v in course.items() if k not in ('modules', 'quiz_questions')}
+    outline['module_count'] = len(modules)
+    outline['slide_count'] = sum(len(m.get('slides', [])) for m in modules)
+    outline['quiz_question_count'] = len(course.get('quiz_questions', []))
+    outline['modules'] = []
+    for module in modules:
+        entry = {
+            "module_number": module['module_number'],
+            "title": module['title'],
+            "description": module.get('description', ''),
+            "slide_count": len(module.get('slides', []))
+        }
+        if include_slides:
+            entry['slides'] = [{"title": slide['title']} for slide in module.get('slides', [])]
+        outline['modules'].append(entry)
+    if include_slides:
+        outline['quiz_questions'] = course.get('quiz_questions', [])
+    return outline
+
+async def find_course_module(course_id: str, module_number: int) -> dict:
+    course = await db.courses.find_one(
+        {"id": course_id},
+        {"_id": 0, "modules": {"$elemMatch": {"module_number": module_number}}}
+    )
+    if not course:
+        raise HTTPException(status_code=404, detail="Course tidak ditemukan")
+    if not course.get('modules'):
+        raise HTTPException(status_code=404, detail="Module tidak ditemukan")
+    return course['modules'][0]
+
 @api_router.get("/courses")
-async def get_courses(category: Optional[str] = None):
+async def get_courses(request: Request, category: Optional[str] = None):
     query = {}
     if category:
         query['category'] = category
-    courses = await db.courses.find(query, {"_id": 0}).to_list(1000)
-    for course in courses:
-        if isinstance(course.get('created_at'), str):
-            course['created_at'] = datetime.fromisoformat(course['created_at'])
-    return courses
+
+    async def load():
+        courses = await db.courses.find(query, COURSE_OUTLINE_PROJECTION).to_list(1000)
+        return [course_outline(course, include_slides=False) for course in courses]
+
+    etag, body = await body_cache.get(("courses", "list", category), load)
+    return etag_response(request, etag, body)
 
 @api_router.get("/courses/{course_id}")
-async def get_course(course_id: str):
-    course = await db.courses.find_one({"id": course_id}, {"_id": 0})
-    if not course:
-        raise HTTPException(status_code=404, detail="Course tidak ditemukan")
-    if isinstance(course.get('created_at'), str):
-        course['created_at'] = datetime.fromisoformat(course['created_at'])
-    return course
+async def get_course(request: Request, course_id: str):
+    """Whole course tree (without quiz answers); prefer /outline + /modules for learners"""
+    async def load():
+        course = await db.courses.find_one({"id": course_id}, COURSE_PUBLIC_PROJECTION)
+        if not course:
+            raise HTTPException(status_code=404, detail="Course tidak ditemukan")
+        return course
+
+    etag, body = await body_cache.get(("courses", "detail", course_id), load)
+    return etag_response(request, etag, body)
+
+@api_router.get("/courses/{course_id}/outline")
+async def get_course_outline(request: Request, course_id: str):
+    async def load():
+        course = await db.courses.find_one({"id": course_id}, COURSE_OUTLINE_PROJECTION)
+        if not course:
+            raise HTTPException(status_code=404, detail="Course tidak ditemukan")
+        return course_outline(course)
+
+    etag, body = await body_cache.get(("courses", "outline", course_id), load)
+    return etag_response(request, etag, body)
+
+@api_router.get("/courses/{course_id}/modules/{module_number}")
+async def get_course_module(request: Request, course_id: str, module_number: int):
+    async def load():
+        module = await find_course_module(course_id, module_number)
+        return {**module, "slide_count": len(module.get('slides', []))}
+
+    etag, body = await body_cache.get(("courses", "module", course_id, module_number), load)
+    return etag_response(request, etag, body)
+
+@api_router.get("/courses/{course_id}/modules/{module_number}/slides/{slide_number}")
+async def get_course_slide(request: Request, course_id: str, module_number: int, slide_number: int):
+    async def load():
+        module = await find_course_module(course_id, module_number)
+        slides = module.get('slides', [])
+        if not 0 <= slide_number < len(slides):
+            raise HTTPException(status_code=404, detail="Slide tidak ditemukan")
+        return {
+            **slides[slide_number],
+            "module_number": module_number,
+            "slide_number": slide_number,
+            "slide_count": len(slides)
+        }
+
+    etag, body = await body_cache.get(("courses", "slide", course_id, module_number, slide_number), load)
+    return etag_response(request, etag, body)
+
+@api_router.get("/admin/courses")
+async def get_all_courses(admin_user: dict = Depends(require_admin)):
+    """Full course documents, including quiz answers, for the admin editor"""
+    courses = await db.courses.find({}, {"_id": 0}).to_list(1000)
+    return ORJSONResponse(courses)
 
 @api_router.post("/admin/courses")
 async def create_course(course: Course, admin_user: dict = Depends(require_admin)):
@@ -961,6 +2253,7 @@ async def create_course(course: Course, admin_user: dict = Depends(require_admin
     course_dict['created_at'] = course_dict['created_at'].isoformat()
     course_dict['created_by'] = admin_user['username']
     await db.courses.insert_one(course_dict)
+    body_cache.invalidate("courses")
     return course
 
 @api_router.put("/admin/courses/{course_id}")
@@ -974,8 +2267,10 @@ async def update_course(course_id: str, course: Course, admin_user: dict = Depen
     
     result = await db.courses.update_one(
         {"id": course_id},
-        {"$set": course_dict}
+        {"$set": {**course_dict, **SEED_DETACH}, "$unset": {"content_hash": ""}}
     )
+    body_cache.invalidate("courses")
+    grading_engine.invalidate_course(course_id)
     
     if result.modified_count == 0:
         raise HTTPException(status_code=404, detail="Course tidak ditemukan")
@@ -985,45 +2280,293 @@ async def update_course(course_id: str, course: Course, admin_user: dict = Depen
 @api_router.delete("/admin/courses/{course_id}")
 async def delete_course(course_id: str, admin_user: dict = Depends(require_admin)):
     result = await db.courses.delete_one({"id": course_id})
+    body_cache.invalidate("courses")
+    grading_engine.invalidate_course(course_id)
     
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Course tidak ditemukan")
     
     return {"message": "Course berhasil dihapus"}
 
+def course_progress_update(module_numbers, current_slide: Optional[int]) -> dict:
+    """Upsert update recording visited modules and the current slide.
+
+    Fields not touched by $set/$addToSet get their CourseProgress defaults on insert.
+    """
+    update = {}
+    if module_numbers:
+        update["$addToSet"] = {"completed_modules": {"$each": list(module_numbers)}}
+    if current_slide is not None:
+        update["$set"] = {"current_slide": current_slide}
+    defaults = CourseProgress(user_id="", course_id="").model_dump(exclude={"user_id", "course_id"})
+    defaults['started_at'] = defaults['started_at'].isoformat()
+    update["$setOnInsert"] = {
+        k: v for k, v in defaults.items()
+        if k not in update.get("$set", {}) and k not in update.get("$addToSet", {})
+    }
+    return update
+
+async def upsert_course_progress(user_id: str, course_id: str, update: dict):
+    """Single round trip; the unique (user_id, course_id) index stops duplicate documents"""
+    key = {"user_id": user_id, "course_id": course_id}
+    try:
+        await db.course_progress.update_one(key, update, upsert=True)
+    except DuplicateKeyError:
+        # A concurrent request inserted first; the document exists now, so apply as an update
+        await db.course_progress.update_one(key, update)
+
+from pymongo import UpdateOne
+
+class ProgressBufferFull(Exception):
+    """Raised when the buffer is full and the database is still failing"""
+
+class ProgressWriteBuffer:
+    """Write-behind buffer coalescing slide progress events per (user_id, course_id).
+
+    Only slide positions are buffered. The first event that records a module for a
+    key is written straight through, because completed modules gate the course
+    quiz and another worker (with its own buffer) may serve that request. Each key
+    keeps the latest slide; a background task flushes everything as one unordered
+    bulk_write every `flush_interval` seconds, or sooner once `max_pending` keys
+    are buffered. After a failed flush, writes back off exponentially (up to
+    `max_backoff` seconds); while backing off a full buffer rejects new keys
+    instead of retrying on the request path. Reads overlay the pending state so
+    learners always see their own progress. With an interval of 0 events are
+    written straight through.
+    """
+
+    def __init__(self, flush_interval: float = 2.0, max_pending: int = 500, max_backoff: float = 30.0,
+                 max_tracked: int = 50000):
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.max_backoff = max_backoff
+        self.max_tracked = max_tracked
+        self._pending = {}
+        self._recorded = OrderedDict()  # key -> modules this process has written, LRU-bounded
+        self._task = None
+        self._stopping = None
+        self._lock = asyncio.Lock()
+        self._backoff = 0.0
+        self._retry_at = 0.0
+        self.events = 0
+        self.writes = 0
+        self.failures = 0
+        self.rejected = 0
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    @property
+    def retry_after(self) -> float:
+        return max(0.0, self._retry_at - monotonic())
+
+    @property
+    def backing_off(self) -> bool:
+        return self.retry_after > 0
+
+    def _merge(self, key: tuple, modules, slide: Optional[int]):
+        entry = self._pending.setdefault(key, {"modules": set(), "slide": None})
+        entry["modules"].update(modules)
+        if slide is not None:
+            entry["slide"] = slide
+
+    def _remember(self, key: tuple, modules):
+        recorded = self._recorded.get(key)
+        if recorded is None:
+            recorded = self._recorded[key] = set()
+            while len(self._recorded) > self.max_tracked:
+                self._recorded.popitem(last=False)
+        else:
+            self._recorded.move_to_end(key)
+        recorded.update(modules)
+
+    def _flushed(self, ok: bool):
+        if ok:
+            self._backoff = 0.0
+            self._retry_at = 0.0
+        else:
+            self._backoff = min(self.max_backoff, max(self.flush_interval, self._backoff * 2))
+            self._retry_at = monotonic() + self._backoff
+
+    async def add(self, user_id: str, course_id: str, module_number: Optional[int], slide_number: Optional[int]):
+        self.events += 1
+        key = (user_id, course_id)
+        modules = [module_number] if module_number is not None else []
+        if self.flush_interval <= 0:
+            self.writes += 1
+            await upsert_course_progress(user_id, course_id, course_progress_update(modules, slide_number))
+            return
+        if module_number is not None and module_number not in self._recorded.get(key, ()):
+            self._merge(key, modules, slide_number)
+            await self.flush_key(user_id, course_id)
+            return
+        if key not in self._pending and len(self._pending) >= self.max_pending and self.backing_off:
+            self.rejected += 1
+            raise ProgressBufferFull()
+        self._merge(key, modules, slide_number)
+        if len(self._pending) >= self.max_pending and not self.backing_off:
+            await self.flush()
+
+    def overlay(self, user_id: str, course_id: str, progress: Optional[dict]) -> Optional[dict]:
+        """Apply buffered, not yet written events on top of a stored progress document"""
+        entry = self._pending.get((user_id, course_id))
+        if entry is None:
+            return progress
+        progress = dict(progress or {"completed_modules": [], "current_slide": 0, "quiz_completed": False, "quiz_passed": False})
+        completed = list(progress.get('completed_modules', []))
+        completed += [m for m in sorted(entry["modules"]) if m not in completed]
+        progress['completed_modules'] = completed
+        if entry["slide"] is not None:
+            progress['current_slide'] = entry["slide"]
+        return progress
+
+    def _requeue(self, entries: dict):
+        """Put unwritten entries back for the next flush, under anything buffered meanwhile"""
+        newer, self._pending = self._pending, {}
+        for key, entry in list(entries.items()) + list(newer.items()):
+            self._merge(key, entry["modules"], entry["slide"])
+
+    async def flush_key(self, user_id: str, course_id: str):
+        """Write one learner's buffered events now (new modules, or before grading their quiz).
+
+        A failed write stays buffered for the next flush.
+        """
+        async with self._lock:  # also waits out a bulk flush that may hold this key
+            key = (user_id, course_id)
+            entry = self._pending.pop(key, None)
+            if entry is None:
+                return
+            try:
+                await upsert_course_progress(user_id, course_id, course_progress_update(sorted(entry["modules"]), entry["slide"]))
+            except Exception as e:
+                self.failures += 1
+                logger.warning(f"Course progress write failed for {user_id}/{course_id}, retrying later: {e}")
+                self._requeue({key: entry})
+                self._flushed(False)
+                return
+            except BaseException:
+                self._requeue({key: entry})
+                raise
+            self.writes += 1
+            self._remember(key, entry["modules"])
+
+    async def _write(self, batch: dict) -> dict:
+        """Bulk-write a batch; returns the entries that still have to be written"""
+        keys = list(batch)
+        ops = [
+            UpdateOne(
+                {"user_id": user_id, "course_id": course_id},
+                course_progress_update(sorted(batch[(user_id, course_id)]["modules"]), batch[(user_id, course_id)]["slide"]),
+                upsert=True
+            )
+            for user_id, course_id in keys
+        ]
+        failed = {}
+        try:
+            await db.course_progress.bulk_write(ops, ordered=False)
+        except BulkWriteError as e:
+            failed = {error['index']: error for error in e.details.get('writeErrors', [])}
+        self.writes += len(ops) - len(failed)
+        for index, (user_id, course_id) in enumerate(keys):
+            if index not in failed:
+                self._remember((user_id, course_id), batch[(user_id, course_id)]["modules"])
+        unwritten = {}
+        for index, error in failed.items():
+            user_id, course_id = keys[index]
+            entry = batch[(user_id, course_id)]
+            message = error.get('errmsg')
+            if error.get('code') == 11000:
+                # Lost an upsert race with another worker; the document exists now
+                try:
+                    await db.course_progress.update_one(
+                        {"user_id": user_id, "course_id": course_id},
+                        course_progress_update(sorted(entry["modules"]), entry["slide"])
+                    )
+                    self.writes += 1
+                    self._remember((user_id, course_id), entry["modules"])
+                    continue
+                except Exception as e:
+                    message = str(e)
+            self.failures += 1
+            logger.warning(f"Course progress write failed for {user_id}/{course_id}, retrying later: {message}")
+            unwritten[(user_id, course_id)] = entry
+        return unwritten
+
+    async def flush(self):
+        async with self._lock:
+            if not self._pending:
+                return
+            batch, self._pending = self._pending, {}
+            # Until _write reports otherwise the whole batch counts as unwritten, so an
+            # error or a cancellation mid-write puts it back instead of dropping it
+            unwritten = batch
+            try:
+                unwritten = await self._write(batch)
+            except Exception as e:
+                self.failures += 1
+                logger.warning(f"Course progress flush failed, retrying in {max(self._backoff * 2, self.flush_interval):.0f}s: {e}")
+            finally:
+                if unwritten:
+                    self._requeue(unwritten)
+                self._flushed(not unwritten)
+
+    async def _flush_loop(self):
+        while not self._stopping.is_set():
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            if self.backing_off and not self._stopping.is_set():
+                continue
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.warning(f"Course progress flush loop error: {e}")
+
+    def start(self):
+        if self._task is None and self.flush_interval > 0:
+            self._stopping = asyncio.Event()
+            self._task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self):
+        """Let the flush loop finish its current flush and exit, then write whatever is left"""
+        if self._task is not None:
+            self._stopping.set()
+            await self._task
+            self._task = None
+        await self.flush()
+
+    def stats(self) -> dict:
+        return {
+            "pending": self.pending,
+            "events": self.events,
+            "writes": self.writes,
+            "failures": self.failures,
+            "rejected": self.rejected,
+            "backoff_seconds": self._backoff,
+            "flush_interval": self.flush_interval,
+            "max_pending": self.max_pending
+        }
+
+progress_buffer = ProgressWriteBuffer(
+    flush_interval=float(os.environ.get('PROGRESS_FLUSH_INTERVAL', 2)),
+    max_pending=int(os.environ.get('PROGRESS_BUFFER_SIZE', 500))
+)
+
 @api_router.post("/courses/{course_id}/progress")
 async def update_course_progress(course_id: str, progress_data: dict, current_user: dict = Depends(get_current_user)):
     module_number = progress_data.get('module_number')
     slide_number = progress_data.get('slide_number')
     
-    # Get or create progress
-    progress = await db.course_progress.find_one({
-        "user_id": current_user['id'],
-        "course_id": course_id
-    })
-    
-    if not progress:
-        new_progress = CourseProgress(
-            user_id=current_user['id'],
-            course_id=course_id
+    try:
+        await progress_buffer.add(current_user['id'], course_id, module_number, slide_number)
+    except ProgressBufferFull:
+        raise HTTPException(
+            status_code=503,
+            detail="Progress sementara tidak dapat disimpan, coba lagi nanti",
+            headers={"Retry-After": str(max(1, math.ceil(progress_buffer.retry_after)))}
         )
-        progress_dict = new_progress.model_dump()
-        progress_dict['started_at'] = progress_dict['started_at'].isoformat()
-        await db.course_progress.insert_one(progress_dict)
-        progress = progress_dict
-    
-    # Update progress
-    completed_modules = progress.get('completed_modules', [])
-    if module_number not in completed_modules:
-        completed_modules.append(module_number)
-    
-    await db.course_progress.update_one(
-        {"user_id": current_user['id'], "course_id": course_id},
-        {"$set": {
-            "completed_modules": completed_modules,
-            "current_slide": slide_number
-        }}
-    )
     
     return {"message": "Progress updated"}
 
@@ -1033,6 +2576,7 @@ async def get_course_progress(course_id: str, current_user: dict = Depends(get_c
         "user_id": current_user['id'],
         "course_id": course_id
     }, {"_id": 0})
+    progress = progress_buffer.overlay(current_user['id'], course_id, progress)
     
     return progress or {"completed_modules": [], "current_slide": 0, "quiz_completed": False, "quiz_passed": False}
 
@@ -1041,12 +2585,13 @@ async def submit_course_quiz(course_id: str, quiz_data: dict, current_user: dict
     """Submit course quiz and check if passed"""
     answers = quiz_data.get('answers', [])
     
-    # Get course
-    course = await db.courses.find_one({"id": course_id}, {"_id": 0})
-    if not course:
+    # Compiled answer key (no full course fetch)
+    quiz_key = await grading_engine.quiz_key(course_id)
+    if not quiz_key:
         raise HTTPException(status_code=404, detail="Course tidak ditemukan")
     
-    # Get or create progress
+    # Get or create progress (buffered slide events first, so the document exists)
+    await progress_buffer.flush_key(current_user['id'], course_id)
     progress = await db.course_progress.find_one({
         "user_id": current_user['id'],
         "course_id": course_id
@@ -1065,14 +2610,13 @@ async def submit_course_quiz(course_id: str, quiz_data: dict, current_user: dict
         }
     
     # Calculate score
-    quiz_questions = course.get('quiz_questions', [])
-    if not quiz_questions:
+    if not quiz_key.correct:
         raise HTTPException(status_code=400, detail="Course ini tidak memiliki quiz")
     
-    correct_count = sum(1 for i, ans in enumerate(answers) if i < len(quiz_questions) and ans == quiz_questions[i]['correct_answer'])
-    total_questions = len(quiz_questions)
+    correct_count, _ = count_correct(answers, quiz_key.correct)
+    total_questions = len(quiz_key.correct)
     score = int((correct_count / total_questions) * 100)
-    passing_score = course.get('passing_score', 70)
+    passing_score = quiz_key.passing_score
     passed = score >= passing_score
     
     # Update progress
@@ -1093,23 +2637,35 @@ async def submit_course_quiz(course_id: str, quiz_data: dict, current_user: dict
             username=current_user['username'],
             full_name=current_user['full_name'],
             achievement_type="course_completion",
-            achievement_title=f"Certificate of Completion: {course['title']}"
+            achievement_title=f"Certificate of Completion: {quiz_key.title}"
         )
         cert_dict = cert.model_dump()
         cert_dict['issued_at'] = cert_dict['issued_at'].isoformat()
+    
+    # Only the request that flips quiz_completed gets to award anything
+    claimed = await db.course_progress.update_one(
+        {"user_id": current_user['id'], "course_id": course_id, "quiz_completed": {"$ne": True}},
+        {"$set": update_data}
+    )
+    if not claimed.modified_count:
+        # A parallel submission won: report its stored result, not this one
+        stored = await db.course_progress.find_one(
+            {"user_id": current_user['id'], "course_id": course_id},
+            {"_id": 0, "quiz_score": 1, "quiz_passed": 1}
+        ) or {}
+        return {
+            "already_completed": True,
+            "score": stored.get('quiz_score', 0),
+            "passed": stored.get('quiz_passed', False),
+            "message": "Quiz sudah pernah diselesaikan"
+        }
+    
+    if passed:
         await db.certificates.insert_one(cert_dict)
         
         # Award points
         bonus_points = 100
-        await db.users.update_one(
-            {"id": current_user['id']},
-            {"$inc": {"points": bonus_points}}
-        )
-    
-    await db.course_progress.update_one(
-        {"user_id": current_user['id'], "course_id": course_id},
-        {"$set": update_data}
-    )
+        await apply_user_score({"id": current_user['id']}, {"$inc": {"points": bonus_points}})
     
     return {
         "correct_count": correct_count,
@@ -1162,48 +2718,113 @@ async def get_certificate(certificate_id: str):
         raise HTTPException(status_code=404, detail="Certificate tidak ditemukan")
     return cert
 
-# ===== QUIZ MODE (RAPID FIRE) =====
-@api_router.get("/quiz/random")
-async def get_random_quiz():
-    # Get 10 random questions from quiz_questions collection
-    # If no quiz questions exist, fallback to challenges
-    quiz_questions_list = await db.quiz_questions.find({}, {"_id": 0}).to_list(1000)
-    
-    import random
-    
-    if quiz_questions_list and len(quiz_questions_list) >= 10:
-        # Use dedicated quiz questions
-        random.shuffle(quiz_questions_list)
-        selected_questions = quiz_questions_list[:10]
+# ===== QUIZ SAMPLING =====
+import random
+
+QUIZ_SIZE = 10
+
+class QuizSampler:
+    """Samples quiz questions from a cached pool of ids instead of loading whole collections.
+
+    The pool holds only (id, category, difficulty) per quiz question and is rebuilt
+    after admin edits or QUIZ_POOL_TTL seconds. Each request then costs one
+    random.sample over the pool plus a single `$in` fetch of QUIZ_SIZE documents.
+    Pools are kept only for category/difficulty values that exist, so the cache
+    is bounded by the content. Passing a seed makes the selection reproducible.
+    """
+
+    def __init__(self, ttl_seconds: float = 300):
+        self.ttl_seconds = ttl_seconds
+        self._entries = []
+        self._filter_values = (set(), set())
+        self._pools = None
+        self._loaded_at = 0.0
+
+    def invalidate(self):
+        self._pools = None
+
+    async def _pool(self, category: Optional[str], difficulty: Optional[str]) -> List[str]:
+        if self._pools is None or monotonic() - self._loaded_at > self.ttl_seconds:
+            entries = await db.quiz_questions.find(
+                {}, {"_id": 0, "id": 1, "category": 1, "difficulty": 1}
+            ).to_list(None)
+            # Sorted by id so a seed picks the same questions across reloads and restarts
+            self._entries = sorted(entries, key=lambda q: q['id'])
+            self._filter_values = (
+                {q.get('category') for q in entries},
+                {q.get('difficulty') for q in entries}
+            )
+            self._pools = {}
+            self._loaded_at = monotonic()
+        categories, difficulties = self._filter_values
+        if (category and category not in categories) or (difficulty and difficulty not in difficulties):
+            # Unknown filter values come straight from the query string; never cache them
+            return []
+        key = (category, difficulty)
+        if key not in self._pools:
+            self._pools[key] = [
+                q['id'] for q in self._entries
+                if (not category or q.get('category') == category)
+                and (not difficulty or q.get('difficulty') == difficulty)
+            ]
+        return self._pools[key]
+
+    async def sample(self, size: int, category: Optional[str] = None,
+                     difficulty: Optional[str] = None, seed: Optional[int] = None) -> List[dict]:
+        rng = random.Random(seed)
+        pool = await self._pool(category, difficulty)
+        
+        if len(pool) >= size:
+            # Use dedicated quiz questions
+            ids = rng.sample(pool, size)
+            docs = await db.quiz_questions.find({"id": {"$in": ids}}, {"_id": 0}).to_list(size)
+            by_id = {q['id']: q for q in docs}
+            return [
+                {
+                    "challenge_title": q.get('category', 'Quiz'),
+                    "question": q['question'],
+                    "options": q['options'],
+                    "correct_answer": q['correct_answer'],
+                    "points": 10
+                }
+                for q in (by_id[qid] for qid in ids if qid in by_id)
+            ]
         
-        quiz_questions = []
-        for q in selected_questions:
-            quiz_questions.append({
-                "challenge_title": q.get('category', 'Quiz'),
+        # Fallback to challenges (already in memory) if not enough quiz questions
+        challenges = sorted(
+            (
+                ch for ch in await challenge_catalog.list()
+                if ch.get('questions')
+                and (not category or ch['category'] == category)
+                and (not difficulty or ch['difficulty'] == difficulty)
+            ),
+            key=lambda ch: ch['id']
+        )
+        questions = []
+        for challenge in rng.sample(challenges, min(size, len(challenges))):
+            q = rng.choice(challenge['questions'])
+            questions.append({
+                "challenge_title": challenge['title'],
                 "question": q['question'],
                 "options": q['options'],
                 "correct_answer": q['correct_answer'],
                 "points": 10
             })
-    else:
-        # Fallback to challenges if no quiz questions
-        challenges = await db.challenges.find({}, {"_id": 0}).to_list(1000)
-        if not challenges:
-            raise HTTPException(status_code=404, detail="Tidak ada quiz questions atau challenges tersedia")
-        
-        random.shuffle(challenges)
-        
-        quiz_questions = []
-        for challenge in challenges[:10]:
-            if challenge.get('questions'):
-                q = random.choice(challenge['questions'])
-                quiz_questions.append({
-                    "challenge_title": challenge['title'],
-                    "question": q['question'],
-                    "options": q['options'],
-                    "correct_answer": q['correct_answer'],
-                    "points": 10
-                })
+        return questions
+
+quiz_sampler = QuizSampler(ttl_seconds=float(os.environ.get('QUIZ_POOL_TTL', 300)))
+
+# ===== QUIZ MODE (RAPID FIRE) =====
+@api_router.get("/quiz/random")
+async def get_random_quiz(
+    category: Optional[str] = None,
+    difficulty: Optional[str] = None,
+    seed: Optional[int] = None
+):
+    # Get 10 random questions from quiz_questions, falling back to challenges
+    quiz_questions = await quiz_sampler.sample(QUIZ_SIZE, category, difficulty, seed)
+    if not quiz_questions:
+        raise HTTPException(status_code=404, detail="Tidak ada quiz questions atau challenges tersedia")
     
     return {
         "questions": quiz_questions,
@@ -1213,13 +2834,9 @@ async def get_random_quiz():
 
 @api_router.post("/quiz/submit")
 async def submit_quiz(answers: dict, current_user: dict = Depends(get_current_user)):
-    # Check if user has already completed a quiz (GLOBAL restriction)
-    existing_completion = await db.quiz_completions.find_one(
-        {"user_id": current_user['id']},
-        {"_id": 0}
-    )
-    
-    if existing_completion:
+    # Check if user has already completed a quiz (GLOBAL restriction). The unique
+    # user_id index closes the race; this check still holds if that index is missing.
+    if await db.quiz_completions.find_one({"user_id": current_user['id']}, {"_id": 1}):
         raise HTTPException(
             status_code=400, 
             detail="Quiz sudah pernah diselesaikan. Kamu hanya bisa mengikuti quiz sekali."
@@ -1237,14 +2854,7 @@ async def submit_quiz(answers: dict, current_user: dict = Depends(get_current_us
     if time_taken < 40:
         points = int(points * 1.5)
     
-    # Update user points
-    new_points = current_user.get('points', 0) + points
-    await db.users.update_one(
-        {"id": current_user['id']},
-        {"$set": {"points": new_points}}
-    )
-    
-    # Record completion
+    # Record completion; the unique user_id index enforces the GLOBAL one-quiz restriction
     completion_data = {
         "user_id": current_user['id'],
         "quiz_data": {
@@ -1259,13 +2869,23 @@ async def submit_quiz(answers: dict, current_user: dict = Depends(get_current_us
         "completed_at": datetime.now(timezone.utc).isoformat()
     }
     
-    await db.quiz_completions.insert_one(completion_data)
+    try:
+        await db.quiz_completions.insert_one(completion_data)
+    except DuplicateKeyError:
+        raise HTTPException(
+            status_code=400, 
+            detail="Quiz sudah pernah diselesaikan. Kamu hanya bisa mengikuti quiz sekali."
+        )
+    
+    await apply_user_score({"id": current_user['id']}, {"$inc": {"points": points}})
+    new_badges = await badge_engine.quiz_completed(current_user['id'], completion_data['accuracy'])
     
     return {
         "correct": correct,
         "total": total,
         "points_earned": points,
-        "accuracy": round((correct / total) * 100, 1)
+        "accuracy": round((correct / total) * 100, 1),
+        "new_badges": new_badges
     }
 
 # ===== QUIZ COMPLETION STATUS =====
@@ -1318,16 +2938,14 @@ async def get_minigame_completion_status(game_type: str, current_user: dict = De
 async def complete_minigame(data: dict, current_user: dict = Depends(get_current_user)):
     """Record mini game completion"""
     game_type = data.get('game_type')
+    if game_type not in MINIGAME_TYPES:
+        raise HTTPException(status_code=400, detail="Tipe mini game tidak valid")
     score = data.get('score', 0)
     time_taken = data.get('time_taken_seconds', 0)
     details = data.get('details', {})
     
-    # Check if already completed
-    existing = await db.minigame_completions.find_one(
-        {"user_id": current_user['id'], "game_type": game_type}
-    )
-    
-    if existing:
+    # Check if already completed (the unique index closes the race)
+    if await db.minigame_completions.find_one({"user_id": current_user['id'], "game_type": game_type}, {"_id": 1}):
         raise HTTPException(
             status_code=400,
             detail="Mini game ini sudah pernah diselesaikan. Kamu hanya bisa bermain sekali."
@@ -1342,31 +2960,35 @@ async def complete_minigame(data: dict, current_user: dict = Depends(get_current
         "completed_at": datetime.now(timezone.utc).isoformat()
     }
     
-    await db.minigame_completions.insert_one(completion_data)
+    # Unique (user_id, game_type) index: only one completion per game
+    try:
+        await db.minigame_completions.insert_one(completion_data)
+    except DuplicateKeyError:
+        raise HTTPException(
+            status_code=400,
+            detail="Mini game ini sudah pernah diselesaikan. Kamu hanya bisa bermain sekali."
+        )
     
     # Award points
     points_earned = score
-    new_points = current_user.get('points', 0) + points_earned
-    await db.users.update_one(
-        {"id": current_user['id']},
-        {"$set": {"points": new_points}}
-    )
+    await apply_user_score({"id": current_user['id']}, {"$inc": {"points": points_earned}})
+    new_badges = await badge_engine.minigame_completed(current_user['id'], game_type)
     
     return {
         "success": True,
         "points_earned": points_earned,
-        "message": "Mini game berhasil diselesaikan!"
+        "message": "Mini game berhasil diselesaikan!",
+        "new_badges": new_badges
     }
 
 @api_router.get("/minigame/scenarios/{game_type}")
-async def get_minigame_scenarios(game_type: str):
+async def get_minigame_scenarios(request: Request, game_type: str):
     """Get all scenarios for a specific mini game type"""
-    scenarios = await db.minigame_scenarios.find(
-        {"game_type": game_type},
-        {"_id": 0}
-    ).to_list(1000)
-    
-    return scenarios
+    etag, body = await body_cache.get(
+        ("minigame_scenarios", game_type),
+        lambda: db.minigame_scenarios.find({"game_type": game_type}, {"_id": 0}).to_list(1000)
+    )
+    return etag_response(request, etag, body)
 
 # ===== CHALLENGE COMPLETION STATUS =====
 @api_router.get("/challenges/{challenge_id}/completion")
@@ -1421,6 +3043,10 @@ async def reset_user_completion(data: dict, admin_user: dict = Depends(require_a
             query["challenge_id"] = specific_id
         result = await db.challenge_attempts.delete_many(query)
         deleted_count = result.deleted_count
+        if deleted_count:
+            await record_stat("attempts", -deleted_count)
+        # Counters are rebuilt from completed_challenges on the next /user/badges read
+        await db.badge_progress.delete_one({"user_id": user_id})
         
         # Also remove from user's completed_challenges
         if specific_id:
@@ -1428,11 +3054,15 @@ async def reset_user_completion(data: dict, admin_user: dict = Depends(require_a
                 {"id": user_id},
                 {"$pull": {"completed_challenges": specific_id}}
             )
+            user_cache.invalidate(user_id)
+            await leaderboard.refresh_user(user_id)
         else:
             await db.users.update_one(
                 {"id": user_id},
                 {"$set": {"completed_challenges": []}}
             )
+            user_cache.invalidate(user_id)
+            await leaderboard.refresh_user(user_id)
     
     else:
         raise HTTPException(status_code=400, detail="Invalid type. Must be: quiz, minigame, or challenge")
@@ -1466,6 +3096,7 @@ async def create_quiz_question(question: dict, admin_user: dict = Depends(requir
     }
     
     await db.quiz_questions.insert_one(question_data)
+    quiz_sampler.invalidate()
     return {"success": True, "question_id": question_data['id']}
 
 @api_router.put("/admin/quiz-questions/{question_id}")
@@ -1477,6 +3108,7 @@ async def update_quiz_question(question_id: str, question: dict, admin_user: dic
         {"id": question_id},
         {"$set": update_data}
     )
+    quiz_sampler.invalidate()
     
     if result.matched_count == 0:
         raise HTTPException(status_code=404, detail="Question not found")
@@ -1487,6 +3119,7 @@ async def update_quiz_question(question_id: str, question: dict, admin_user: dic
 async def delete_quiz_question(question_id: str, admin_user: dict = Depends(require_admin)):
     """Delete a quiz question"""
     result = await db.quiz_questions.delete_one({"id": question_id})
+    quiz_sampler.invalidate()
     
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Question not found")
@@ -1517,6 +3150,7 @@ async def create_minigame_scenario(scenario: dict, admin_user: dict = Depends(re
     }
     
     await db.minigame_scenarios.insert_one(scenario_data)
+    body_cache.invalidate("minigame_scenarios")
     return {"success": True, "scenario_id": scenario_data['id']}
 
 @api_router.put("/admin/minigame-scenarios/{scenario_id}")
@@ -1528,6 +3162,7 @@ async def update_minigame_scenario(scenario_id: str, scenario: dict, admin_user:
         {"id": scenario_id},
         {"$set": update_data}
     )
+    body_cache.invalidate("minigame_scenarios")
     
     if result.matched_count == 0:
         raise HTTPException(status_code=404, detail="Scenario not found")
@@ -1538,6 +3173,7 @@ async def update_minigame_scenario(scenario_id: str, scenario: dict, admin_user:
 async def delete_minigame_scenario(scenario_id: str, admin_user: dict = Depends(require_admin)):
     """Delete a mini game scenario"""
     result = await db.minigame_scenarios.delete_one({"id": scenario_id})
+    body_cache.invalidate("minigame_scenarios")
     
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Scenario not found")
@@ -1554,12 +3190,88 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=COMPRESSION_MIN_SIZE
+)
+
+# ===== METRICS =====
+http_metrics = HTTPMetrics()
+app.add_middleware(MetricsMiddleware, metrics=http_metrics)
+
+# Scrapers send "Authorization: Bearer <METRICS_TOKEN>"; without a token only
+# loopback clients (e.g. a sidecar or `curl localhost`) may read /metrics
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')
+LOOPBACK_HOSTS = {"127.0.0.1", "::1", "localhost"}
+
+def metrics_authorized(request: Request) -> bool:
+    if METRICS_TOKEN:
+        supplied = request.headers.get("authorization", "")
+        return hmac.compare_digest(supplied.encode(), f"Bearer {METRICS_TOKEN}".encode())
+    return request.client is not None and request.client.host in LOOPBACK_HOSTS
+
+@app.get("/metrics", include_in_schema=False)
+async def get_metrics(request: Request):
+    """Prometheus text exposition of HTTP, MongoDB and in-process service metrics"""
+    if not metrics_authorized(request):
+        raise HTTPException(status_code=403, detail="Akses metrics ditolak")
+    lines = []
+    http_metrics.render(lines)
+    mongo_metrics.render(lines)
+    
+    password_metrics = password_service.metrics()
+    render_gauges(lines, "password_service_queue_depth", "bcrypt jobs waiting for a worker",
+                  {(): password_metrics['queue_depth']})
+    render_gauges(lines, "password_service_avg_ms", "Average bcrypt operation latency",
+                  {(op,): stats['avg_ms'] for op, stats in password_metrics['operations'].items()}, ("operation",))
+    cache_stats = user_cache.stats()
+    render_gauges(lines, "user_cache_entries", "Cached authenticated users", {(): cache_stats['size']})
+    render_counters(lines, "user_cache_lookups_total", "User cache lookups by result",
+                  {("hit",): cache_stats['hits'], ("miss",): cache_stats['misses']}, ("result",))
+    render_gauges(lines, "leaderboard_users", "Users in the in-memory leaderboard", {(): leaderboard.size})
+    progress_stats = progress_buffer.stats()
+    render_gauges(lines, "course_progress_buffer_pending", "Buffered (user, course) progress entries",
+                  {(): progress_stats['pending']})
+    render_counters(lines, "course_progress_events_total", "Progress events received and documents written",
+                    {("received",): progress_stats['events'], ("written",): progress_stats['writes'],
+                     ("rejected",): progress_stats['rejected']}, ("kind",))
+    
+    return Response(content="\n".join(lines) + "\n", media_type="text/plain; version=0.0.4")
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def create_db_indexes():
+    await ensure_indexes()
+
+@app.on_event("startup")
+async def init_admin_stats():
+    await recount_stats()
+
+@app.on_event("startup")
+async def warm_challenge_catalog():
+    snapshot = load_snapshot()
+    if snapshot is not None:
+        challenge_catalog.use_snapshot(snapshot)
+    await challenge_catalog.list()
+
+@app.on_event("startup")
+async def load_leaderboard():
+    await leaderboard.load()
+    leaderboard.start()
+
+@app.on_event("startup")
+async def start_progress_buffer():
+    progress_buffer.start()
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
-    client.close()
\ No newline at end of file
+    leaderboard.stop()
+    # Flush buffered course progress before the client goes away
+    await progress_buffer.stop()
+    client.close()
+    password_service.shutdown()
\ No newline at end of file
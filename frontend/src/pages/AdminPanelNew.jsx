@@ -45,7 +45,7 @@ const AdminPanelNew = () => {
       const [statsRes, challengesRes, coursesRes, educationRes, usersRes, quizRes, miniGameRes] = await Promise.all([
         axios.get(`${API}/admin/stats`, { headers: { Authorization: `Bearer ${token}` } }),
         axios.get(`${API}/challenges`),
-        axios.get(`${API}/courses`),
+        axios.get(`${API}/admin/courses`, { headers: { Authorization: `Bearer ${token}` } }),
         axios.get(`${API}/education`),
         axios.get(`${API}/admin/users`, { headers: { Authorization: `Bearer ${token}` } }),
         axios.get(`${API}/admin/quiz-questions`, { headers: { Authorization: `Bearer ${token}` } }),
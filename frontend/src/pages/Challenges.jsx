@@ -28,8 +28,17 @@ const Challenges = () => {
 
   const fetchChallenges = async () => {
     try {
-      const response = await axios.get(`${API}/challenges`);
-      setChallenges(response.data);
+      // List cards only need summaries; full challenges are loaded on the detail page
+      const items = [];
+      let cursor = null;
+      do {
+        const response = await axios.get(`${API}/challenges`, {
+          params: { view: 'summary', limit: 200, ...(cursor ? { cursor } : {}) }
+        });
+        items.push(...response.data.items);
+        cursor = response.data.next_cursor;
+      } while (cursor);
+      setChallenges(items);
     } catch (error) {
       console.error('Failed to fetch challenges:', error);
     } finally {
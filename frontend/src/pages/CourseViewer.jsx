@@ -15,6 +15,7 @@ const CourseViewer = () => {
   const navigate = useNavigate();
   const { token } = React.useContext(AuthContext);
   const [course, setCourse] = useState(null);
+  const [modules, setModules] = useState({});
   const [progress, setProgress] = useState(null);
   const [currentModuleIndex, setCurrentModuleIndex] = useState(0);
   const [currentSlideIndex, setCurrentSlideIndex] = useState(0);
@@ -24,13 +25,23 @@ const CourseViewer = () => {
   const [loading, setLoading] = useState(true);
 
   useEffect(() => {
+    setModules({});
     fetchCourse();
     fetchProgress();
   }, [id]);
 
+  useEffect(() => {
+    if (!course) return;
+    // Load the current module's slides, and prefetch the next one
+    [currentModuleIndex, currentModuleIndex + 1].forEach((index) => {
+      const module = course.modules[index];
+      if (module) fetchModule(module.module_number);
+    });
+  }, [course, currentModuleIndex]);
+
   const fetchCourse = async () => {
     try {
-      const response = await axios.get(`${API}/courses/${id}`);
+      const response = await axios.get(`${API}/courses/${id}/outline`);
       setCourse(response.data);
       if (response.data.quiz_questions) {
         setQuizAnswers(new Array(response.data.quiz_questions.length).fill(null));
@@ -42,6 +53,16 @@ const CourseViewer = () => {
     }
   };
 
+  const fetchModule = async (moduleNumber) => {
+    if (modules[moduleNumber]) return;
+    try {
+      const response = await axios.get(`${API}/courses/${id}/modules/${moduleNumber}`);
+      setModules((loaded) => ({ ...loaded, [moduleNumber]: response.data }));
+    } catch (error) {
+      toast.error('Gagal load module');
+    }
+  };
+
   const fetchProgress = async () => {
     try {
       const response = await axios.get(`${API}/courses/${id}/progress`, {
@@ -291,7 +312,10 @@ const CourseViewer = () => {
   }
 
   const currentModule = course.modules[currentModuleIndex];
-  const currentSlide = currentModule.slides[currentSlideIndex];
+  const loadedModule = modules[currentModule.module_number];
+  const currentSlide = loadedModule
+    ? loadedModule.slides[currentSlideIndex]
+    : { ...currentModule.slides[currentSlideIndex], content: 'Loading...' };
   const totalSlides = course.modules.reduce((acc, m) => acc + m.slides.length, 0);
   const currentSlideGlobal = course.modules.slice(0, currentModuleIndex).reduce((acc, m) => acc + m.slides.length, 0) + currentSlideIndex + 1;
   const progressPercent = (currentSlideGlobal / totalSlides) * 100;
@@ -153,7 +153,7 @@ const Leaderboard = () => {
                         </Badge>
                       </td>
                       <td className="px-6 py-4 text-gray-300">
-                        {person.completed_challenges?.length || 0}
+                        {person.completed_count ?? person.completed_challenges?.length ?? 0}
                       </td>
                       <td className="px-6 py-4 text-right">
                         <span className="text-xl font-bold text-emerald-400">{person.points}</span>
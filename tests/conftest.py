@@ -0,0 +1,88 @@
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "tegalsec_test")
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+@pytest.fixture
+def memory_db(monkeypatch):
+    """Point server.db at a fresh in-memory MongoDB (mongomock-motor)"""
+    mongomock_motor = pytest.importorskip("mongomock_motor")
+    import server
+
+    client = mongomock_motor.AsyncMongoMockClient()
+    database = client["tegalsec_test"]
+    monkeypatch.setattr(server, "client", client)
+    monkeypatch.setattr(server, "db", database)
+    return database
+
+
+async def asgi_call(app, method: str, path: str, json_body=None, headers: dict = None):
+    """Minimal in-process ASGI client: returns (status, headers dict, body bytes)"""
+    path, _, query = path.partition("?")
+    body = json.dumps(json_body).encode() if json_body is not None else b""
+    raw_headers = [(b"host", b"test"), (b"content-type", b"application/json")]
+    raw_headers += [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()]
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": method,
+        "scheme": "http", "path": path, "raw_path": path.encode(), "query_string": query.encode(),
+        "root_path": "", "headers": raw_headers, "client": ("127.0.0.1", 0), "server": ("test", 80),
+    }
+    sent = False
+    response = {"status": None, "headers": {}, "body": []}
+
+    async def receive():
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await asyncio.sleep(3600)
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+            response["headers"] = {k.decode(): v.decode() for k, v in message.get("headers", [])}
+        elif message["type"] == "http.response.body":
+            response["body"].append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return response["status"], response["headers"], b"".join(response["body"])
+
+
+@pytest.fixture
+def fresh_content(monkeypatch, memory_db):
+    """Fresh challenge catalog, grading engine and body cache bound to memory_db"""
+    import server
+
+    monkeypatch.setattr(server, "challenge_catalog", server.ChallengeCatalog(ttl_seconds=60))
+    monkeypatch.setattr(server, "grading_engine", server.GradingEngine(ttl_seconds=60))
+    monkeypatch.setattr(server, "body_cache", server.BodyCache(ttl_seconds=60))
+    return server
+
+
+def make_challenge(challenge_id: str, correct=(0, 1), **overrides) -> dict:
+    challenge = {
+        "id": challenge_id, "title": f"Challenge {challenge_id}", "category": "phishing",
+        "difficulty": "beginner", "cialdini_principle": "authority", "description": "d", "scenario": "s",
+        "questions": [
+            {"question": f"q{i}", "options": ["a", "b", "c"], "correct_answer": answer, "explanation": "e"}
+            for i, answer in enumerate(correct)
+        ],
+        "points": 100, "tips": ["tip"], "time_limit_seconds": 300,
+        "created_at": "2024-01-01T00:00:00+00:00",
+    }
+    challenge.update(overrides)
+    return challenge
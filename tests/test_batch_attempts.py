@@ -0,0 +1,74 @@
+import json
+
+import pytest
+
+from tests.conftest import asgi_call, make_challenge, run
+
+USER = {"id": "u1", "username": "alice", "role": "user", "completed_challenges": []}
+
+
+@pytest.fixture
+def batch_server(monkeypatch, fresh_content, memory_db):
+    server = fresh_content
+    run(memory_db.challenges.insert_many([make_challenge("c1"), make_challenge("c2", correct=(2,))]))
+    run(memory_db.users.insert_one(dict(USER)))
+    monkeypatch.setitem(server.app.dependency_overrides, server.get_current_user, lambda: dict(USER))
+
+    awarded = []
+
+    async def fake_apply_user_score(user_filter, update):
+        # mongomock cannot run pipeline updates or $size projections
+        awarded.append(user_filter["completed_challenges"]["$nin"])
+        return {"id": USER["id"]}
+
+    async def no_badges(user_id, completions):
+        return []
+
+    monkeypatch.setattr(server, "apply_user_score", fake_apply_user_score)
+    monkeypatch.setattr(server.badge_engine, "challenges_completed", no_badges)
+    return server, awarded
+
+
+def post_batch(server, attempts):
+    status, _, body = run(asgi_call(server.app, "POST", "/api/challenges/attempts/batch", {"attempts": attempts}))
+    return status, json.loads(body)
+
+
+def test_batch_grades_stores_and_awards_in_one_update(batch_server, memory_db):
+    server, awarded = batch_server
+    status, body = post_batch(server, [
+        {"challenge_id": "c1", "answers": [0, 1], "time_taken_seconds": 200},
+        {"challenge_id": "c2", "answers": [0]},
+        {"challenge_id": "missing", "answers": [0]},
+        {"challenge_id": "c1", "answers": [0, 1]},
+    ])
+    assert status == 200
+    assert [r["status"] for r in body["results"]] == ["graded", "graded", "not_found", "already_completed"]
+    assert body["results"][0]["is_completed"] and body["results"][0]["points_awarded"]
+    assert not body["results"][1]["is_completed"]
+    assert awarded == [["c1"]]
+    assert run(memory_db.challenge_attempts.count_documents({})) == 2
+
+
+def test_batch_reports_invalid_items_without_failing_the_request(batch_server, memory_db):
+    server, _ = batch_server
+    status, body = post_batch(server, [
+        {"challenge_id": "c1", "answers": "0,1"},
+        {"challenge_id": "c2", "answers": [2], "time_taken_seconds": "fast"},
+        "c1",
+        {"challenge_id": "c2", "answers": [2]},
+    ])
+    assert status == 200
+    results = body["results"]
+    assert [r["status"] for r in results] == ["invalid", "invalid", "invalid", "graded"]
+    assert results[0]["challenge_id"] == "c1" and results[0]["errors"][0]["field"] == "answers"
+    assert results[1]["errors"][0]["field"] == "time_taken_seconds"
+    assert results[2]["challenge_id"] is None
+    assert results[3]["is_completed"]
+
+
+def test_batch_rejects_empty_or_oversized_payloads(batch_server):
+    server, _ = batch_server
+    assert post_batch(server, [])[0] == 400
+    too_many = [{"challenge_id": "c1", "answers": [0]}] * (server.BATCH_ATTEMPT_LIMIT + 1)
+    assert post_batch(server, too_many)[0] == 400
@@ -0,0 +1,14 @@
+import pytest
+
+from tests.conftest import run
+
+
+def test_serialization_report_runs_on_seeded_data(memory_db):
+    benchmark = pytest.importorskip("benchmark")
+
+    data = run(benchmark.seed(memory_db, users=5, challenges=3, courses=1, attempts=5))
+    assert all("_id" not in doc for doc in data["users"] + data["challenges"] + data["courses"])
+
+    report = benchmark.serialization_report(data, rounds=1)
+    assert set(report) == {"GET /challenges", "GET /courses", "GET /admin/users", "GET /leaderboard"}
+    assert all(row["stdlib_ms"] >= 0 and row["orjson_ms"] >= 0 for row in report.values())
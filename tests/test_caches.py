@@ -0,0 +1,102 @@
+import pytest
+
+from tests.conftest import make_challenge, run
+
+server = pytest.importorskip("server")
+
+
+def test_user_cache_skips_set_after_concurrent_invalidate():
+    cache = server.UserCache(max_size=10, ttl_seconds=60)
+
+    epoch = cache.epoch
+    cache.invalidate("u1")  # a write lands while the read is in flight
+    cache.set("u1", {"id": "u1", "points": 0}, epoch)
+    assert cache.get("u1") is None
+
+    cache.set("u1", {"id": "u1", "points": 5}, cache.epoch)
+    assert cache.get("u1") == {"id": "u1", "points": 5}
+
+
+def test_user_cache_hands_out_copies_and_evicts_lru():
+    cache = server.UserCache(max_size=2, ttl_seconds=60)
+    cache.set("u1", {"id": "u1", "completed_challenges": ["c1"]}, cache.epoch)
+    cache.get("u1")["completed_challenges"].append("c2")
+    assert cache.get("u1")["completed_challenges"] == ["c1"]
+
+    cache.set("u2", {"id": "u2"}, cache.epoch)
+    cache.get("u1")
+    cache.set("u3", {"id": "u3"}, cache.epoch)
+    assert cache.get("u2") is None
+    assert cache.get("u1") is not None and cache.get("u3") is not None
+
+
+def test_challenge_catalog_reloads_after_invalidate(memory_db):
+    catalog = server.ChallengeCatalog(ttl_seconds=60)
+    run(memory_db.challenges.insert_one(make_challenge("c1")))
+    assert [ch["id"] for ch in run(catalog.list())] == ["c1"]
+    version = catalog.version
+
+    # Within the TTL the snapshot is served as is
+    run(memory_db.challenges.insert_one(make_challenge("c2", created_at="2024-01-02T00:00:00+00:00")))
+    assert [ch["id"] for ch in run(catalog.list())] == ["c1"]
+
+    catalog.invalidate()
+    assert sorted(ch["id"] for ch in run(catalog.list())) == ["c1", "c2"]
+    assert catalog.version != version
+    assert run(catalog.get("c2"))["title"] == "Challenge c2"
+
+
+def test_challenge_catalog_ttl_reload_keeps_bodies_when_content_is_unchanged(memory_db):
+    catalog = server.ChallengeCatalog(ttl_seconds=0)
+    run(memory_db.challenges.insert_one(make_challenge("c1")))
+    etag, body = run(catalog.body({}))
+    assert run(catalog.body({})) == (etag, body)
+
+    run(memory_db.challenges.update_one({"id": "c1"}, {"$set": {"title": "Renamed"}}))
+    new_etag, new_body = run(catalog.body({}))
+    assert new_etag != etag and b"Renamed" in new_body.raw
+
+
+def test_challenge_catalog_skips_invalid_documents(memory_db):
+    catalog = server.ChallengeCatalog(ttl_seconds=60)
+    run(memory_db.challenges.insert_many([make_challenge("c1"), {"id": "broken", "title": "no questions"}]))
+    assert [ch["id"] for ch in run(catalog.list())] == ["c1"]
+
+
+def entry(user_id, points):
+    return {"id": user_id, "username": user_id, "full_name": user_id, "level": 1, "points": points, "completed_count": 0}
+
+
+def test_leaderboard_orders_by_points_then_id_with_shared_ranks():
+    board = server.LeaderboardService(refresh_seconds=0)
+    for user_id, points in [("carol", 50), ("alice", 100), ("bob", 50), ("dave", 10)]:
+        board.upsert(entry(user_id, points))
+
+    top = board.top(10)
+    assert [(e["id"], e["rank"]) for e in top] == [("alice", 1), ("bob", 2), ("carol", 2), ("dave", 4)]
+    assert board.top(2) == top[:2]
+
+
+def test_leaderboard_upsert_moves_user_and_remove_drops_them():
+    board = server.LeaderboardService(refresh_seconds=0)
+    for user_id, points in [("alice", 100), ("bob", 50), ("carol", 10)]:
+        board.upsert(entry(user_id, points))
+
+    board.upsert(entry("carol", 150))
+    assert [e["id"] for e in board.top(3)] == ["carol", "alice", "bob"]
+    assert board.size == 3
+
+    board.remove("alice")
+    assert [e["id"] for e in board.top(3)] == ["carol", "bob"]
+    assert board.around("alice", 1) is None
+
+
+def test_leaderboard_around_returns_window_and_rank():
+    board = server.LeaderboardService(refresh_seconds=0)
+    for index in range(10):
+        board.upsert(entry(f"u{index}", index * 10))
+
+    me = board.around("u5", 1)
+    assert me["rank"] == 5 and me["points"] == 50 and me["total_users"] == 10
+    assert [e["id"] for e in me["around"]] == ["u6", "u5", "u4"]
+    assert [e["id"] for e in board.around("u9", 2)["around"]] == ["u9", "u8", "u7"]
@@ -0,0 +1,32 @@
+import json
+
+import pytest
+
+from tests.conftest import asgi_call, run
+
+
+@pytest.fixture
+def admin(monkeypatch):
+    server = pytest.importorskip("server")
+    monkeypatch.setitem(server.app.dependency_overrides, server.require_admin, lambda: {"id": "admin", "role": "admin"})
+    return server
+
+
+def test_export_rejects_unknown_fields_before_streaming(admin, memory_db):
+    status, _, body = run(asgi_call(admin.app, "GET", "/api/admin/export/users?fields=username,$where"))
+    assert status == 422
+    assert "$where" in json.loads(body)["detail"]
+
+    status, _, _ = run(asgi_call(admin.app, "GET", "/api/admin/export/users?fields=password"))
+    assert status == 422
+
+
+def test_export_streams_selected_fields(admin, memory_db):
+    run(memory_db.users.insert_many([
+        {"id": "u1", "username": "alice", "password": "hash", "points": 10},
+        {"id": "u2", "username": "bob", "password": "hash", "points": 5},
+    ]))
+    status, _, body = run(asgi_call(admin.app, "GET", "/api/admin/export/users?fields=username,points,username"))
+    assert status == 200
+    rows = [json.loads(line) for line in body.decode().splitlines()]
+    assert rows == [{"username": "alice", "points": 10}, {"username": "bob", "points": 5}]
@@ -0,0 +1,120 @@
+import gzip
+import json
+
+import pytest
+
+from tests.conftest import asgi_call, make_challenge, run
+
+server = pytest.importorskip("server")
+compression = pytest.importorskip("compression")
+
+
+@pytest.fixture
+def catalog(fresh_content, memory_db):
+    # Enough challenges that the list body is above the compression threshold
+    run(memory_db.challenges.insert_many([
+        make_challenge(f"c{i}", created_at=f"2024-01-{i + 1:02d}T00:00:00+00:00") for i in range(10)
+    ]))
+    return fresh_content
+
+
+def get(app, path, **headers):
+    return run(asgi_call(app, "GET", path, headers=headers))
+
+
+def test_challenges_etag_round_trip_returns_304(catalog):
+    status, headers, body = get(catalog.app, "/api/challenges")
+    assert status == 200 and len(json.loads(body)) == 10
+    etag = headers["etag"]
+    assert headers["cache-control"] == "no-cache"
+
+    status, headers, body = get(catalog.app, "/api/challenges", **{"If-None-Match": etag})
+    assert status == 304 and body == b""
+    assert headers["etag"] == etag
+
+    status, _, _ = get(catalog.app, "/api/challenges", **{"If-None-Match": '"stale"'})
+    assert status == 200
+
+
+def test_compressed_variant_has_its_own_etag_and_matches_base(catalog):
+    _, plain_headers, plain = get(catalog.app, "/api/challenges")
+    status, headers, body = get(catalog.app, "/api/challenges", **{"Accept-Encoding": "gzip"})
+    assert status == 200 and headers["content-encoding"] == "gzip"
+    assert gzip.decompress(body) == plain
+    assert headers["etag"] != plain_headers["etag"]
+
+    # Either validator revalidates the gzip representation
+    for etag in (headers["etag"], plain_headers["etag"]):
+        status, _, _ = get(catalog.app, "/api/challenges", **{"Accept-Encoding": "gzip", "If-None-Match": etag})
+        assert status == 304
+
+
+def test_challenge_summary_pages_have_distinct_etags(catalog):
+    _, headers, body = get(catalog.app, "/api/challenges?view=summary&limit=4")
+    page = json.loads(body)
+    assert [item["id"] for item in page["items"]] == ["c0", "c1", "c2", "c3"]
+    _, next_headers, next_body = get(catalog.app, f"/api/challenges?view=summary&limit=4&cursor={page['next_cursor']}")
+    assert [item["id"] for item in json.loads(next_body)["items"]] == ["c4", "c5", "c6", "c7"]
+    assert next_headers["etag"] != headers["etag"]
+
+
+def test_negotiate_encoding_prefers_brotli_and_honours_q_zero():
+    supported = ("br", "gzip")
+    assert compression.negotiate_encoding("gzip, deflate, br", supported) == "br"
+    assert compression.negotiate_encoding("br;q=0, gzip", supported) == "gzip"
+    assert compression.negotiate_encoding("*;q=0", supported) is None
+    assert compression.negotiate_encoding("", supported) is None
+    assert compression.negotiate_encoding("identity", supported) is None
+
+
+def test_compressed_body_respects_minimum_size_and_caches_variants():
+    raw = b'{"a": "' + b"x" * 2000 + b'"}'
+    body = compression.CompressedBody(raw, minimum_size=4096)
+    assert body.encoded("gzip") == (raw, None)
+
+    body = compression.CompressedBody(raw, minimum_size=100)
+    data, encoding = body.encoded("gzip")
+    assert encoding == "gzip" and gzip.decompress(data) == raw
+    assert body.encoded("gzip")[0] is data
+    assert body.encoded(None) == (raw, None)
+
+
+async def call_middleware(inner, accept_encoding, minimum_size=100):
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    scope = {"type": "http", "headers": [(b"accept-encoding", accept_encoding.encode())]}
+    await compression.CompressionMiddleware(inner, minimum_size=minimum_size)(scope, receive, send)
+    start = messages[0]
+    return start["status"], dict(start["headers"]), b"".join(m.get("body", b"") for m in messages[1:])
+
+
+def json_app(body: bytes, chunks: int = 1):
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200,
+                    "headers": [(b"content-type", b"application/json")]})
+        for index in range(chunks):
+            await send({"type": "http.response.body", "body": body, "more_body": index < chunks - 1})
+    return app
+
+
+def test_middleware_compresses_large_bodies_only():
+    large = b"[" + b"1," * 500 + b"1]"
+    _, headers, body = run(call_middleware(json_app(large), "gzip"))
+    assert headers[b"content-encoding"] == b"gzip" and gzip.decompress(body) == large
+    assert int(headers[b"content-length"]) == len(body)
+
+    _, headers, body = run(call_middleware(json_app(b"[1]"), "gzip"))
+    assert b"content-encoding" not in headers and body == b"[1]"
+
+
+def test_middleware_streams_gzip_for_chunked_responses():
+    chunk = b'{"row": 1}\n' * 20
+    _, headers, body = run(call_middleware(json_app(chunk, chunks=3), "br, gzip"))
+    assert headers[b"content-encoding"] == b"gzip" and b"content-length" not in headers
+    assert gzip.decompress(body) == chunk * 3
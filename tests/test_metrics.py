@@ -0,0 +1,34 @@
+import pytest
+
+from tests.conftest import asgi_call, run
+
+
+def test_metrics_requires_loopback_or_token(monkeypatch):
+    server = pytest.importorskip("server")
+
+    status, _, _ = run(asgi_call(server.app, "GET", "/metrics"))
+    assert status == 200
+
+    monkeypatch.setattr(server, "METRICS_TOKEN", "s3cret")
+    status, _, _ = run(asgi_call(server.app, "GET", "/metrics"))
+    assert status == 403
+    status, _, body = run(asgi_call(server.app, "GET", "/metrics", headers={"Authorization": "Bearer s3cret"}))
+    assert status == 200 and b"# TYPE" in body
+
+
+def test_getmore_is_labelled_by_collection():
+    metrics = pytest.importorskip("metrics")
+    recorder = metrics.MongoCommandMetrics()
+
+    class Event:
+        command_name = "getMore"
+        command = {"getMore": 12345, "collection": "challenges"}
+        request_id = 1
+        operation_id = 1
+        connection_id = ("localhost", 27017)
+
+    Event.reply = {"cursor": {"nextBatch": [{}, {}]}}
+    Event.duration_micros = 1500
+    recorder.started(Event())
+    recorder.succeeded(Event())
+    assert recorder.documents == {("challenges", "getMore"): 2}
@@ -0,0 +1,128 @@
+import asyncio
+
+import pytest
+
+from tests.conftest import run
+
+server = pytest.importorskip("server")
+
+
+def stored(memory_db, user_id="u1", course_id="c1"):
+    return run(memory_db.course_progress.find_one({"user_id": user_id, "course_id": course_id}, {"_id": 0}))
+
+
+def test_new_modules_write_through_and_slides_are_coalesced(memory_db):
+    buffer = server.ProgressWriteBuffer(flush_interval=60, max_pending=10)
+
+    async def scenario():
+        await buffer.add("u1", "c1", 1, 0)
+        assert buffer.pending == 0  # first time module 1 is seen: written immediately
+        for slide in (1, 2, 3):
+            await buffer.add("u1", "c1", 1, slide)
+        assert buffer.pending == 1
+        assert buffer.overlay("u1", "c1", {"completed_modules": [1], "current_slide": 0})["current_slide"] == 3
+
+    run(scenario())
+    progress = stored(memory_db)
+    assert progress["completed_modules"] == [1] and progress["current_slide"] == 0
+
+    run(buffer.flush())
+    assert buffer.pending == 0
+    assert stored(memory_db)["current_slide"] == 3
+    assert buffer.stats()["writes"] == 2 and buffer.stats()["events"] == 4
+
+
+def test_full_buffer_flushes_inline(memory_db):
+    buffer = server.ProgressWriteBuffer(flush_interval=60, max_pending=3)
+
+    async def scenario():
+        for user in ("u1", "u2", "u3"):
+            await buffer.add(user, "c1", None, 4)
+
+    run(scenario())
+    assert buffer.pending == 0
+    assert run(memory_db.course_progress.count_documents({"current_slide": 4})) == 3
+
+
+def test_stop_writes_remaining_events(memory_db):
+    buffer = server.ProgressWriteBuffer(flush_interval=60, max_pending=100)
+
+    async def scenario():
+        buffer.start()
+        await buffer.add("u1", "c1", None, 7)
+        await buffer.add("u2", "c1", None, 2)
+        await buffer.stop()
+
+    run(scenario())
+    assert buffer.pending == 0 and buffer._task is None
+    assert stored(memory_db)["current_slide"] == 7
+    assert stored(memory_db, "u2")["current_slide"] == 2
+
+
+def test_flush_loop_writes_periodically(memory_db):
+    buffer = server.ProgressWriteBuffer(flush_interval=0.01, max_pending=100)
+
+    async def scenario():
+        buffer.start()
+        await buffer.add("u1", "c1", None, 5)
+        for _ in range(100):
+            if not buffer.pending:
+                break
+            await asyncio.sleep(0.01)
+        await buffer.stop()
+
+    run(scenario())
+    assert stored(memory_db)["current_slide"] == 5
+
+
+def test_failed_flush_requeues_and_backs_off(monkeypatch, memory_db):
+    buffer = server.ProgressWriteBuffer(flush_interval=1, max_pending=2, max_backoff=8)
+    failing = True
+    real_write = buffer._write
+
+    async def flaky_write(batch):
+        if failing:
+            raise ConnectionError("mongo down")
+        return await real_write(batch)
+
+    monkeypatch.setattr(buffer, "_write", flaky_write)
+
+    async def scenario():
+        nonlocal failing
+        await buffer.add("u1", "c1", None, 1)
+        await buffer.add("u2", "c1", None, 1)  # reaches max_pending: inline flush fails
+        assert buffer.pending == 2 and buffer.backing_off
+        assert buffer.stats()["backoff_seconds"] == 1
+
+        # While backing off, known keys still coalesce but new keys are shed
+        await buffer.add("u1", "c1", None, 2)
+        with pytest.raises(server.ProgressBufferFull):
+            await buffer.add("u3", "c1", None, 1)
+        assert buffer.stats()["rejected"] == 1
+
+        await buffer.flush()
+        assert buffer.stats()["backoff_seconds"] == 2
+
+        failing = False
+        await buffer.flush()
+        assert buffer.pending == 0 and not buffer.backing_off
+
+    run(scenario())
+    assert stored(memory_db)["current_slide"] == 2
+
+
+def test_failed_write_through_stays_buffered(monkeypatch, memory_db):
+    buffer = server.ProgressWriteBuffer(flush_interval=60, max_pending=10)
+
+    async def down(*args):
+        raise ConnectionError("mongo down")
+
+    real_upsert = server.upsert_course_progress
+    monkeypatch.setattr(server, "upsert_course_progress", down)
+    run(buffer.add("u1", "c1", 2, 0))
+    assert buffer.pending == 1 and buffer.backing_off
+    assert buffer.overlay("u1", "c1", None)["completed_modules"] == [2]
+
+    monkeypatch.setattr(server, "upsert_course_progress", real_upsert)
+    run(buffer.flush())
+    assert stored(memory_db)["completed_modules"] == [2]
@@ -0,0 +1,62 @@
+import pytest
+
+from tests.conftest import run
+
+server = pytest.importorskip("server")
+
+LIMIT, WINDOW = 5, 300
+
+
+def hits(backend, key, now, count):
+    return [run(backend.hit(key, LIMIT, WINDOW, now)) for _ in range(count)]
+
+
+def test_in_memory_limiter_blocks_after_limit_with_retry_after():
+    backend = server.InMemoryRateLimitBackend()
+    assert all(allowed for allowed, _ in hits(backend, "login:alice", 1000, LIMIT))
+
+    allowed, retry_after = run(backend.hit("login:alice", LIMIT, WINDOW, 1000))
+    assert not allowed
+    assert retry_after == pytest.approx(200)  # rest of this window; it then decays away entirely
+
+    # Other keys are independent
+    assert run(backend.hit("login:bob", LIMIT, WINDOW, 1000))[0]
+
+
+def test_in_memory_limiter_slides_previous_window():
+    backend = server.InMemoryRateLimitBackend()
+    hits(backend, "k", 1000, LIMIT)
+
+    # Start of the next window: the previous window still counts in full
+    assert not run(backend.hit("k", LIMIT, WINDOW, 1200))[0]
+    # Halfway through it only half of it does
+    assert [allowed for allowed, _ in hits(backend, "k", 1350, 4)] == [True, True, True, False]
+    # Two windows later the old hits are forgotten
+    assert all(allowed for allowed, _ in hits(backend, "k", 1800, LIMIT))
+
+
+def test_in_memory_limiter_evicts_least_recently_used_keys():
+    backend = server.InMemoryRateLimitBackend(max_keys=2)
+    hits(backend, "a", 1000, LIMIT)
+    hits(backend, "b", 1000, 1)
+    hits(backend, "c", 1000, 1)
+    # "a" was evicted, so its count starts over
+    assert run(backend.hit("a", LIMIT, WINDOW, 1000))[0]
+
+
+def test_check_rate_limit_raises_429_with_retry_after(monkeypatch):
+    monkeypatch.setattr(server, "rate_limiter", server.InMemoryRateLimitBackend())
+    for _ in range(LIMIT):
+        run(server.check_rate_limit("login:carol", LIMIT, WINDOW))
+
+    with pytest.raises(server.HTTPException) as exc_info:
+        run(server.check_rate_limit("login:carol", LIMIT, WINDOW))
+    assert exc_info.value.status_code == 429
+    assert int(exc_info.value.headers["Retry-After"]) > 0
+
+
+def test_sliding_window_retry_after_matches_estimate():
+    # After waiting retry_after, the estimate drops just under the limit
+    previous, current, elapsed = 8, 2, 30
+    wait = server.sliding_window_retry_after(previous, current, elapsed, WINDOW, LIMIT)
+    assert server.sliding_window_estimate(previous, current, elapsed + wait, WINDOW) == pytest.approx(LIMIT)